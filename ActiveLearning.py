@@ -0,0 +1,199 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+ActiveLearning.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Active learning loop to select the FEM samples where the surrogate model is least certain (query-by-committee).
+# Every iteration:
+    # 1- trains an ensemble of DNNs (the committee) with the current training database, using "NeuralNetwork.createSequentialModel"
+    # 2- computes the R2 of the ensemble on the validation database and stops if the target R2 is reached
+    # 3- scores a large pool of candidates (Sobol design) by the disagreement of the committee (variance of the predictions)
+    # 4- runs the FEM analysis of the top-k candidates in the parallel workers and adds the discretized curves to the training database
+
+import os
+import csv
+import numpy as np
+import NeuralNetwork as NeuralNet
+import DataUtils as dataUtils
+import DesignOfExperiments as doe
+import ParallelDataBase as parallelDB
+import CurveRepresentation as curveRep
+
+# data number of inputs
+nInputs = 11
+
+
+# a committee of trained DNNs that predicts as a single model (the mean of the members)
+class SurrogateEnsemble():
+
+    def __init__(self, models):
+        self.models = models
+
+    # predictions of all the members, array of shape (nModels, n, nOutputs)
+    # normInput -> normalized inputs (as for the "predict" function of a keras model)
+    def predictAll(self, normInput, batchSize=4096):
+        return np.stack([model.predict(normInput, batch_size=batchSize, verbose=0) for model in self.models])
+
+    # mean prediction of the committee (same interface as a keras model so that it can be used with "DataUtils")
+    def predict(self, normInput, batch_size=4096, verbose=0):
+        return np.mean(self.predictAll(normInput, batch_size), axis=0)
+
+    # save every member of the committee (the path must contain "{}" that is replaced by the member index)
+    def save(self, pathPattern):
+        for k in range(len(self.models)):
+            self.models[k].save(pathPattern.format(k))
+
+
+# train a committee of nModels DNNs with different random seeds
+def trainEnsemble(normInput, outputData, nModels=5, seed=50, layerSizes=[200,200,200], nEpochs=200, nBatchSize=10,
+                  validationSplit=0.10, earlyStop=True, earlyStopPatience=5):
+    import tensorflow as tf
+    models = []
+    for k in range(nModels):
+        tf.random.set_seed(seed+k)
+        nnet, history = NeuralNet.createSequentialModel(normInput,
+                                                        outputData,
+                                                        layerSizes=layerSizes,
+                                                        nEpochs=nEpochs,
+                                                        nBatchSize=nBatchSize,
+                                                        validationSplit=validationSplit,
+                                                        earlyStop=earlyStop,
+                                                        earlyStopPatience=earlyStopPatience)
+        models.append(nnet)
+    return SurrogateEnsemble(models)
+
+
+# uncertainty score of every candidate: variance of the committee predictions, summed over the outputs
+# (each output is scaled by its standard deviation in the training data, so that all the stations have the same weight)
+def scoreCandidates(ensemble, normalizer, candidates, outputScale):
+    predictions = ensemble.predictAll(normalizer.normalizeInputs(candidates))
+    variance = np.var(predictions, axis=0)
+    return np.sum(variance/(outputScale**2), axis=1)
+
+
+# select the k candidates with the highest score, skipping the candidates that are too close (in the unit hypercube) to an already selected one
+# this avoids spending several FEM analyses in the same uncertain region
+def selectTopCandidates(candidates, scores, k, minSeparation=0.05):
+    order = np.argsort(scores)[::-1]
+    unitCandidates = doe.inputsToUnit(candidates)
+    selected = []
+    for index in order:
+        if len(selected) == k:
+            break
+        if len(selected) > 0:
+            distance = np.sqrt(np.sum((unitCandidates[selected]-unitCandidates[index])**2, axis=1))
+            if np.min(distance) < minSeparation:
+                continue
+        selected.append(index)
+    return candidates[selected]
+
+
+# run the FEM analysis of the selected input vectors in parallel
+# the complete curves are appended to the raw results file (csv file like "database_complete.csv", or binary curve store if the path ends with ".curves")
+# and the discretized curves are appended to the training database (one row per data point)
+# representation -> stations where the curves are discretized (see "CurveRepresentation.py"), the original 6 outputs by default
+# returns the number of new training rows
+def runFEMSamples(inputVectors, pathToRawFile, pathToTrainingFile, nWorkers=None, options=None, representation=None):
+
+    if options is None:
+        options = {}
+    if representation is None:
+        representation = curveRep.getDefaultRepresentation()
+
+    jobs = [(i, list(params), options) for i, params in enumerate(inputVectors)]
+    counter = {"added": 0}
+
+    rawDataBase = parallelDB.openDataBase(pathToRawFile)
+    with open(pathToTrainingFile, 'a', newline='') as fTrain:
+        writer = csv.writer(fTrain)
+
+        def writeResult(job, x, y, wallTime, error):
+            index, params, options = job
+            targets = representation.getCurveTargets(x, y)
+            if targets is None:
+                print("SAMPLE", index, "did not converge, discarded")
+                return None
+            rawDataBase.append(params, x, y)
+            writer.writerow([*params, *targets])
+            fTrain.flush()
+            counter["added"] = counter["added"] + 1
+            print("SAMPLE", index, "added to the training database (", round(wallTime,1), "s )")
+            return None
+
+        try:
+            parallelDB.runJobs(jobs, writeResult, nWorkers)
+        finally:
+            rawDataBase.close()
+
+    return counter["added"]
+
+
+# run the active learning loop
+# pathToTrainingFile -> initial training database (one row per data point), it is copied to pathToActiveTrainingFile the first time
+# pathToValidationFile -> database used to compute the R2 of the ensemble
+# pathToRawFile -> file where the complete curves of the new FEM analyses are stored
+# targetR2 -> stop when the average R2 of the ensemble on the validation database reaches this value
+# maxIterations, samplesPerIteration -> budget of FEM analyses
+# representation -> stations of the outputs, by default the ones stored next to the training database (see "CurveRepresentation.py")
+# returns the last trained ensemble and the history of (number of training rows, R2)
+def runActiveLearning(normalizer, pathToTrainingFile, pathToValidationFile, pathToActiveTrainingFile, pathToRawFile,
+                      targetR2=0.99, maxIterations=10, samplesPerIteration=32, nCandidates=2**17, nModels=5,
+                      nWorkers=None, options=None, seed=50, trainingOptions=None, representation=None):
+
+    if trainingOptions is None:
+        trainingOptions = {}
+    if representation is None:
+        representation = curveRep.getRepresentationForFile(pathToTrainingFile)
+    nOutputs = representation.nOutputs
+
+    # the training database of the active learning starts as a copy of the given training database
+    if not os.path.exists(pathToActiveTrainingFile):
+        data = dataUtils.readDataFile(pathToTrainingFile)
+        np.savetxt(pathToActiveTrainingFile, data, delimiter=',')
+        representation.save(pathToActiveTrainingFile)
+
+    dataValidation = dataUtils.readDataFile(pathToValidationFile)
+
+    history = []
+    ensemble = None
+    for iteration in range(maxIterations+1):
+
+        # 1- train the committee with the current training database
+        data = dataUtils.readDataFile(pathToActiveTrainingFile)
+        inputData, outputData = dataUtils.splitInputsOutputs(data, nInputs, nOutputs)
+        normInput = normalizer.normalizeInputs(inputData)
+        ensemble = trainEnsemble(normInput, outputData, nModels, seed+iteration*nModels, **trainingOptions)
+
+        # 2- accuracy of the committee
+        mse, r, r2 = dataUtils.getSimpleMetricsAverages(ensemble, normalizer, dataValidation, nInputs, nOutputs)
+        history.append((len(data), r2))
+        print("ITERATION", iteration, "  training rows =", len(data), "  R2 =", r2)
+
+        if r2 >= targetR2 or iteration == maxIterations:
+            break
+
+        # 3- score the pool of candidates and select the most uncertain ones
+        candidates = doe.generateDesign(nCandidates, "sobol", seed=seed+iteration)
+        scores = scoreCandidates(ensemble, normalizer, candidates, np.std(outputData, axis=0))
+        selected = selectTopCandidates(candidates, scores, samplesPerIteration)
+
+        # 4- run the FEM analysis of the selected samples and add them to the training database
+        runFEMSamples(selected, pathToRawFile, pathToActiveTrainingFile, nWorkers, options, representation)
+
+    return ensemble, history
@@ -0,0 +1,105 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+AnalysisControl.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Control of a FEM analysis that runs in a worker process of the analysis service (see "AnalysisService.py" and "AppGUI.py"):
+    # CancelToken -> cooperative cancellation, "ShearWallParametrizedAsFunction.run" checks it between the steps of the analysis
+    # and raises AnalysisCancelled (the worker stops cleanly at the end of its current step)
+    # ProgressReporter -> queue with the progress and the result of the analysis, the worker only puts messages in the queue
+    # and the GUI reads them from the main thread (root.after), so the tk widgets are only used by the GUI
+# The reporter has the same "step" method as a ttk progress bar, so it can be given to "run" as the progressBar.
+# By default the token uses a threading Event and the reporter a queue.Queue (analyses in the same process),
+# the analysis service gives them a multiprocessing Event and a multiprocessing Queue shared with the worker process.
+
+import queue
+import threading
+
+
+class AnalysisCancelled(Exception):
+    pass
+
+
+class CancelToken():
+
+    # event -> threading.Event (default) or multiprocessing Event shared with a worker process
+    def __init__(self, event=None):
+        self.event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    def isCancelled(self):
+        return self.event.is_set()
+
+    # raise AnalysisCancelled if the analysis was cancelled
+    def check(self):
+        if self.event.is_set():
+            raise AnalysisCancelled("the analysis was cancelled")
+
+
+class ProgressReporter():
+
+    # messages of the queue: ("step", amount), ("done", result), ("error", message), ("cancelled", None)
+    # messages -> queue.Queue (default) or multiprocessing Queue shared with a worker process
+    def __init__(self, messages=None):
+        self.queue = messages if messages is not None else queue.Queue()
+
+    # advance the progress (same as ttk.Progressbar.step)
+    def step(self, amount=1.0):
+        self.queue.put(("step", amount))
+
+    def finish(self, result):
+        self.queue.put(("done", result))
+
+    # the error is sent as a message (the exceptions of OpenSees can not always be sent to another process)
+    def fail(self, error):
+        self.queue.put(("error", str(error)))
+
+    def cancelled(self):
+        self.queue.put(("cancelled", None))
+
+    # messages since the last call (never blocks), the steps are added into a single message
+    def poll(self):
+        messages = []
+        progress = 0.0
+        while True:
+            try:
+                kind, value = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "step":
+                progress = progress + value
+            else:
+                messages.append((kind, value))
+        if progress > 0:
+            messages.insert(0, ("step", progress))
+        return messages
+
+
+# run target(reporter, cancelToken), the result (or the error, or the cancellation) is put in the queue of the reporter
+def runTarget(target, reporter, cancelToken):
+    try:
+        result = target(reporter, cancelToken)
+    except AnalysisCancelled:
+        reporter.cancelled()
+    except Exception as e:
+        reporter.fail(e)
+    else:
+        reporter.finish(result)
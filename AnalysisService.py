@@ -0,0 +1,299 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+AnalysisService.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Local service that runs the FEM analyses of the GUI (see "AppGUI.py") in worker processes, with a queue of jobs.
+# Every job runs in its own process (spawn), so a crash or a hang of OpenSees never takes down the GUI, and several jobs run at the same time
+# (for example, the current design and some randomized neighbours, see "getNeighbourVectors"):
+    # submit -> the job is added to the queue, it starts when one of the "nWorkers" slots is free
+    # poll -> called periodically by the GUI (root.after), reads the messages of the workers, starts the queued jobs and returns the jobs that changed
+    # cancel -> a queued job is removed, a running job stops at the end of its current step ("AnalysisControl.CancelToken"),
+    # and its process is terminated if it does not stop within "killTimeout" seconds
+# The workers report the progress and the result through the queue of an "AnalysisControl.ProgressReporter".
+# The result of a job is the pushover curve (arrays x and y), the fields of the analysis are saved by the worker to a ".npz" file in a unique workspace
+# and they are only loaded when they are needed ("getResults" returns a "RunResults.RunResults" handle, see "RunResults.loadRunResults").
+# The workspace of a job is removed when the job fails or is cancelled, when the job is removed ("removeJob") and when the service is shut down,
+# the workspace of a finished job is kept until then or until "releaseJob" is called (the GUI releases the jobs whose fields are not shown).
+# The analysis options are the same as in "ParallelDataBase.py" (meshHorizontal, meshBE, meshVertical, targetDisp, increment, algorithm, ...).
+
+import os
+import time
+import random as rnd
+import multiprocessing as mp
+import InputVariableBounds as inputBounds
+import AnalysisControl as analysisControl
+import RunResults as runResults
+
+
+# run the analysis of a job (this function is executed inside the worker process)
+# returns the x and y values of the pushover curve and the wall time in seconds, the fields are saved to "pathToFields"
+def analyzeJob(params, options, pathToFields, reporter, cancelToken):
+
+    # the FEM module is imported here so that only the worker processes load OpenSeesPy
+    import ShearWallParametrizedAsFunction as shearWallAsFunc
+    import ParallelDataBase as parallelDataBase
+
+    startTime = time.time()
+    results = runResults.RunResults()
+    [x,y],ops = shearWallAsFunc.run(*params,
+                                    meshH=options.get("meshHorizontal",8),
+                                    meshBE=options.get("meshBE",2),
+                                    meshV=options.get("meshVertical",10),
+                                    targetDisp=options.get("targetDisp",0.02),
+                                    increment=options.get("increment",0.0001),
+                                    performPushOver=True,
+                                    plotValidation=False,
+                                    plotDeformedGravity=False,
+                                    plotPushOverResults=False,
+                                    progressBar=reporter,
+                                    printProgression=False,
+                                    algorithm=options.get("algorithm",'NewtonLineSearch'),
+                                    maxUnconvergedSteps=options.get("maxUnconvergedSteps",10),
+                                    adaptive=options.get("adaptive",False),
+                                    recoverSteps=options.get("recoverSteps",False),
+                                    abortRules=parallelDataBase.getAbortRules(options),
+                                    results=results,
+                                    cancelToken=cancelToken)
+    results.save(pathToFields)
+    return [float(v) for v in x], [float(v) for v in y], time.time() - startTime
+
+
+# entry point of the worker process of a job
+def runJob(params, options, pathToFields, messages, cancelEvent):
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    reporter = analysisControl.ProgressReporter(messages)
+    cancelToken = analysisControl.CancelToken(cancelEvent)
+    analysisControl.runTarget(lambda r, t: analyzeJob(params, options, pathToFields, r, t), reporter, cancelToken)
+
+
+# bounds of the variable "index" given the previous values of the vector (same rules as "ParallelDataBase.getRandomInputVector"):
+    # wall length >= 6 times the thickness
+    # web reinforcement ratios <= 0.6 times the ratios of the boundary elements
+def getDependentBounds(index, vector):
+    minValue = inputBounds.minValues[index]
+    maxValue = inputBounds.maxValues[index]
+    if index == 1:
+        minValue = max(minValue, 6*vector[0])
+    elif index == 5:
+        maxValue = min(maxValue, 0.6*vector[3])
+    elif index == 6:
+        maxValue = min(maxValue, 0.6*vector[4])
+    return minValue, maxValue
+
+
+# random input vectors around a design (each value moves up to "spread" times the range of the variable, inside the bounds)
+# rng -> an instance of random.Random (use a seeded instance to obtain reproducible vectors)
+def getNeighbourVectors(params, n, spread=0.1, rng=rnd):
+    vectors = []
+    for i in range(n):
+        vector = []
+        for index, value in enumerate(params):
+            delta = spread*(inputBounds.maxValues[index]-inputBounds.minValues[index])
+            minValue, maxValue = getDependentBounds(index, vector)
+            vector.append(min(max(value + rng.uniform(-delta, delta), minValue), maxValue))
+        vectors.append(vector)
+    return vectors
+
+
+class AnalysisJob():
+
+    # status -> "queued", "running", "done", "failed" or "cancelled"
+    # progress -> fraction of the target displacement that was analyzed (0 to 1)
+    # x, y, wallTime -> pushover curve and wall time of a finished job
+    # results -> "RunResults.RunResults" handle with the fields of a finished job (None until "AnalysisService.getResults" is called)
+    # workspace -> "RunResults.RunResults" handle of the folder where the worker saves the fields
+    # removed -> the job was removed from the service (its workspace is removed when it stops)
+    def __init__(self, jobId, params, options, label):
+        self.jobId = jobId
+        self.params = list(params)
+        self.options = options
+        self.label = label
+        self.status = "queued"
+        self.progress = 0.0
+        self.x = None
+        self.y = None
+        self.wallTime = None
+        self.results = None
+        self.error = None
+
+        # the progress bar of "run" advances by one unit every "increment" of displacement
+        self.nUnits = options.get("targetDisp",0.02)/options.get("increment",0.0001)
+        self.units = 0.0
+
+        self.process = None
+        self.reporter = None
+        self.cancelEvent = None
+        self.cancelTime = None
+        self.workspace = None
+        self.pathToFields = None
+        self.removed = False
+
+    def isActive(self):
+        return self.status == "queued" or self.status == "running"
+
+
+class AnalysisService():
+
+    # nWorkers -> maximum number of jobs that run at the same time (by default, one per core except one for the GUI)
+    # baseDir -> folder where the workspaces of the jobs are created
+    # killTimeout -> seconds that a cancelled job has to stop before its process is terminated
+    def __init__(self, nWorkers=None, baseDir=runResults.defaultBaseDir, killTimeout=10):
+        if nWorkers is None:
+            nWorkers = max(1, (os.cpu_count() or 2)-1)
+        self.nWorkers = nWorkers
+        self.baseDir = baseDir
+        self.killTimeout = killTimeout
+        self.context = mp.get_context("spawn")
+        self.jobs = []
+        self.queued = []
+        self.running = []
+        self.changed = []
+        self.nextId = 1
+
+    # add a job to the queue
+    # params -> the 11 input values, options -> analysis options (see "analyzeJob"), label -> name of the job in the GUI
+    def submit(self, params, options=None, label=None):
+        if options is None:
+            options = {}
+        if label is None:
+            label = "Job "+str(self.nextId)
+        job = AnalysisJob(self.nextId, params, options, label)
+        self.nextId = self.nextId+1
+        self.jobs.append(job)
+        self.queued.append(job)
+        self.changed.append(job)
+        return job
+
+    def start(self, job):
+        job.workspace = runResults.RunResults(inMemory=False, baseDir=self.baseDir)
+        job.pathToFields = job.workspace.getPath("fields.npz")
+        job.reporter = analysisControl.ProgressReporter(self.context.Queue())
+        job.cancelEvent = self.context.Event()
+        job.process = self.context.Process(target=runJob, args=(job.params, job.options, job.pathToFields, job.reporter.queue, job.cancelEvent), daemon=True)
+        job.process.start()
+        job.status = "running"
+        self.running.append(job)
+
+    def cancel(self, job):
+        if job.status == "queued":
+            self.queued.remove(job)
+            job.status = "cancelled"
+            self.changed.append(job)
+        elif job.status == "running" and job.cancelTime is None:
+            job.cancelEvent.set()
+            job.cancelTime = time.time()
+
+    def cancelAll(self):
+        for job in list(self.queued)+list(self.running):
+            self.cancel(job)
+
+    # fields of a finished job, they are loaded from its workspace the first time (None if the job did not finish or was released)
+    def getResults(self, job):
+        if job.results is None and job.status == "done" and job.workspace is not None:
+            job.results = runResults.loadRunResults(job.pathToFields)
+        return job.results
+
+    # remove the workspace of a job (the fields that were already loaded stay in memory in its results handle)
+    def releaseJob(self, job):
+        for handle in (job.workspace, job.results):
+            if handle is not None:
+                handle.cleanup()
+        job.workspace = None
+
+    # remove a job from the service, a running job is cancelled and its workspace is removed when it stops
+    def removeJob(self, job):
+        job.removed = True
+        if job.isActive():
+            self.cancel(job)
+        if job in self.jobs:
+            self.jobs.remove(job)
+        if job.status != "running":
+            self.releaseJob(job)
+
+    # read the messages of a running job, returns True if the job changed
+    def readMessages(self, job):
+        changed = False
+        for kind, value in job.reporter.poll():
+            changed = True
+            if kind == "step":
+                job.units = job.units + value
+                job.progress = min(job.units/job.nUnits, 1.0)
+            elif kind == "done":
+                job.x, job.y, job.wallTime = value
+                job.progress = 1.0
+                job.status = "done"
+            elif kind == "error":
+                job.error = value
+                job.status = "failed"
+            elif kind == "cancelled":
+                job.status = "cancelled"
+        return changed
+
+    # read the messages of the workers, detect the crashed or hung jobs and start the queued jobs
+    # returns the jobs that changed since the last call
+    def poll(self):
+        changed = self.changed
+        self.changed = []
+
+        for job in list(self.running):
+            if self.readMessages(job):
+                changed.append(job)
+
+            if job.status == "running" and not job.process.is_alive():
+                # the last messages can arrive after the process exits
+                self.readMessages(job)
+                if job.status == "running":
+                    job.error = "the worker process exited with code "+str(job.process.exitcode)
+                    job.status = "failed"
+                changed.append(job)
+
+            elif job.status == "running" and job.cancelTime is not None and time.time()-job.cancelTime > self.killTimeout:
+                job.process.terminate()
+                job.status = "cancelled"
+                changed.append(job)
+
+            if job.status != "running":
+                job.process.join()
+                self.running.remove(job)
+                if job.status != "done" or job.removed:
+                    self.releaseJob(job)
+
+        while len(self.running) < self.nWorkers and len(self.queued) > 0:
+            job = self.queued.pop(0)
+            self.start(job)
+            changed.append(job)
+
+        # a job is only reported once per call, the removed jobs are not reported
+        return [job for job in dict.fromkeys(changed) if not job.removed]
+
+    def isBusy(self):
+        return len(self.running) > 0 or len(self.queued) > 0
+
+    # cancel the queued jobs, terminate the running jobs and remove the workspaces of all the jobs (when the GUI is closed)
+    def shutdown(self):
+        for job in list(self.queued):
+            self.cancel(job)
+        for job in self.running:
+            job.process.terminate()
+            job.process.join()
+            job.status = "cancelled"
+        self.running = []
+        for job in self.jobs:
+            self.releaseJob(job)
@@ -20,59 +20,33 @@ Department of Civil Engineering and Energy Technology
 
 # Header:
 # This script builds a Graphical User Interface (GUI) to test and visualize the results of the DNN surrogate model  
+# The window is shown before the surrogate model is loaded (the model is loaded in the background), and the heavy modules
+# (OpenSeesPy and the color maps of the results) are only imported when an analysis is run for the first time
+# The FEM analyses run in the worker processes of an "AnalysisService.AnalysisService" (a crash of OpenSees never closes the GUI):
+# the GUI submits the jobs and reads their progress and results with root.after, and several jobs can run at the same time ("FEM Batch")
+# Only the main process builds the GUI (the worker processes import this file without running the code below "__main__")
 
-import ColorMapFEM as colorMap
+import time
 import tkinter as tk
 from tkinter import ttk
 import CanvasFunctions as draw
-import TrainedNNprediction as testNN
-from tensorflow.keras.models import load_model
-import matplotlib.pyplot as plt
+import NumpySurrogate as numpySurrogate
+import UpdateScheduler as updateScheduler
+import PushoverCurvePlot as pushoverCurvePlot
+import PredictionCache as predictionCacheModule
+import SensitivitySweep as sensitivitySweepModule
+import RunResults as runResultsModule
+import FieldAnimation as fieldAnimationModule
+import AnalysisService as analysisServiceModule
+import matplotlib
 from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
 from matplotlib.figure import Figure
-import ShearWallParametrizedAsFunction as shearWall
 from threading import Thread
-import sys
 import InputVariableBounds as inputBounds
-import Normalization as normalization
 import random as r
 
 ########### FUNCTIONS AND CLASSES ###########################################################################      
 
-# THREAD THAT IS KILLABLE (so that the analysis can be canceled)
-class thread_with_trace(Thread):
-     
-      def __init__(self, *args, **keywords):
-        Thread.__init__(self, *args, **keywords)
-        self.killed = False
-     
-      def start(self):
-        self.__run_backup = self.run
-        self.run = self.__run     
-        Thread.start(self)
-     
-      def __run(self):
-        global ops;  
-        sys.settrace(self.globaltrace)
-        self.__run_backup()
-        self.run = self.__run_backup
-        
-     
-      def globaltrace(self, frame, event, arg):
-        if event == 'call':
-          return self.localtrace
-        else:
-          return None
-     
-      def localtrace(self, frame, event, arg):
-        if self.killed:
-          if event == 'line':
-            raise SystemExit()
-        return self.localtrace
-     
-      def kill(self):
-        self.killed = True
-
 # canvas where the wall section is drawn
 class myCanvas(tk.Frame):
     def __init__(self, root, width, height):
@@ -82,17 +56,18 @@ class myCanvas(tk.Frame):
         self.canvas.pack( fill=tk.BOTH, expand=True)
         root.bind('<Configure>', self.resize)
     
-    # call this everytime the canvas is resized    
+    # call this everytime the canvas is resized (the drawings are redrawn in the next frame, see "UpdateScheduler.py")
     def resize(self, event):
         self.w = event.width
         self.h = event.height
-        update_values(event);
-        plotCurrentPushoverCurve()
+        scheduler.request("section", "elevation")
         
 
 # helper class to store the information of each input variable
 class myVariable():  
-    def __init__(self, name, minvalue, maxvalue, unitString="-", unitFactor = 1):
+    # inputIndex -> position of the variable in the input vector of the surrogate model (see "InputVariableBounds.py")
+    def __init__(self, name, minvalue, maxvalue, unitString="-", unitFactor = 1, inputIndex = None):
+        self.inputIndex = inputIndex
         self.unitFactor = unitFactor
         self.unitString = str(unitString)
         self.slider = None
@@ -116,26 +91,63 @@ class myVariable():
 
 
 # upadte the drawings and the graphics everytime a variable is changed
-def update_values(event):
+# the events of the sliders only request a redraw, the layers are redrawn once per frame and only if their values changed (see "UpdateScheduler.py")
+# variable -> the variable of the slider that was moved (its neighbouring positions are prefetched, see "PredictionCache.py")
+def update_values(event, variable=None):
+    global activeIndex
+    if variable is not None:
+        activeIndex = variable.inputIndex
+    scheduler.request("labels", "section", "elevation", "curve", "sensitivity")
+
+# positions of the 11 sliders in the order of the inputs of the surrogate model (key of the prediction cache)
+def getSliderPositions():
+    return tuple(v.getSliderValue() for v in inputVariables)
+
+# the 11 input values of the surrogate model (in the order of "InputVariableBounds.py")
+def getInputValues():
+    return [var_thickness.getRealValue(), 
+            var_length.getRealValue(), 
+            var_BElength.getRealValue(), 
+            var_BElongReinf.getRealValue(), 
+            var_BEtransvReinf.getRealValue(), 
+            var_WEBlongReinf.getRealValue(), 
+            var_WEBtransvReinf.getRealValue(), 
+            var_AxialLoad.getRealValue(), 
+            var_Height.getRealValue(), 
+            var_CompStrength.getRealValue(), 
+            var_YieldStrength.getRealValue()]
+
+# keys of the layers of the scheduler (a layer is only redrawn when its key changes)
+def getSectionKey():
+    return (init, tuple(getInputValues()), myCanvas1.w, myCanvas1.h)
+
+def getElevationKey():
+    return (init, tuple(getInputValues()), myCanvas2.w, myCanvas2.h)
+
+def getCurveKey():
+    return (init, tuple(getInputValues()), surrogate is not None)
+
+def getLabelsKey():
+    return (init, tuple(getInputValues()))
+
+def getSensitivityKey():
+    return (sensitivityWindow is not None, getSliderPositions())
+
+# draw the wall cross section
+def drawSection():
     
     if not init:
         return
     
     #canvas 1 for the wall cross section
     canvas1 = myCanvas1.canvas
-    
-    #canvas 2 for the wall elevation
-    canvas2 = myCanvas2.canvas
-    
     canvas1.delete("all")
-    canvas2.delete("all")
     
     w = myCanvas1.w
     h = myCanvas1.h
     mToPx = 140
     moveX = 0
     moveY = -0
-    elevationScale = 0.3
     
     xA = w/2 - (var_length.getRealValue()/2)*mToPx + moveX
     xB = w/2 + (var_length.getRealValue()/2)*mToPx + moveX
@@ -172,6 +184,19 @@ def update_values(event):
                   var_BElongReinf.getRealValue(),
                   var_BEtransvReinf.getRealValue(),
                   var_thickness.getRealValue())
+
+# draw the wall elevation and the axial load
+def drawElevation():
+    
+    if not init:
+        return
+    
+    #canvas 2 for the wall elevation
+    canvas2 = myCanvas2.canvas
+    canvas2.delete("all")
+    
+    mToPx = 140
+    elevationScale = 0.3
     
     # define the scaling
     lengthScaled_elevation = var_length.getRealValue() * mToPx * elevationScale
@@ -193,144 +218,89 @@ def update_values(event):
                                 var_CompStrength.getRealValue(),
                                 var_thickness.getRealValue())
 
-    # plot the pushover curve   
-    plotCurrentPushoverCurve()
-    # update the variables values and text
-    updateVariables()
-
 # update the variables values and text 
 # this is mainly to update the text on the sliders after the use modifies them
 def updateVariables():
     for v in variables:
         v.update();
 
-# clear all the curves and plot the current curve afterwards
+# clear all the curves (the ghost curves and the FEM curves), the current curve is kept
 def clearGraphic():
     global state
     if state != "Locked":
-        for l in axes.get_lines():
-                l.remove()            
-        plotCurrentPushoverCurve()        
+        pushoverPlot.clear()
                
 # open the results panel
 def showResults():
     openResultsPanel();
 
 # plot the pushover curve using the current values
+# the curve is drawn incrementally (the previous curves are kept as ghost curves, see "PushoverCurvePlot.py")
+# doted -> also keep the prediction as a static curve with markers (used to compare the prediction with the FEM analysis)
 def plotCurrentPushoverCurve(doted=False):
     if not init:
         return
     
-    global newLine, currentOutput
-    
-    # PREDICT THE VALUES USING THE STORED NEURAL NETWORK
-    inputValues, predOut = testNN.predict(nnet,
-                                        normalizer,
-                                        var_thickness.getRealValue(), 
-                                        var_length.getRealValue(), 
-                                        var_BElength.getRealValue(), 
-                                        var_BElongReinf.getRealValue(), 
-                                        var_BEtransvReinf.getRealValue(), 
-                                        var_WEBlongReinf.getRealValue(), 
-                                        var_WEBtransvReinf.getRealValue(), 
-                                        var_AxialLoad.getRealValue(), 
-                                        var_Height.getRealValue(), 
-                                        var_CompStrength.getRealValue(), 
-                                        var_YieldStrength.getRealValue()
-                                        )
-    
-    
-    xdata = [0,0.5,1.0,2.5,5,10,20]
-    ydata = []
-    ydata.append(0)
-    for val in predOut[0]:
-        ydata.append(val)
+    global currentOutput
+    
+    # the surrogate model is still loading in the background
+    if surrogate is None:
+        return
+    
+    # PREDICT THE VALUES USING THE STORED NEURAL NETWORK (OR TAKE THEM FROM THE CACHE)
+    predOut = predictionCache.predict(getSliderPositions(), activeIndex)
+    
+    
+    # points of the curve at the stations of the trained model
+    xdata, ydata = representation.getCurvePoints(predOut)
+    ydata = list(ydata[0])
+    currentOutput = ydata
         
-    # change the preivous "curve" color to grey and width to 1    
-    if newLine is not None:
-         newLine.set_color("lightgrey") 
-         newLine.set_linewidth(1)
-         newLine.set_label(None)
+    # update the current curve (the previous one becomes a ghost curve)
+    pushoverPlot.update(xdata, ydata)
     
-    # plot the new line   
+    # keep the prediction as a static curve
     if doted:
-       newLine, = axes.plot(xdata,ydata, linewidth=1, color='black', marker = 'x', markersize = 5, label="NN prediction")
-       newLine.set_color("black") 
-       newLine.set_linewidth(1)
-    else:
-       newLine, = axes.plot(xdata,ydata, label="NN prediction")
-       newLine.set_color("red") 
-       newLine.set_linewidth(2)
-        
+       pushoverPlot.freezeCurrent(linewidth=1, color='black', marker = 'x', markersize = 5, label="NN prediction "+str(analysisCount))
 
-    currentOutput = ydata
 
-    # Need both of these in order to rescale
-    axes.relim()
-    axes.autoscale_view()
-    axes.legend(loc='lower right')
-    # #We need to draw *and* flush
-    figure.canvas.draw()
-    figure.canvas.flush_events()
 
+# analysis options of the pushover analysis of the GUI (see "AnalysisService.analyzeJob")
+def getAnalysisOptions():
+   targetDisp = 0.02
+   return {"targetDisp": targetDisp, "increment": targetDisp/steps, "meshHorizontal": 8, "meshBE": 2, "meshVertical": 10}
 
 
-# function to run the static pushover analysis      
-def runStaticPushoverAnalysis():
-   global loadingBar, analysisCount, ops, maxConvergedDispX
-   
-   targetDisp = 0.02
-   increment = targetDisp/steps
+# the analysis service is created with the first analysis (only its worker processes load OpenSeesPy)
+def getAnalysisService():
+   global analysisService
+   if analysisService is None:
+       analysisService = analysisServiceModule.AnalysisService()
+   return analysisService
 
-   performPushOver = True
-   plotValidation = False
-   plotDeformedGravity = False
-   plotPushOverResults = False
 
+# show the results of a finished analysis (main thread)
+def finishAnalysis(x, y, results):
+   global loadingWindow, analysisCount, maxConvergedDispX, fieldResults
+   
    analysisCount = analysisCount + 1
    
-   #---------  CREATE THE MODEL AND RUN THE ANALYSIS WITH THE RANDOM VECTOR ---------
-   [x,y],ops = shearWall.run(  var_thickness.getRealValue(),
-                           var_length.getRealValue(),
-                           var_BElength.getRealValue(),
-                           var_BElongReinf.getRealValue(),
-                           var_BEtransvReinf.getRealValue(),
-                           var_WEBlongReinf.getRealValue(),
-                           var_WEBtransvReinf.getRealValue(),
-                           var_AxialLoad.getRealValue(),
-                           var_Height.getRealValue(),       
-                           var_CompStrength.getRealValue(),
-                           var_YieldStrength.getRealValue(),
-                           8,
-                           2,
-                           10,
-                           targetDisp,
-                           increment,
-                           performPushOver,
-                           plotValidation,
-                           plotDeformedGravity,
-                           plotPushOverResults,
-                           progressBar=loadingBar,
-                           recordResults=True)  
-   #----------------------------------------------------------------------------------
+   # the workspace of the previous results is removed
+   if fieldResults is not None and fieldResults is not results:
+       fieldResults.cleanup()
+   fieldResults = results
    
    maxConvergedDispX = max(x)
    
    clearGraphic()
    
-   realPushOverCurve, = axes.plot(x,y,label="Pushover Analysis "+str(analysisCount))
-   realPushOverCurve.set_color("orange") 
-   realPushOverCurve.set_linewidth(3)
-   axes.legend(loc='lower right')
-
-   # #We need to draw *and* flush
-   figure.canvas.draw()
-   figure.canvas.flush_events()
+   pushoverPlot.addStaticCurve(x, y, label="Pushover Analysis "+str(analysisCount), color="orange", linewidth=3)
    
    plotCurrentPushoverCurve(True)
    
    if loadingWindow is not None:
        loadingWindow.destroy()
+       loadingWindow = None
        addTextToConsole("Analysis Finished... ID="+str(analysisCount))
        printInput("Analysis Input:");
        addTextToConsole("");
@@ -348,48 +318,97 @@ def addTextToConsole(txt):
      
 # close the results window    
 def closeResultsPanel():
-    global resultsWindow
+    global resultsWindow, fieldAnimation
     
+    stopFEMresults()
+    fieldAnimation = None
     if resultsWindow != None:
         resultsWindow.destroy()
         resultsWindow = None
         
 
 # UPDATE THE FEM RESULTS PLOT    
-def updateFEMresults():
-    global ops,resultsWindow, axesResults, figureResults,combobox1,slider, colorbar,comboboxa,slider3
-
-    axesResults.clear() 
+# the frames of all the steps of the selected field and component are computed once (see "FieldAnimation.py"),
+# the step slider and the playback only change the frame that is shown
+def updateFEMresults(event=None):
+    global resultsWindow, axesResults, figureResults,combobox1,slider, colorbar,comboboxa,slider3,fieldAnimation
 
-    station = slider.get()/100
-    scale = (slider3.get()/100)*50
-    
-    if ops != None and axesResults!= None:
+    if fieldResults != None and axesResults!= None:
+        stopFEMresults()
         if colorbar != None:
             colorbar.remove()
+            colorbar = None
+        if fieldAnimation is not None:
+            fieldAnimation.remove()
+            fieldAnimation = None
+        axesResults.clear() 
           
         component = int(comboboxa.get()) 
+        field = "stresses" if combobox1.get()=="Stress" else "strains"
+        scale = (slider3.get()/100)*50
         
-        if combobox1.get()=="Stress":   
-            plot = colorMap.colorMapOne(ops, 10, 8, axesResults,"RunTimeNodalResults/stress_pushover.txt", "RunTimeNodalResults/disp_pushover.txt", component,station,scale=scale)
-        else:
-            plot = colorMap.colorMapOne(ops, 10, 8, axesResults,"RunTimeNodalResults/strain_pushover.txt", "RunTimeNodalResults/disp_pushover.txt", component,station,scale=scale)
+        fieldAnimation = fieldAnimationModule.FieldAnimation(axesResults, None, fieldResults, field, component, scale)
+        slider.configure(to=fieldAnimation.nFrames-1)
+        fieldAnimation.setFrame(slider.get())
             
-        colorbar = figureResults.colorbar(plot)
-        figureResults.canvas.draw()
-        figureResults.canvas.flush_events()
+        colorbar = figureResults.colorbar(fieldAnimation.mesh)
+        figureResults.canvas.draw_idle()
         
     else:
         addTextToConsole("Run the FEM analysis to visualize the results")
 
 
+# show a step of the history (step slider)
+def showFEMstep(value):
+    if fieldAnimation is not None:
+        fieldAnimation.setFrame(int(float(value)))
+        fieldAnimation.show()
+
+
+# change the scale of the displacements (scale slider)
+def scaleFEMresults(value):
+    if fieldAnimation is not None:
+        fieldAnimation.setScale((float(value)/100)*50)
+        fieldAnimation.show()
+
+
+# play or pause the history of the field (25 frames per second)
+def playFEMresults():
+    global playJob
+    if playJob is not None:
+        stopFEMresults()
+        return
+    if fieldAnimation is not None:
+        btnPlay.configure(text="Pause")
+        playJob = root.after(40, playNextFEMframe)
+
+
+def playNextFEMframe():
+    global playJob
+    if fieldAnimation is None or resultsWindow is None:
+        playJob = None
+        return
+    slider.set(fieldAnimation.nextFrame())
+    fieldAnimation.show()
+    playJob = root.after(40, playNextFEMframe)
+
+
+def stopFEMresults():
+    global playJob
+    if playJob is not None:
+        root.after_cancel(playJob)
+        playJob = None
+    if resultsWindow is not None:
+        btnPlay.configure(text="Play")
+
+
 # open the results window
 def openResultsPanel():
 
-    global resultsWindow, axesResults,figureResults,combobox1,slider,comboboxa,slider3,colorbar
+    global resultsWindow, axesResults,figureResults,combobox1,slider,comboboxa,slider3,colorbar,btnPlay
 
     # only open this window if the model is analyzed
-    if ops == None:
+    if fieldResults == None:
         addTextToConsole("Run the FEM analysis to visualize the results")
         return
 
@@ -435,7 +454,7 @@ def openResultsPanel():
     combobox1['values'] = ('Stress', 'Strain')
     combobox1.pack(fill=tk.X, padx=2, pady=5)
     combobox1.set("Strain")
-    # combobox1.bind('<<ComboboxSelected>>', callback)
+    combobox1.bind('<<ComboboxSelected>>', updateFEMresults)
     
     
     # COMBOBOX FOR THE "FIELD" 
@@ -449,6 +468,7 @@ def openResultsPanel():
     comboboxa['values'] = ("0",'1', '2', '3', "4","5")
     comboboxa.pack(fill=tk.X, padx=2, pady=5)
     comboboxa.set("1")
+    comboboxa.bind('<<ComboboxSelected>>', updateFEMresults)
 
     # SLIDER FOR THE "STEP"
     box2 = tk.Frame(resultsWindow)
@@ -457,7 +477,10 @@ def openResultsPanel():
     label2 = tk.Label(box2, width = 6, text = "Step: ",anchor="w")
     label2.pack(padx=5,pady=[5,0], side = tk.LEFT )
     
-    slider = tk.Scale(box2,from_=0,to=100,orient='horizontal',showvalue=False)
+    btnPlay = tk.Button(box2, text='Play', width=5, height=1, bd='1', command=playFEMresults, bg='lightgray')
+    btnPlay.pack(padx=5, side = tk.RIGHT)
+    
+    slider = tk.Scale(box2,from_=0,to=100,orient='horizontal',showvalue=False,command=showFEMstep)
     slider.set(100)
     slider.pack(fill = tk.X,pady=[5,5])
     
@@ -470,7 +493,8 @@ def openResultsPanel():
     label3.pack(padx=5,pady=2,anchor="w", side = tk.LEFT )
     
     slider3 = tk.Scale(box3,from_=0,to=100,orient='horizontal',showvalue=False)
-    slider3.set(50)
+    slider3.set(40)
+    slider3.configure(command=scaleFEMresults)
     slider3.pack(fill = tk.X,pady=[5,5])
     
     
@@ -483,15 +507,137 @@ def openResultsPanel():
     NavigationToolbar2Tk(figure_canvas, resultsWindow)
     figure_canvas_2.get_tk_widget().pack(fill=tk.BOTH, expand = True)
     
-    # plot the strain field
-    plot = colorMap.colorMapOne(ops, 10, 8, axesResults,"RunTimeNodalResults/strain_pushover.txt", "RunTimeNodalResults/disp_pushover.txt", 1,1,scale=20)
-    colorbar = figureResults.colorbar(plot)
+    # plot the strain field (last step)
+    colorbar = None
+    updateFEMresults()
+    if fieldAnimation is not None:
+        slider.set(fieldAnimation.nFrames-1)
     
     
+# open the sensitivity window: sweeps of every variable around the current values of the sliders (see "SensitivitySweep.py")
+def openSensitivityPanel():
+    global sensitivityWindow, sensitivityFigure, axesFan, axesTornado, comboboxSweepVar, comboboxSweepOut
+
+    if surrogate is None:
+        addTextToConsole("The surrogate model is still loading")
+        return
+
+    # only one window can be opened at all times
+    if sensitivityWindow != None:
+        return
+
+    sensitivityWindow = tk.Toplevel(root)
+    sensitivityWindow.title("Sensitivity of the Surrogate Model")
+    sensitivityWindow.protocol("WM_DELETE_WINDOW", closeSensitivityPanel)
+    sensitivityWindow.geometry("800x420")
+
+    # COMBOBOXES FOR THE VARIABLE OF THE FAN AND THE OUTPUT OF THE TORNADO CHART
+    box1 = tk.Frame(sensitivityWindow)
+    box1.pack(anchor="w",fill=tk.X)
+
+    label1 = tk.Label(box1, text = "Variable: ",anchor="w")
+    label1.pack(padx=5,pady=5, side = tk.LEFT )
+
+    comboboxSweepVar = ttk.Combobox(box1,state='readonly')
+    comboboxSweepVar['values'] = [v.name for v in inputVariables]
+    comboboxSweepVar.current(var_AxialLoad.inputIndex)
+    comboboxSweepVar.pack(padx=5,pady=5, side = tk.LEFT )
+    comboboxSweepVar.bind('<<ComboboxSelected>>', lambda event: updateSensitivityPlots())
+
+    label2 = tk.Label(box1, text = "Output: ",anchor="w")
+    label2.pack(padx=5,pady=5, side = tk.LEFT )
+
+    comboboxSweepOut = ttk.Combobox(box1,state='readonly')
+    comboboxSweepOut['values'] = ["u = "+str(round(s,2))+" mm" for s in representation.stations[1:]]
+    comboboxSweepOut.current(representation.nOutputs-1)
+    comboboxSweepOut.pack(padx=5,pady=5, side = tk.LEFT )
+    comboboxSweepOut.bind('<<ComboboxSelected>>', lambda event: updateSensitivityPlots())
+
+    # FIGURE WITH THE FAN (LEFT) AND THE TORNADO CHART (RIGHT)
+    sensitivityFigure = Figure(figsize=(8, 3.5), dpi=100)
+    axesFan = sensitivityFigure.add_subplot(1,2,1)
+    axesTornado = sensitivityFigure.add_subplot(1,2,2)
+
+    figure_canvas_3 = FigureCanvasTkAgg(sensitivityFigure, sensitivityWindow)
+    figure_canvas_3.get_tk_widget().pack(fill=tk.BOTH, expand = True)
+
+    updateSensitivityPlots()
+
+
+# close the sensitivity window
+def closeSensitivityPanel():
+    global sensitivityWindow
+
+    if sensitivityWindow != None:
+        sensitivityWindow.destroy()
+        sensitivityWindow = None
+
+
+# draw the sensitivity fan and the tornado chart for the current values of the sliders
+def updateSensitivityPlots():
+    if sensitivityWindow is None or surrogate is None:
+        return
+
+    # all the sweeps are predicted in a single batch call (11 x 101 input vectors)
+    positions = getSliderPositions()
+    tensor = sensitivitySweep.sweep(positions)
+
+    # moving a single slider from this configuration does not need the surrogate model anymore
+    keys, values = sensitivitySweep.getSweepEntries(positions)
+    predictionCache.storeMany(keys, values)
+
+    index = comboboxSweepVar.current()
+    output = comboboxSweepOut.current()
+    variable = inputVariables[index]
+
+    # SENSITIVITY FAN: CURVES OF THE SELECTED VARIABLE AT EVERY 10 POSITIONS OF ITS SLIDER
+    fanPositions, curves = sensitivitySweepModule.getFan(tensor, index, step=10)
+    xdata, ydata = representation.getCurvePoints(curves)
+    colors = matplotlib.colormaps["viridis"]
+
+    axesFan.clear()
+    for k in range(len(fanPositions)):
+        value = variable.minvalue + (fanPositions[k]/100)*(variable.maxvalue-variable.minvalue)
+        label = None
+        if k == 0 or k == len(fanPositions)-1:
+            label = str(round(value*variable.unitFactor,3))+" ["+variable.unitString+"]"
+        axesFan.plot(xdata, ydata[k], color=colors(k/(len(fanPositions)-1)), linewidth=1, label=label)
+    axesFan.plot(xdata, [0]+list(tensor[index, positions[index], :]), color="red", linewidth=2, linestyle="--", label="Current")
+    axesFan.set_title(variable.name)
+    axesFan.set_xlabel('Displacement [mm]')
+    axesFan.set_ylabel('Base Shear [kN]')
+    axesFan.grid(linestyle='--')
+    axesFan.legend(loc='lower right')
+
+    # TORNADO CHART: CHANGE OF THE SELECTED OUTPUT WHEN EACH VARIABLE GOES TO THE MIN AND MAX OF ITS SLIDER
+    base, low, high, order = sensitivitySweepModule.getTornado(tensor, positions, output)
+    names = [inputVariables[i].name for i in order]
+
+    axesTornado.clear()
+    axesTornado.barh(range(len(order)), low[order], color="tab:blue", label="Min")
+    axesTornado.barh(range(len(order)), high[order], color="tab:orange", label="Max")
+    axesTornado.axvline(x=0, color="black", linewidth=1)
+    axesTornado.set_yticks(range(len(order)))
+    axesTornado.set_yticklabels(names)
+    axesTornado.invert_yaxis()
+    axesTornado.set_title("V = "+str(round(base,1))+" kN at "+comboboxSweepOut.get())
+    axesTornado.set_xlabel('Change of Base Shear [kN]')
+    axesTornado.grid(linestyle='--', axis='x')
+    axesTornado.legend(loc='lower right')
+
+    sensitivityFigure.tight_layout()
+    sensitivityFigure.canvas.draw_idle()
+
+
 # run analysis BUTTON
 def runAnalysis():
 
-    global loadingWindow,t1,loadingBar, analysisCount
+    global loadingWindow,loadingBar,analysisJob
+
+    # a cancelled analysis stops at the end of its current step
+    if analysisJob is not None and analysisJob.isActive():
+        addTextToConsole("The previous analysis is still running")
+        return
 
     loadingWindow = tk.Toplevel(root)
     loadingWindow.title("Analysis Status...")
@@ -513,9 +659,153 @@ def runAnalysis():
     
     tk.Label(loadingWindow,text ="Close this window to cancel").pack()
     
-    # start the analysis in a new thread
-    t1 = thread_with_trace(target = runStaticPushoverAnalysis)
-    t1.start()
+    # submit the analysis to the analysis service (the displacements, strains and stresses of every step come back in the results of the job)
+    analysisJob = getAnalysisService().submit(getInputValues(), getAnalysisOptions(), label="Pushover Analysis")
+    startPolling()
+
+
+# run the current design and some randomized neighbours in parallel (the FEM curves are added to the graphic when they finish)
+def runBatch():
+    global batchCount
+
+    batchCount = batchCount + 1
+    inputValues = getInputValues()
+    vectors = [inputValues] + analysisServiceModule.getNeighbourVectors(inputValues, nNeighbours)
+    
+    for i in range(len(vectors)):
+        label = "Batch "+str(batchCount)+" - current" if i == 0 else "Batch "+str(batchCount)+" - neighbour "+str(i)
+        getAnalysisService().submit(vectors[i], getAnalysisOptions(), label=label)
+        
+    addTextToConsole(str(len(vectors))+" FEM analyses queued (Batch "+str(batchCount)+")")
+    openJobsPanel()
+    startPolling()
+
+
+def startPolling():
+    global polling
+    if not polling:
+        polling = True
+        root.after(100, pollAnalysisService)
+
+
+# read the progress and the results of the jobs of the analysis service every 100 ms (until there are no more jobs)
+def pollAnalysisService():
+    global polling
+    for job in analysisService.poll():
+        if job is analysisJob:
+            updateAnalysisJob(job)
+        elif job.status == "done":
+            pushoverPlot.addStaticCurve(job.x, job.y, label=job.label, color="gray", linewidth=1)
+            addTextToConsole(job.label+" finished ("+str(round(job.wallTime,1))+" s)")
+            # only the curve of a batch job is used, its fields are never loaded
+            analysisService.releaseJob(job)
+        elif job.status == "failed":
+            addTextToConsole(job.label+" failed: "+job.error)
+            
+    updateJobsPanel()
+    
+    if analysisService.isBusy():
+        root.after(100, pollAnalysisService)
+    else:
+        polling = False
+
+
+# progress and result of the analysis of the "Run FEM Analysis" button
+def updateAnalysisJob(job):
+    global loadingWindow
+    if job.status == "running":
+        if loadingWindow is not None:
+            loadingBar["value"] = job.progress*steps
+    elif job.status == "done":
+        # the fields are only loaded if the analysis was not cancelled from the window (otherwise the job finished after the cancellation)
+        if loadingWindow is not None:
+            finishAnalysis(job.x, job.y, analysisService.getResults(job))
+        else:
+            analysisService.releaseJob(job)
+    elif job.status == "failed":
+        if loadingWindow is not None:
+            loadingWindow.destroy()
+            loadingWindow = None
+        addTextToConsole("Analysis failed: "+job.error)
+    elif job.status != "queued":
+        addTextToConsole("Analysis canceled")
+
+
+# window with the jobs of the analysis service (status and progress of every job)
+def openJobsPanel():
+    global jobsWindow, jobsTree
+    
+    if jobsWindow != None:
+        return
+    
+    jobsWindow = tk.Toplevel(root)
+    jobsWindow.title("FEM Jobs")
+    jobsWindow.protocol("WM_DELETE_WINDOW", closeJobsPanel)
+    jobsWindow.geometry("420x240")
+    
+    jobsTree = ttk.Treeview(jobsWindow, columns=("status","progress","dmax"), height=8)
+    jobsTree.heading("#0", text="Job")
+    jobsTree.heading("status", text="Status")
+    jobsTree.heading("progress", text="Progress")
+    jobsTree.heading("dmax", text="Max. Disp.")
+    jobsTree.column("#0", width=170)
+    jobsTree.column("status", width=70)
+    jobsTree.column("progress", width=70)
+    jobsTree.column("dmax", width=80)
+    jobsTree.pack(fill = tk.BOTH, expand = True, padx=5, pady=5)
+    
+    jobsToolBar = tk.Frame(jobsWindow)
+    jobsToolBar.pack(pady=(0,5))
+    
+    btnCancelJobs = tk.Button(jobsToolBar, text='Cancel All', width=10, height=1, bd='1', command=cancelAllJobs, bg='lightgray')
+    btnCancelJobs.pack(padx=2, side = tk.LEFT)
+    
+    btnClearJobs = tk.Button(jobsToolBar, text='Clear', width=10, height=1, bd='1', command=clearFinishedJobs, bg='lightgray')
+    btnClearJobs.pack(padx=2, side = tk.LEFT)
+    
+    updateJobsPanel()
+
+
+def closeJobsPanel():
+    global jobsWindow
+    if jobsWindow != None:
+        jobsWindow.destroy()
+        jobsWindow = None
+
+
+def updateJobsPanel():
+    if jobsWindow is None or analysisService is None:
+        return
+    for job in analysisService.jobs:
+        dmax = "" if job.x is None or len(job.x) == 0 else str(round(max(job.x),1))+" mm"
+        values = (job.status, str(int(job.progress*100))+" %", dmax)
+        if jobsTree.exists(str(job.jobId)):
+            jobsTree.item(str(job.jobId), values=values)
+        else:
+            jobsTree.insert("", tk.END, iid=str(job.jobId), text=job.label, values=values)
+
+
+def cancelAllJobs():
+    if analysisService is not None:
+        analysisService.cancelAll()
+
+
+# remove the finished jobs from the panel and their workspaces (the results shown in the results panel are kept)
+def clearFinishedJobs():
+    if analysisService is None:
+        return
+    for job in list(analysisService.jobs):
+        if not job.isActive() and job is not analysisJob:
+            analysisService.removeJob(job)
+            if jobsWindow is not None and jobsTree.exists(str(job.jobId)):
+                jobsTree.delete(str(job.jobId))
+
+
+# terminate the analyses and remove their workspaces before closing the program
+def closeProgram():
+    if analysisService is not None:
+        analysisService.shutdown()
+    root.destroy()
 
 
 def lock_variables():
@@ -530,8 +820,10 @@ def lock_variables():
    
 
 def unlock_variables():
-   global ops, state,resultsWindow
-   ops = None
+   global fieldResults, state,resultsWindow
+   if fieldResults is not None:
+       fieldResults.cleanup()
+   fieldResults = None
    clearGraphic()
    btnLock.configure(bg='lightgray') 
    btnLock.configure(text='Lock') 
@@ -539,9 +831,7 @@ def unlock_variables():
    btnShowResults.configure(bg='lightgray') 
    state = "Normal" 
    
-   if resultsWindow != None:
-       resultsWindow.destroy()
-       resultsWindow = None
+   closeResultsPanel()
        
    for v in variables:
        v.slider.config(state="normal")    
@@ -552,17 +842,16 @@ def updateLoadingBar():
    loadingBar.step()                 
 
        
+# the analysis stops at the end of its current step (the worker is not waited here, so the GUI is never blocked)
 def cancel_analysis():
-   global t1, ops
+   global loadingWindow
    
    if loadingWindow is not None:
        loadingWindow.destroy()
+       loadingWindow = None
        
-   if t1 is not None:
-       ops.exit()
-       t1.kill()
-       t1.join() 
-       ops = None
+   if analysisJob is not None:
+       analysisService.cancel(analysisJob)
        
    
 
@@ -592,11 +881,18 @@ def printResults():
     addTextToConsole("Input Values:")
     addTextToConsole(inputString)
     
+    if currentOutput is None:
+        addTextToConsole("The surrogate model is still loading")
+        return
+    
     roundedList = [ round(elem, 4) for elem in currentOutput ]
     inputString = str(roundedList)
     inputString = inputString[1:-1]
     addTextToConsole("Output Values:")
     addTextToConsole(inputString)
+    
+    stats = predictionCache.getStats()
+    addTextToConsole("Prediction cache: "+str(stats["size"])+" entries, "+str(stats["hits"])+" hits, "+str(stats["misses"])+" misses ("+str(round(stats["hitRatio"]*100,1))+"% hits)")
 
 # print the input 
 def printInput(txtInput):
@@ -627,20 +923,66 @@ def randomizeVariables():
     for i in range(len(variables)):
         y = r.randint(0, 100)
         variables[i].slider.set(y)
+
+
+# load the surrogate model (runs in a background thread so that the window is shown immediately)
+def loadSurrogateModel():
+    global loadedSurrogate, modelLoadingError
+    try:
+        loadedSurrogate = numpySurrogate.loadSurrogate(pathToTheNN)
+    except Exception as e:
+        modelLoadingError = str(e)
+
+
+# check from the main loop if the surrogate model is loaded (the tk widgets can only be modified from the main thread)
+def checkSurrogateModel():
+    global surrogate, representation, predictionCache, sensitivitySweep
+
+    if modelLoadingError is not None:
+        axes.set_title('Pushover curve (model not available)')
+        pushoverPlot.redraw()
+        addTextToConsole("The surrogate model could not be loaded: "+modelLoadingError)
+        return
+
+    if loadedSurrogate is None:
+        root.after(50, checkSurrogateModel)
+        return
+
+    # cache of the predictions and sweeps of the sensitivity window, with the same mapping from the slider positions to the inputs as the sliders
+    predictionCache = predictionCacheModule.PredictionCache(loadedSurrogate.predict,
+                                                            [v.minvalue for v in inputVariables],
+                                                            [v.maxvalue for v in inputVariables])
+    sensitivitySweep = sensitivitySweepModule.SensitivitySweep(loadedSurrogate.predict,
+                                                               [v.minvalue for v in inputVariables],
+                                                               [v.maxvalue for v in inputVariables])
+    surrogate = loadedSurrogate
+    representation = surrogate.representation
+    axes.set_title('Pushover curve')
+    pushoverPlot.redraw()
+    addTextToConsole("Surrogate model loaded in "+str(round(time.time()-startTime,2))+" s")
+    scheduler.request("curve")
                   
                   
 ##################### CODE BEGINS ###########################################################################        
+startTime = time.time()
 state = "Normal"
 analysisCount = 0
 init = False
-newLine = None
 loadingWindow = None
 steps = 200
-t1 = None
 t2 = None
+analysisService = None
+analysisJob = None
+batchCount = 0
+nNeighbours = 4
+polling = False
+jobsWindow = None
+jobsTree = None
 currentOutput = None
 programVersion = "Beta 0.1"
-ops = None
+fieldResults = None
+fieldAnimation = None
+playJob = None
 resultsWindow = None
 maxConvergedDispX = 20
 axesResults = None
@@ -648,208 +990,246 @@ cbValue = "Strain-Y"
 station = 0
 colorbar = None
 
-# ROOT GUI ELEMENT
-root=tk.Tk()
-root.title("RC-Shear Walls Analysis with Neural Networks")
-root.geometry("900x700")
+# the GUI is only built by the main process (the worker processes of the analysis service import this file)
+if __name__ == "__main__":
+
+    # ROOT GUI ELEMENT
+    root=tk.Tk()
+    root.title("RC-Shear Walls Analysis with Neural Networks")
+    root.geometry("900x700")
+    root.protocol("WM_DELETE_WINDOW", closeProgram)
 
-# MAIN FRAME
-mainFrame = tk.PanedWindow(root, orient=tk.HORIZONTAL)
-mainFrame.pack(fill = tk.BOTH, expand = True)
+    # SCHEDULER OF THE REDRAWS (THE EVENTS OF THE SLIDERS AND THE RESIZE EVENTS ARE COALESCED INTO ONE REDRAW PER FRAME)
+    scheduler = updateScheduler.UpdateScheduler(root, interval=16)
+    scheduler.addLayer("labels", lambda: updateVariables(), getLabelsKey)
+    scheduler.addLayer("section", lambda: drawSection(), getSectionKey)
+    scheduler.addLayer("elevation", lambda: drawElevation(), getElevationKey)
+    scheduler.addLayer("curve", lambda: plotCurrentPushoverCurve(), getCurveKey)
+    scheduler.addLayer("sensitivity", lambda: updateSensitivityPlots(), getSensitivityKey)
 
-# LEFT PANEL
-leftframe = tk.PanedWindow(mainFrame,width=200)
-mainFrame.add(leftframe)
+    # MAIN FRAME
+    mainFrame = tk.PanedWindow(root, orient=tk.HORIZONTAL)
+    mainFrame.pack(fill = tk.BOTH, expand = True)
 
-# RIGHT PANEL
-rightframe = tk.PanedWindow(mainFrame, orient=tk.VERTICAL)
-mainFrame.add(rightframe)
+    # LEFT PANEL
+    leftframe = tk.PanedWindow(mainFrame,width=200)
+    mainFrame.add(leftframe)
 
-# TOOLBAR 
-toolBarPane = tk.Frame(rightframe)
-rightframe.add(toolBarPane)
+    # RIGHT PANEL
+    rightframe = tk.PanedWindow(mainFrame, orient=tk.VERTICAL)
+    mainFrame.add(rightframe)
 
+    # TOOLBAR 
+    toolBarPane = tk.Frame(rightframe)
+    rightframe.add(toolBarPane)
 
 
 
-btnRunAnalysis = tk.Button(toolBarPane, text='Run FEM Analysis', width=14,height=1, bd='1', command=runAnalysis, anchor="w",bg='lightgray')
-btnRunAnalysis.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
 
-btnShowResults = tk.Button(toolBarPane, text='FEM Results', width=10,height=1, bd='1', command=showResults, anchor="w",bg='lightgray')
-btnShowResults.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
+    btnRunAnalysis = tk.Button(toolBarPane, text='Run FEM Analysis', width=14,height=1, bd='1', command=runAnalysis, anchor="w",bg='lightgray')
+    btnRunAnalysis.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
 
-btnPrintValues = tk.Button(toolBarPane, text='Print Values', width=10,height=1, bd='1', command=printResults, anchor="w",bg='lightgray')
-btnPrintValues.pack(anchor="w",padx=5,pady=2, side = tk.RIGHT )
+    btnBatch = tk.Button(toolBarPane, text='FEM Batch', width=10,height=1, bd='1', command=runBatch, anchor="w",bg='lightgray')
+    btnBatch.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
 
+    btnShowResults = tk.Button(toolBarPane, text='FEM Results', width=10,height=1, bd='1', command=showResults, anchor="w",bg='lightgray')
+    btnShowResults.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
 
+    btnSensitivity = tk.Button(toolBarPane, text='Sensitivity', width=10,height=1, bd='1', command=openSensitivityPanel, anchor="w",bg='lightgray')
+    btnSensitivity.pack(anchor="w",padx=2,pady=2, side = tk.LEFT )
 
+    btnPrintValues = tk.Button(toolBarPane, text='Print Values', width=10,height=1, bd='1', command=printResults, anchor="w",bg='lightgray')
+    btnPrintValues.pack(anchor="w",padx=5,pady=2, side = tk.RIGHT )
 
-# button to clear all the graphic lines and re-render the current curve only
-btnClearGraph = tk.Button(toolBarPane, text='Clear Graph', width=10,height=1, bd='1', command=clearGraphic, anchor="w",bg='lightgray')
-btnClearGraph.pack(anchor="w",padx=(0,0),pady=2, side = tk.RIGHT )
 
 
-# RIGHT-TOP PANEL (INFO AND PUSHOVER GRAPHIC)
-rightTopPane = tk.PanedWindow(rightframe, orient=tk.HORIZONTAL)
-rightframe.add(rightTopPane)
 
-#  RIGHT-TOP-LEFT - INFO PANE
-rightTopPane_left = tk.PanedWindow(rightTopPane)
-rightTopPane.add(rightTopPane_left)
-# RIGHT-TOP-RIGHT - PUSHOVER GRAPHIC
-rightTopPane_right = tk.PanedWindow(rightTopPane)
-rightTopPane.add(rightTopPane_right)
+    # button to clear all the graphic lines and re-render the current curve only
+    btnClearGraph = tk.Button(toolBarPane, text='Clear Graph', width=10,height=1, bd='1', command=clearGraphic, anchor="w",bg='lightgray')
+    btnClearGraph.pack(anchor="w",padx=(0,0),pady=2, side = tk.RIGHT )
 
 
-# RIGHT-BOTTOM PANEL (WALL CROSS SECTION AND ELEVATION)
-rightBotPane = tk.PanedWindow(rightframe)
-rightframe.add(rightBotPane)
+    # RIGHT-TOP PANEL (INFO AND PUSHOVER GRAPHIC)
+    rightTopPane = tk.PanedWindow(rightframe, orient=tk.HORIZONTAL)
+    rightframe.add(rightTopPane)
 
-# CREATE A MATPLOT FIGURE FOR THE PUSHOVER GRAPHIC
-figure = Figure(figsize=(3, 3), dpi=100)
+    #  RIGHT-TOP-LEFT - INFO PANE
+    rightTopPane_left = tk.PanedWindow(rightTopPane)
+    rightTopPane.add(rightTopPane_left)
+    # RIGHT-TOP-RIGHT - PUSHOVER GRAPHIC
+    rightTopPane_right = tk.PanedWindow(rightTopPane)
+    rightTopPane.add(rightTopPane_right)
 
 
-# INITIALIZE THE PLOT INSIDE THE GUI
-figure_canvas = FigureCanvasTkAgg(figure, rightTopPane_right)
+    # RIGHT-BOTTOM PANEL (WALL CROSS SECTION AND ELEVATION)
+    rightBotPane = tk.PanedWindow(rightframe)
+    rightframe.add(rightBotPane)
 
+    # CREATE A MATPLOT FIGURE FOR THE PUSHOVER GRAPHIC
+    figure = Figure(figsize=(3, 3), dpi=100)
+
+
+    # INITIALIZE THE PLOT INSIDE THE GUI
+    figure_canvas = FigureCanvasTkAgg(figure, rightTopPane_right)
 
-# bar = NavigationToolbar2Tk(figure_canvas, toolBarPane)
-# bar.pack(anchor="w",padx=35,pady=2, )
 
-figure_canvas.get_tk_widget().pack(fill=tk.BOTH, expand = True)
+    # bar = NavigationToolbar2Tk(figure_canvas, toolBarPane)
+    # bar.pack(anchor="w",padx=35,pady=2, )
 
+    figure_canvas.get_tk_widget().pack(fill=tk.BOTH, expand = True)
 
 
 
-# CREATE CANVAS TO DRAW THE WALL CROSS SECTION AND ELEVATION
-myCanvas1 = myCanvas(rightBotPane, 600,200)
-myCanvas2 = myCanvas(rightTopPane_left, 250,200)
 
-consoleLabel = tk.Label(root, text="Console", font='TkDefaultFont 11 bold')
-consoleLabel.pack(anchor="w",pady=5,padx=(5,0))
+    # CREATE CANVAS TO DRAW THE WALL CROSS SECTION AND ELEVATION
+    myCanvas1 = myCanvas(rightBotPane, 600,200)
+    myCanvas2 = myCanvas(rightTopPane_left, 250,200)
 
-# THE TEXTBOX IN THE BOTTOM
-text_box = tk.Text(root,height=6)
-text_box.pack(fill = "x", pady=(0,5),padx=(5,5))
+    consoleLabel = tk.Label(root, text="Console", font='TkDefaultFont 11 bold')
+    consoleLabel.pack(anchor="w",pady=5,padx=(5,0))
 
-minValues = inputBounds.minValues
-maxValues = inputBounds.maxValues
+    # THE TEXTBOX IN THE BOTTOM
+    text_box = tk.Text(root,height=6)
+    text_box.pack(fill = "x", pady=(0,5),padx=(5,5))
 
-# create the input variables and the sliders 
-var_thickness = myVariable("Thickness", minValues[0], maxValues[0], unitString="cm", unitFactor = 100)
-var_Height = myVariable("Height", minValues[8], maxValues[8], unitString="cm", unitFactor = 100)
-var_length = myVariable("Wall Length", minValues[1], maxValues[1], unitString="cm", unitFactor = 100)
-var_BElength = myVariable("BE Length", minValues[2], maxValues[2], unitString="%", unitFactor = 100)
-var_CompStrength = myVariable("Comp. Strength f'c", minValues[9], maxValues[9], unitString="MPa", unitFactor = 1/1e6)
-var_YieldStrength = myVariable("Yield Strength fy", minValues[10], maxValues[10], unitString="MPa", unitFactor = 1/1e6)
-var_BElongReinf = myVariable("BE long Reinf", minValues[3], maxValues[3], unitString="%", unitFactor = 100)
-var_BEtransvReinf = myVariable("BE transv Reinf", minValues[4], maxValues[4], unitString="%", unitFactor = 100)
-var_WEBlongReinf = myVariable("WEB long Reinf", minValues[5], maxValues[5], unitString="%", unitFactor = 100)
-var_WEBtransvReinf = myVariable("WEB transv Reinf", minValues[6], maxValues[6], unitString="%", unitFactor = 100)
-var_AxialLoad = myVariable("Axial Load", minValues[7], maxValues[7], unitString="-", unitFactor = 1)
+    minValues = inputBounds.minValues
+    maxValues = inputBounds.maxValues
 
-# out all the input variables into a list
-variables = []
-variables.append(var_CompStrength)
-variables.append(var_YieldStrength)
-variables.append(var_Height)
-variables.append(var_thickness)
-variables.append(var_length)
-variables.append(var_BElength)
-variables.append(var_BElongReinf)
-variables.append(var_BEtransvReinf)
-variables.append(var_WEBlongReinf)
-variables.append(var_WEBtransvReinf)
-variables.append(var_AxialLoad)
+    # create the input variables and the sliders 
+    var_thickness = myVariable("Thickness", minValues[0], maxValues[0], unitString="cm", unitFactor = 100, inputIndex = 0)
+    var_Height = myVariable("Height", minValues[8], maxValues[8], unitString="cm", unitFactor = 100, inputIndex = 8)
+    var_length = myVariable("Wall Length", minValues[1], maxValues[1], unitString="cm", unitFactor = 100, inputIndex = 1)
+    var_BElength = myVariable("BE Length", minValues[2], maxValues[2], unitString="%", unitFactor = 100, inputIndex = 2)
+    var_CompStrength = myVariable("Comp. Strength f'c", minValues[9], maxValues[9], unitString="MPa", unitFactor = 1/1e6, inputIndex = 9)
+    var_YieldStrength = myVariable("Yield Strength fy", minValues[10], maxValues[10], unitString="MPa", unitFactor = 1/1e6, inputIndex = 10)
+    var_BElongReinf = myVariable("BE long Reinf", minValues[3], maxValues[3], unitString="%", unitFactor = 100, inputIndex = 3)
+    var_BEtransvReinf = myVariable("BE transv Reinf", minValues[4], maxValues[4], unitString="%", unitFactor = 100, inputIndex = 4)
+    var_WEBlongReinf = myVariable("WEB long Reinf", minValues[5], maxValues[5], unitString="%", unitFactor = 100, inputIndex = 5)
+    var_WEBtransvReinf = myVariable("WEB transv Reinf", minValues[6], maxValues[6], unitString="%", unitFactor = 100, inputIndex = 6)
+    var_AxialLoad = myVariable("Axial Load", minValues[7], maxValues[7], unitString="-", unitFactor = 1, inputIndex = 7)
 
+    # out all the input variables into a list
+    variables = []
+    variables.append(var_CompStrength)
+    variables.append(var_YieldStrength)
+    variables.append(var_Height)
+    variables.append(var_thickness)
+    variables.append(var_length)
+    variables.append(var_BElength)
+    variables.append(var_BElongReinf)
+    variables.append(var_BEtransvReinf)
+    variables.append(var_WEBlongReinf)
+    variables.append(var_WEBtransvReinf)
+    variables.append(var_AxialLoad)
 
-# Create a box that contains a label (title) and a slider
-box = tk.Frame(leftframe)
-leftframe.add(box)
+    # the same variables in the order of the inputs of the surrogate model
+    inputVariables = sorted(variables, key=lambda v: v.inputIndex)
 
-titleLabel = tk.Label(box, text="Input Variables", font='TkDefaultFont 11 bold')
-titleLabel.pack(anchor="w",padx=5,pady=5)
+    # index of the input of the slider that was moved last, and cache of the predictions (created when the model is loaded)
+    activeIndex = None
+    predictionCache = None
+    sensitivitySweep = None
+    sensitivityWindow = None
 
-toolBar2 = tk.Frame(box)
-toolBar2.pack()
 
-btnLock = tk.Button(toolBar2, text='Lock', width=7, height=1, bd='1', command=lock_variables, anchor="c", bg="lightgrey")
-btnLock.pack(anchor="c",padx=2,pady=2,  side = tk.LEFT )
+    # Create a box that contains a label (title) and a slider
+    box = tk.Frame(leftframe)
+    leftframe.add(box)
 
-btnUnlock = tk.Button(toolBar2, text='Unlock', width=7,height=1, bd='1', command=unlock_variables, anchor="c", bg="lightgrey")
-btnUnlock.pack(anchor="c",padx=2,pady=2,  side = tk.LEFT )
+    titleLabel = tk.Label(box, text="Input Variables", font='TkDefaultFont 11 bold')
+    titleLabel.pack(anchor="w",padx=5,pady=5)
 
-btnRandom = tk.Button(toolBar2, text='Random', width=7,height=1, bd='1', command=randomizeVariables, anchor="c", bg="lightgrey")
-btnRandom.pack(anchor="c",padx=2,pady=2,  side = tk.RIGHT )
+    toolBar2 = tk.Frame(box)
+    toolBar2.pack()
 
-# create the sliders that modify the input variables
-for i in range(len(variables)):
+    btnLock = tk.Button(toolBar2, text='Lock', width=7, height=1, bd='1', command=lock_variables, anchor="c", bg="lightgrey")
+    btnLock.pack(anchor="c",padx=2,pady=2,  side = tk.LEFT )
+
+    btnUnlock = tk.Button(toolBar2, text='Unlock', width=7,height=1, bd='1', command=unlock_variables, anchor="c", bg="lightgrey")
+    btnUnlock.pack(anchor="c",padx=2,pady=2,  side = tk.LEFT )
+
+    btnRandom = tk.Button(toolBar2, text='Random', width=7,height=1, bd='1', command=randomizeVariables, anchor="c", bg="lightgrey")
+    btnRandom.pack(anchor="c",padx=2,pady=2,  side = tk.RIGHT )
+
+    # create the sliders that modify the input variables
+    for i in range(len(variables)):
     
-    variables[i].string_var.set(variables[i].name)
+        variables[i].string_var.set(variables[i].name)
     
-    sliderLabel = tk.Label(box,anchor="w",textvariable = variables[i].string_var)
-    slider = tk.Scale(box,from_=0,to=100,orient='horizontal',command=update_values,showvalue=False)
-    slider.set(50)
+        sliderLabel = tk.Label(box,anchor="w",textvariable = variables[i].string_var)
+        slider = tk.Scale(box,from_=0,to=100,orient='horizontal',command=lambda value, v=variables[i]: update_values(value, v),showvalue=False)
+        slider.set(50)
     
-    sliderLabel.pack(fill = tk.BOTH, expand = True)
-    slider.pack(fill = tk.BOTH, expand = True)
+        sliderLabel.pack(fill = tk.BOTH, expand = True)
+        slider.pack(fill = tk.BOTH, expand = True)
     
-    variables[i].setSlider(slider)
+        variables[i].setSlider(slider)
 
-# line below the title for asthethics
-separator = ttk.Separator(box, orient='horizontal')
-separator.place(x=5, y=30, relwidth=0.95, height=1)
+    # line below the title for asthethics
+    separator = ttk.Separator(box, orient='horizontal')
+    separator.place(x=5, y=30, relwidth=0.95, height=1)
 
 
-# # LOAD THE PREVIOUSLY SAVED NEURAL NETWORK MODEL
-pathToTheNN='NeuralNetworkWeights/dnn_surrogate_model.h5'
-nnet=load_model(pathToTheNN)
-nnet.summary()
+    # # LOAD THE PREVIOUSLY SAVED NEURAL NETWORK MODEL IN THE BACKGROUND
+    # # (the surrogate model contains the normalizer and the stations of the outputs, the original 6 outputs if the model has no stations file)
+    # # the weights are evaluated with numpy ("dnn_surrogate_model.npz"), TensorFlow is only loaded if they can not be exported
+    pathToTheNN='NeuralNetworkWeights/dnn_surrogate_model.h5'
+    surrogate = None
+    representation = None
+    loadedSurrogate = None
+    modelLoadingError = None
+    modelLoadingThread = Thread(target=loadSurrogateModel, daemon=True)
+    modelLoadingThread.start()
 
-# # CREATE THE MIN-MAX NORMALIZER
-normalizer = normalization.getNormalizerForSurrogateModel()
 
+    matplotlib.rcParams.update({'font.size': 14})
+    matplotlib.rc('font', family='TimesNewRomman')
+    matplotlib.rcParams["font.family"] = "Times New Roman"
+    matplotlib.rc('font', size=10) #controls default text size
+    matplotlib.rc('axes', titlesize=10) #fontsize of the title
+    matplotlib.rc('axes', labelsize=10) #fontsize of the x and y labels
+    matplotlib.rc('xtick', labelsize=10) #fontsize of the x tick labels
+    matplotlib.rc('ytick', labelsize=10) #fontsize of the y tick labels
+    matplotlib.rc('legend', fontsize=10) #fontsize of the legend
 
-plt.rcParams.update({'font.size': 14})
-plt.rc('font', family='TimesNewRomman')
-plt.rcParams["font.family"] = "Times New Roman"
-plt.rc('font', size=10) #controls default text size
-plt.rc('axes', titlesize=10) #fontsize of the title
-plt.rc('axes', labelsize=10) #fontsize of the x and y labels
-plt.rc('xtick', labelsize=10) #fontsize of the x tick labels
-plt.rc('ytick', labelsize=10) #fontsize of the y tick labels
-plt.rc('legend', fontsize=10) #fontsize of the legend
+    # DEFINE THE AXES OBJECT
+    axes = figure.add_subplot()
 
-# DEFINE THE AXES OBJECT
-axes = figure.add_subplot()
+    # STYLE FOR THE PLOT
+    axes.set_title('Pushover curve (model loading...)')
+    axes.set_xlabel('Displacement [mm]')
+    axes.set_ylabel('Base Shear [kN]')
+    axes.set_xlim(-1, 21)
+    axes.grid(linestyle='--')
 
-# STYLE FOR THE PLOT
-axes.set_title('Pushover curve')
-axes.set_xlabel('Displacement [mm]')
-axes.set_ylabel('Base Shear [kN]')
-axes.set_autoscaley_on(True)
-axes.set_xlim(-1, 21)
-axes.grid(linestyle='--')
+    figure.set_tight_layout(True)
 
-figure.set_tight_layout(True)
+    # THE PREDICTED CURVE AND THE LAST 20 PREDICTIONS ARE DRAWN INCREMENTALLY (BLITTING)
+    pushoverPlot = pushoverCurvePlot.PushoverCurvePlot(axes, nGhosts=20)
+
+    # THIS FUNTIONS PLOTS THE CURRENT PUSHOVER CURVE INTO THE PLOT
+    plotCurrentPushoverCurve()
 
-# THIS FUNTIONS PLOTS THE CURRENT PUSHOVER CURVE INTO THE PLOT
-newLine = None
-plotCurrentPushoverCurve()
 
+    # # FINISH INITIALIZATION
+    init = True
 
-# # FINISH INITIALIZATION
-init = True
+    # DRAW ALL THE LAYERS IN THE FIRST FRAME
+    scheduler.request()
 
-addTextToConsole("...Program Initialized...  ["+programVersion+", Dec 2022]")
-addTextToConsole("Program Goal: Predicting the NL-response of RC Shear Walls using Artificial Neural Networks")
-addTextToConsole("Developed by: Ph.D. Candidate German Solorzano Ramirez, and Dr. Vagelis Plevris")
-addTextToConsole("Sponsored by: Oslo Metropolitan University (OsloMet), Department of Civil Engineering and Energy Technology ")
-addTextToConsole("")
+    addTextToConsole("...Program Initialized...  ["+programVersion+", Dec 2022]")
+    addTextToConsole("Program Goal: Predicting the NL-response of RC Shear Walls using Artificial Neural Networks")
+    addTextToConsole("Developed by: Ph.D. Candidate German Solorzano Ramirez, and Dr. Vagelis Plevris")
+    addTextToConsole("Sponsored by: Oslo Metropolitan University (OsloMet), Department of Civil Engineering and Energy Technology ")
+    addTextToConsole("")
+    addTextToConsole("Loading the surrogate model...")
+
+    text_box.config(state="disabled")
 
-text_box.config(state="disabled")
+    # wait for the surrogate model from the main loop
+    root.after(50, checkSurrogateModel)
 
-root.mainloop()
+    root.mainloop()
 
 
 
@@ -0,0 +1,247 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+CampaignManifest.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# A sampling campaign is a numbered list of data points (index 0, 1, 2, ...) that are generated from a single campaign seed.
+# The input vector of every index is always the same for a given campaign seed and sampling method, so a campaign can be stopped and resumed at any time.
+# The sampling method can be "random" (independent values for every sample), or one of the extensible sequences of "DesignOfExperiments.py" ("sobol" or "halton"),
+# for which the first points do not change when the number of samples of the campaign is increased.
+
+# The manifest is a csv file where one row is appended every time a sample is started or finished. The last row of an index is its current state.
+# The columns are: index, seed, method, attempt, solver, status, maxDisp, wallTime, and timestamp
+# The status of a sample can be:
+    # started  -> the analysis was sent to a worker (if the run is killed, the sample is started again when the campaign is resumed)
+    # done     -> the curve converged to more than 10 mm and it is stored in the database file
+    # diverged -> the curve did not reach 10 mm
+    # failed   -> OpenSees raised an error
+# The samples that diverge or fail are retried with the next solver configuration in "solverConfigurations" before giving up.
+# The pushover uses the fixed increment of the configuration (the points stay on the same grid as the existing database), and maxUnconvergedSteps
+# is the number of steps that fail before giving up. With the option "recoverSteps" (False by default) a step that fails is tried again
+# with the fallback algorithms and sub-steps of "PushoverDriver.recoverStep". With the option "adaptive" (False by default, see "PushoverDriver.py") the increment is the initial step of the
+# adaptive pushover, whose steps are snapped to the stations of the discretization.
+
+import os
+import csv
+import time
+import random as rnd
+import ParallelDataBase as parallelDB
+import DesignOfExperiments as doe
+
+# the solver configurations that are used on every attempt (the first one is the default analysis)
+solverConfigurations = [{"algorithm": 'NewtonLineSearch', "incrementFactor": 1.0,  "maxUnconvergedSteps": 10},
+                        {"algorithm": 'KrylovNewton',     "incrementFactor": 0.5,  "maxUnconvergedSteps": 20},
+                        {"algorithm": 'ModifiedNewton',   "incrementFactor": 0.25, "maxUnconvergedSteps": 40}]
+
+manifestColumns = ["index", "seed", "method", "attempt", "solver", "status", "maxDisp", "wallTime", "timestamp"]
+
+
+# the seed of a sample is computed from the seed of the campaign and the index of the sample
+def getSampleSeed(campaignSeed, index):
+    return (campaignSeed * 1000003 + index) % 4294967296
+
+
+# the input vector of a sample with the "random" method (always the same for the same campaign seed and index)
+def getSampleInputVector(campaignSeed, index):
+    rng = rnd.Random(getSampleSeed(campaignSeed, index))
+    return parallelDB.getRandomInputVector(rng)
+
+
+# the input vectors of the first nSamples of a campaign
+def getCampaignInputVectors(campaignSeed, nSamples, samplingMethod="random"):
+    if samplingMethod == "random":
+        return [getSampleInputVector(campaignSeed, i) for i in range(nSamples)]
+    if samplingMethod in ("sobol", "halton"):
+        return doe.generateDesign(nSamples, samplingMethod, seed=campaignSeed).tolist()
+    raise ValueError("The sampling method of a campaign must be 'random', 'sobol' or 'halton' (the first points of the design can not change when the campaign grows)")
+
+
+# the analysis options of a given attempt (the increment is reduced according to the solver configuration)
+def getAttemptOptions(options, attempt):
+    solver = solverConfigurations[attempt]
+    attemptOptions = dict(options)
+    attemptOptions["algorithm"] = solver["algorithm"]
+    attemptOptions["maxUnconvergedSteps"] = solver["maxUnconvergedSteps"]
+    attemptOptions["increment"] = options.get("increment",0.0001) * solver["incrementFactor"]
+    attemptOptions["attempt"] = attempt
+    return attemptOptions
+
+
+class CampaignManifest():
+
+    def __init__(self, pathToFile):
+        self.pathToFile = pathToFile
+        # last record of every index
+        self.records = {}
+        self.load()
+
+    # read the manifest file (the last row of every index is kept)
+    def load(self):
+        self.records = {}
+        if not os.path.exists(self.pathToFile):
+            return
+
+        with open(self.pathToFile, newline='') as f:
+            for row in csv.DictReader(f):
+                # an incomplete row (the run was killed while writing) is ignored
+                if row["timestamp"] is None or row["timestamp"] == "":
+                    continue
+                self.records[int(row["index"])] = row
+
+    # append a row to the manifest and update the state of the sample
+    def record(self, index, seed, method, attempt, status, maxDisp=0, wallTime=0):
+        newFile = not os.path.exists(self.pathToFile)
+        row = {"index": index,
+               "seed": seed,
+               "method": method,
+               "attempt": attempt,
+               "solver": solverConfigurations[attempt]["algorithm"],
+               "status": status,
+               "maxDisp": round(maxDisp,4),
+               "wallTime": round(wallTime,3),
+               "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+        with open(self.pathToFile, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=manifestColumns)
+            if newFile:
+                writer.writeheader()
+            writer.writerow(row)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.records[index] = {k: str(v) for k, v in row.items()}
+
+    def getStatus(self, index):
+        if index in self.records:
+            return self.records[index]["status"]
+        return None
+
+    def getAttempt(self, index):
+        return int(self.records[index]["attempt"])
+
+    # the samples with a final status are not run again
+    def isFinished(self, index):
+        status = self.getStatus(index)
+        if status == "done":
+            return True
+        if status in ("diverged", "failed"):
+            return self.getAttempt(index) + 1 >= len(solverConfigurations)
+        return False
+
+    # list of (index, attempt) that must be run to complete a campaign of nSamples
+    def getPendingSamples(self, nSamples):
+        pending = []
+        for index in range(nSamples):
+            if self.isFinished(index):
+                continue
+            status = self.getStatus(index)
+            if status is None:
+                pending.append((index, 0))
+            elif status == "started":
+                # the run was killed during this attempt, repeat it
+                pending.append((index, self.getAttempt(index)))
+            else:
+                pending.append((index, self.getAttempt(index) + 1))
+        return pending
+
+    # number of samples with each status
+    def getSummary(self):
+        summary = {}
+        for row in self.records.values():
+            summary[row["status"]] = summary.get(row["status"],0) + 1
+        return summary
+
+    # the database is written before the manifest, so if the run was killed between both writes the last data point in the database
+    # belongs to a sample that is still marked as "started". In that case, the sample is marked as done to avoid a duplicated analysis.
+    def reconcileWithDataBase(self, dataBase, inputVectors):
+        lastParams = dataBase.getLastParams()
+        if lastParams is None:
+            return
+
+        for index, row in list(self.records.items()):
+            if row["status"] != "started":
+                continue
+            if index < len(inputVectors) and inputVectors[index] == lastParams:
+                self.record(index, int(row["seed"]), row["method"], int(row["attempt"]), "done")
+
+
+# run (or resume) a campaign of nSamples using the parallel workers
+# the curves are appended to the database file (csv file, or binary curve store if the path ends with ".curves") and the state of every sample is stored in the manifest
+# samplingMethod -> "random", "sobol" or "halton"
+# minDisp -> only the curves that converge to more than this displacement (in mm) are stored
+def runCampaign(campaignSeed, nSamples, pathToDataBase, pathToManifest, nWorkers=None, options=None, minDisp=10, samplingMethod="random"):
+
+    if options is None:
+        options = {}
+
+    dataBase = parallelDB.openDataBase(pathToDataBase)
+    manifest = CampaignManifest(pathToManifest)
+
+    # a manifest can only be resumed with the same campaign seed and sampling method
+    for index, row in manifest.records.items():
+        if int(row["seed"]) != getSampleSeed(campaignSeed, index) or row["method"] != samplingMethod:
+            raise ValueError("The manifest "+pathToManifest+" was created with a different campaign seed or sampling method")
+
+    inputVectors = getCampaignInputVectors(campaignSeed, nSamples, samplingMethod)
+    manifest.reconcileWithDataBase(dataBase, inputVectors)
+
+    pending = manifest.getPendingSamples(nSamples)
+    print("Campaign seed:", campaignSeed, "  samples:", nSamples, "  pending:", len(pending), "  summary:", manifest.getSummary())
+
+    # create the job of an attempt and mark it as started in the manifest
+    def createJob(index, attempt):
+        manifest.record(index, getSampleSeed(campaignSeed, index), samplingMethod, attempt, "started")
+        return (index, inputVectors[index], getAttemptOptions(options, attempt))
+
+    jobs = [createJob(index, attempt) for index, attempt in pending]
+    startTime = time.time()
+    counter = {"finished": 0}
+
+    # the writer, executed in the main process every time a worker finishes an analysis
+    def writeResult(job, x, y, wallTime, error):
+        index, params, attemptOptions = job
+        attempt = attemptOptions["attempt"]
+        seed = getSampleSeed(campaignSeed, index)
+        counter["finished"] = counter["finished"] + 1
+
+        maxX = max(x) if len(x) > 0 else 0
+        if error is not None:
+            status = "failed"
+        elif maxX > minDisp:
+            status = "done"
+            dataBase.append(params, x, y)
+        else:
+            status = "diverged"
+
+        manifest.record(index, seed, samplingMethod, attempt, status, maxX, wallTime)
+        parallelDB.printProgress(index, counter["finished"], len(jobs), maxX, wallTime, startTime)
+
+        # retry the sample with the next solver configuration
+        if status != "done" and attempt + 1 < len(solverConfigurations):
+            print("   retrying sample", index, "with", solverConfigurations[attempt+1]["algorithm"])
+            return [createJob(index, attempt + 1)]
+        return None
+
+    try:
+        parallelDB.runJobs(jobs, writeResult, nWorkers)
+    finally:
+        dataBase.close()
+
+    print("Campaign summary:", manifest.getSummary())
+    return manifest
@@ -22,11 +22,88 @@ Department of Civil Engineering and Energy Technology
 # This script contains various function to visualize the results of the FEM analysis   
 # The analysis results are recorded in text files and then this routines can be used to plot stress and strain fields
 # the visuallization functions in this file are mostly adaptted for 2D RC shear walls. However, it can be easiliy modified for other elements (even 3D solid models) 
+# the fields can also be given as arrays with one column per step, for example the fields captured in memory with "FieldCapture.py" (capture.getColumns("strains"))
+# "colorMapRun" and "colorMapVariousRun" read the fields and the discretization from the results handle of a run (see "RunResults.py")
+# the connectivity, the triangles and the sparse averaging matrix of a mesh are computed once, so the nodal averaging is a single matrix product
 
+import functools
 from matplotlib import cm
 import matplotlib.pyplot as plt
 import numpy as np
 
+# the field with one column per step, read from the file of an OpenSees recorder or given as an array
+def loadField(source):
+    if isinstance(source, str):
+        return np.loadtxt(source, delimiter=' ', unpack="False")
+    return np.asarray(source)
+
+
+# MESH OF THE WALL
+# the arrays below only depend on the discretization (nv x nh shell elements), so they are computed once per mesh and shared by all the plots
+# the nodes are numbered row by row and the elements column by column from the bottom left corner (as in "ShearWallParametrizedAsFunction.py")
+
+# connectivity of the shell elements, array (nEles, 4) with the index (from 0) of the 4 nodes of every element
+@functools.lru_cache(maxsize=16)
+def getConnectivity(nv,nh):
+    hLines = nh+1
+    k, i = np.meshgrid(np.arange(nh), np.arange(nv), indexing='ij')
+    n1 = (hLines*i + k).reshape(-1)
+    conn = np.column_stack((n1, n1+1, n1+hLines+1, n1+hLines))
+    conn.setflags(write=False)
+    return conn
+
+# triangles of the mesh for "tripcolor" (2 triangles per element)
+@functools.lru_cache(maxsize=16)
+def getTriangles(nv,nh):
+    conn = getConnectivity(nv,nh)
+    t = np.empty((2*len(conn),3), dtype=int)
+    t[0::2] = conn[:,[0,1,2]]
+    t[1::2] = conn[:,[2,3,0]]
+    t.setflags(write=False)
+    return t
+
+# sparse matrix (nNodes x nEles*4) that maps the values of the elements at their 4 nodes to the nodes
+# average=True -> average of the elements that share a node, average=False -> sum
+@functools.lru_cache(maxsize=16)
+def getAveragingMatrix(nv,nh,average=True):
+    from scipy import sparse
+    conn = getConnectivity(nv,nh)
+    nNodes = (nv+1)*(nh+1)
+    rows = conn.reshape(-1)
+    if average:
+        weights = 1.0/np.bincount(rows, minlength=nNodes)[rows]
+    else:
+        weights = np.ones(len(rows))
+    return sparse.csr_matrix((weights,(rows,np.arange(len(rows)))), shape=(nNodes,len(rows)))
+
+# undeformed coordinates of the nodes of the wall, array (nNodes, 2)
+def getNodeCoordinates(ops,nv,nh):
+    nNodes = (nv+1)*(nh+1)
+    coords = np.empty((nNodes,2))
+    for n in range(nNodes):
+        c = ops.nodeCoord(n+1)
+        coords[n,0] = c[0]
+        coords[n,1] = c[1]
+    return coords
+
+# current displacements of the nodes of the wall (dof 1 and 2), array (nNodes, 2)
+def getNodeDisplacements(ops,nv,nh):
+    nNodes = (nv+1)*(nh+1)
+    disp = np.empty((nNodes,2))
+    for n in range(nNodes):
+        d = ops.nodeDisp(n+1)
+        disp[n,0] = d[0]
+        disp[n,1] = d[1]
+    return disp
+
+# color limits of a map (15% margin)
+def getColorLimits(v):
+    minValue = np.min(v)
+    maxValue = np.max(v)
+    p = (maxValue-minValue) * 0.15
+    return minValue-p, maxValue+p
+
+
 # plot the color map of a given quantity
 # file -> the results as stored by the OpeenSees recorder (each row is one analysis step that contains the information for all the elements/nodes)
 # comp -> the component of the stress/strain (for example for stress, sx=1, sy=2)
@@ -35,160 +112,61 @@ import numpy as np
 def colorMap(ops,nv,nh,file,comp, scale=100, title="",row=-1):
     
     # get the average at the nodes (the numering is the same as it is in the opensees model)
-    avg = getNodalAverage(ops,nv,nh,file,comp,row)
-  
-    # x coordinates
-    x = []
-    # y coordinates
-    y = []
-    # z coordinates
-    z = [] 
-    # triangles indices
-    t = []
-    # color value
-    v = []
+    v = getNodalAverage(ops,nv,nh,file,comp,row)
     
-    nodes = ops.getNodeTags()         
-    for n in nodes:
-        coords = ops.nodeCoord(n)
-        disp = ops.nodeDisp(n)
-        coords[0] = coords[0] + disp[0]*scale
-        coords[1] = coords[1] + disp[1]*scale
-        coords[2] = coords[2] + disp[2]*scale
-        x.append(coords[0])
-        y.append(coords[1]) 
-        z.append(coords[2])
-        v.append(avg[n-1])
-      
-    hLines=nh+1
-    for k in range(nh):
-        for i in range(nv):
-            n1 = hLines*(i)+k
-            n2 = hLines*(i)+k+1
-            n3 = hLines*(i+1)+k+1
-            n4 = hLines*(i+1)+k
-            triangle1 = [n1,n2,n3]  
-            triangle2 = [n1,n4,n3]
-            t.append(triangle1)
-            t.append(triangle2)
-        
-    t = np.asarray(t)     
-    minValue = min(v)
-    maxValue = max(v)
-    p = (maxValue-minValue) * 0.15
+    # deformed shape with the current displacements of the model
+    coords = getNodeCoordinates(ops,nv,nh) + getNodeDisplacements(ops,nv,nh)*scale
+    minValue, maxValue = getColorLimits(v)
     
     plt.figure()
     plt.gca().set_aspect('equal')
-    plt.tripcolor(x,y,t,v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue-p, vmax=maxValue+p)
+    plt.tripcolor(coords[:,0],coords[:,1],getTriangles(nv,nh),v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue, vmax=maxValue)
     plt.colorbar()
     plt.title(title)
 
     plt.show()
     
     
-  
+# forces of the shell elements, array (nEles, 24) (6 dof at each of the 4 nodes)
+def getElementForces(ops,nv,nh):
+    elements = ops.getEleTags()[0:nh*nv] 
+    return np.array([ops.eleForce(e) for e in elements])
 
+# average at the nodes of the force "dof" of the elements
 def getForceAverage(ops,nv,nh, dof):
-    
-    lastIndex = nh*nv;
-    hLines = nh+1
-    vLines = nv+1
-    
-    elements = ops.getEleTags()[0:lastIndex] 
-    
-    # wich indices from the element vector force should be used for averaging?
-    indices = []
-    for i in range(4):
-        indices.append(i*6+dof)
-    nodalValues = np.zeros((hLines*vLines,2));
- 
-    # do the averaging first
-    for e in elements:
-        forces = ops.eleForce(e)
-        nodes = ops.eleNodes(e)
-        # average at node
-        for i in range(4):
-            nodeIndex = nodes[i]-1
-            nodalValues[nodeIndex,0] = nodalValues[nodeIndex,0] + forces[indices[i]];
-            nodalValues[nodeIndex,1] = nodalValues[nodeIndex,1] + 1
-    
-    avg = np.zeros(hLines*vLines); 
-    for i in range(len(avg)):
-        avg[i] = nodalValues[i,0]/nodalValues[i,1]
-    
-    return avg;
+    forces = getElementForces(ops,nv,nh)
+    return getAveragingMatrix(nv,nh) @ forces[:,dof::6].reshape(-1)
  
+# sum at the nodes of the force "dof" of the elements
 def getForceAverage2(ops,nv,nh, dof):
-    
-    lastIndex = nh*nv;
-    hLines = nh+1
-    vLines = nv+1
-    
-    elements = ops.getEleTags()[0:lastIndex] 
-    
-    # wich indices from the element vector force should be used for averaging?
-    indices = []
-    for i in range(4):
-        indices.append(i*6+dof)
-    nodalValues = np.zeros((hLines*vLines));
- 
-    # do the averaging first
-    for e in elements:
-        forces = ops.eleForce(e)
-        nodes = ops.eleNodes(e)
-        # average at node
-        for i in range(4):
-            nodeIndex = nodes[i]-1
-            nodalValues[nodeIndex] = nodalValues[nodeIndex] + forces[indices[i]];
-
-    return nodalValues;     
+    forces = getElementForces(ops,nv,nh)
+    return getAveragingMatrix(nv,nh,False) @ forces[:,dof::6].reshape(-1)
  
     
 # perform the averaging of the stress/strain at the nodes
+# file -> recorder file or field already loaded (see "loadField"), row -> step
 def getNodalAverage(ops,nv,nh,file,comp,row=-1):
     
-    nEles = nh*nv;
-    hLines = nh+1
-    vLines = nv+1
+    test = loadField(file)
+    test = test[:,row]
     
-    test = np.loadtxt(file, delimiter=' ', unpack="False")
+    return getNodalAverageStep(ops,nv,nh,test,comp)
 
 
-    #ncols = len(test[0])
-    #print("ncols",ncols)
-    
-    test = test[:,row]
-    #print(test)
-    
-    skip = 32
-    stress = np.zeros((nEles,skip))
-    for i in range(nEles):
-        c = skip*i
-        stress[i,:] = test[c:c+skip]
-  
-    # wich indices from the element vector force should be used for averaging?
-    indices = []
-    for i in range(4):
-        indices.append(i*8+ comp)
-
-    elements = ops.getEleTags()[0:nEles] 
-    nodalValues = np.zeros((hLines*vLines,2));
-
-    # do the averaging first
-    for e in elements:
-        #forces = ops.eleForce(e)
-        nodes = ops.eleNodes(e)
-        # average at node
-        for i in range(4):
-            nodeIndex = nodes[i]-1
-            nodalValues[nodeIndex,0] = nodalValues[nodeIndex,0] + stress[e-1,indices[i]];
-            nodalValues[nodeIndex,1] = nodalValues[nodeIndex,1] + 1
-    
-    avg = np.zeros(hLines*vLines); 
-    for i in range(len(avg)):
-        avg[i] = nodalValues[i,0]/nodalValues[i,1]
-        
-    return avg    
+# averaging of the stress/strain at the nodes for the values of one step (nEles*32 values)
+# the value of the integration point i of an element is assigned to its node i
+def getNodalAverageStep(ops,nv,nh,test,comp):
+    values = np.asarray(test).reshape(nh*nv,32)[:,comp::8]
+    return getAveragingMatrix(nv,nh) @ values.reshape(-1)
+
+
+# averaging of the stress/strain at the nodes for all the steps at once
+# values -> array (steps, nEles, 32) (for example "FieldStore.getField"), returns an array (steps, nNodes)
+def getNodalAverageAll(nv,nh,values,comp):
+    values = np.asarray(values)
+    nSteps = len(values)
+    component = values[:,:,comp::8].reshape(nSteps,-1)
+    return np.asarray((getAveragingMatrix(nv,nh) @ component.T).T)
 
 
 # plot the progression of the stress/strain field in multi-plot figure
@@ -212,8 +190,8 @@ def colorMapVarious(ops,nv,nh,fileStrain,fileDisp,comp,scale=100, title=""):
     ## add a title to the figure
     figure.suptitle(title, fontsize=16)
     
-    dataStrain = np.loadtxt(fileStrain, delimiter=' ', unpack="False")
-    dataDisp = np.loadtxt(fileDisp, delimiter=' ', unpack="False")
+    dataStrain = loadField(fileStrain)
+    dataDisp = loadField(fileDisp)
     
     # total number of values
     ncols = len(dataStrain[0])
@@ -227,74 +205,28 @@ def colorMapVarious(ops,nv,nh,fileStrain,fileDisp,comp,scale=100, title=""):
                 0.50,
                 1]
 
+    coords = getNodeCoordinates(ops,nv,nh)
+    t = getTriangles(nv,nh)
+
     # store the maximum horizontal displacemt
     maxDx = 0
     count = 0
     for jr in range(2):
         for jc in range(3):
             
-            index = int(stations[count]*ncols)
-            if index>0:
-                index = index-1
+            index = getStepIndex(stations[count], ncols)
             
-            avg = getNodalAverage(ops,nv,nh,fileStrain,comp,index)
-            dispRow = dataDisp[:,index]
+            v = getNodalAverageStep(ops,nv,nh,dataStrain[:,index],comp)
             
-            skip = 6
-            nNodes = (nv+1)*(nh+1)
-            nodeDisp = np.zeros((nNodes,skip))
-            for t in range(nNodes):
-                c = skip*t
-                nodeDisp[t,:] = dispRow[c:c+skip]
-             
-            # x coordinates
-            x = []
-            # y coordinates
-            y = []
-            # z coordinates
-            z = [] 
-            # triangles indices
-            t = []
-            # color value
-            v = []
-            nodes = ops.getNodeTags()         
-            for n in nodes:
-                coords = ops.nodeCoord(n)
-                disp = ops.nodeDisp(n)
-                dx = nodeDisp[n-1,0]
-                dy = nodeDisp[n-1,1]
-                dz = 0
-                coords[0] = coords[0] + dx*scale
-                coords[1] = coords[1] + dy*scale
-                coords[2] = coords[2] + dz*scale
-                
-                if dx>maxDx:
-                    maxDx = dx
-                
-                x.append(coords[0])
-                y.append(coords[1]) 
-                z.append(coords[2])
-                v.append(avg[n-1])
-              
-            hLines=nh+1
-            for k in range(nh):
-                for i in range(nv):
-                    n1 = hLines*(i)+k
-                    n2 = hLines*(i)+k+1
-                    n3 = hLines*(i+1)+k+1
-                    n4 = hLines*(i+1)+k
-                    triangle1 = [n1,n2,n3]  
-                    triangle2 = [n3,n4,n1]
-                    t.append(triangle1)
-                    t.append(triangle2)
-                
-    
-            t = np.asarray(t)     
-            minValue = min(v)
-            maxValue = max(v)
-            p = (maxValue-minValue) * 0.15
+            # 2 values per node (dof 1 and 2)
+            nodeDisp = dataDisp[:,index].reshape(-1,2)
+            maxDx = max(maxDx, np.max(nodeDisp[:,0]))
+            x = coords[:,0] + nodeDisp[:,0]*scale
+            y = coords[:,1] + nodeDisp[:,1]*scale
+            
+            minValue, maxValue = getColorLimits(v)
              
-            plot = ax[jr,jc].tripcolor(x,y,t,v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue-p, vmax=maxValue+p)
+            plot = ax[jr,jc].tripcolor(x,y,t,v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue, vmax=maxValue)
             ax[jr,jc].set_title("dx = "+ str( round(stations[count]*maxDx*1000,3)) +" (" +str(stations[count]*100)+"%)" )
             ax[jr,jc].axis('equal')
             plt.colorbar(plot,ax=ax[jr,jc])
@@ -306,99 +238,60 @@ def colorMapVarious(ops,nv,nh,fileStrain,fileDisp,comp,scale=100, title=""):
 
 def colorMapOne(ops,nv,nh,axes,fileStrain,fileDisp,comp,station,scale=100, title=""):
     
-    dataStrain = np.loadtxt(fileStrain, delimiter=' ', unpack="False")
-    dataDisp = np.loadtxt(fileDisp, delimiter=' ', unpack="False")
+    dataStrain = loadField(fileStrain)
+    dataDisp = loadField(fileDisp)
     
     # total number of values
     ncols = len(dataStrain[0])
     
-    # define some stations at which the field is going to be plotted
-    # the size of this array must correspond to the number of subplots
-
-    # store the maximum horizontal displacemt
-    maxDx = 0
-    count = 0
+    index = getStepIndex(station, ncols)
     
-            
-    index = int(station*ncols)
+    return colorMapStep(ops,nv,nh,axes,dataStrain[:,index],dataDisp[:,index],comp,station,scale=scale)
+
+
+# index of the step at the given station (fraction of the recorded steps, from 0 to 1)
+def getStepIndex(station, nSteps):
+    index = int(station*nSteps)
     if index>0:
         index = index-1
+    return index
+
+
+# color map of the values of one step (nEles*32 values of the strain/stress and nNodes*2 values of the displacements)
+def colorMapStep(ops,nv,nh,axes,stepValues,dispRow,comp,station,scale=100):
     
-    avg = getNodalAverage(ops,nv,nh,fileStrain,comp,index)
-    dispRow = dataDisp[:,index]
+    v = getNodalAverageStep(ops,nv,nh,stepValues,comp)
     
-    skip = 6
-    nNodes = (nv+1)*(nh+1)
-    nodeDisp = np.zeros((nNodes,skip))
-    for t in range(nNodes):
-        c = skip*t
-        nodeDisp[t,:] = dispRow[c:c+skip]
-     
-    # x coordinates
-    x = []
-    # y coordinates
-    y = []
-    # z coordinates
-    z = [] 
-    # triangles indices
-    t = []
-    # color value
-    v = []
-    nodes = ops.getNodeTags()         
-    for n in nodes:
-        coords = ops.nodeCoord(n)
-        disp = ops.nodeDisp(n)
-        dx = nodeDisp[n-1,0]
-        dy = nodeDisp[n-1,1]
-        dz = 0
-        coords[0] = coords[0] + dx*scale
-        coords[1] = coords[1] + dy*scale
-        coords[2] = coords[2] + dz*scale
-        
-        if dx>maxDx:
-            maxDx = dx
-        
-        x.append(coords[0])
-        y.append(coords[1]) 
-        z.append(coords[2])
-        v.append(avg[n-1])
-      
-    hLines=nh+1
-    for k in range(nh):
-        for i in range(nv):
-            n1 = hLines*(i)+k
-            n2 = hLines*(i)+k+1
-            n3 = hLines*(i+1)+k+1
-            n4 = hLines*(i+1)+k
-            triangle1 = [n1,n2,n3]  
-            triangle2 = [n3,n4,n1]
-            t.append(triangle1)
-            t.append(triangle2)
-        
-
-    # fig, ax, = plt.subplots()
+    # 2 values per node (dof 1 and 2)
+    nodeDisp = np.asarray(dispRow).reshape(-1,2)
+    coords = getNodeCoordinates(ops,nv,nh)
+    x = coords[:,0] + nodeDisp[:,0]*scale
+    y = coords[:,1] + nodeDisp[:,1]*scale
     
-    t = np.asarray(t)     
-    minValue = min(v)
-    maxValue = max(v)
-    p = (maxValue-minValue) * 0.15
+    # store the maximum horizontal displacemt
+    maxDx = max(0, np.max(nodeDisp[:,0]))
+    
+    minValue, maxValue = getColorLimits(v)
      
-    plot = axes.tripcolor(x,y,t,v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue-p, vmax=maxValue+p)
+    plot = axes.tripcolor(x,y,getTriangles(nv,nh),v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue, vmax=maxValue)
     axes.set_title("dx = "+ str( round(station*maxDx*1000,3)) +" (" +str( round(station*100,3))  +"%)" )
     axes.axis('equal')
-    # plt.colorbar(plot,ax=axes)
-    
-    # plt.tight_layout()   
-    
-    # plot = ax.tripcolor(x,y,t,v,edgecolors='black',shading='gouraud',cmap=cm.jet,vmin=minValue-p, vmax=maxValue+p)
-    # ax.set_title("dx = "+ str( round(station*maxDx*1000,3)) +" (" +str(station*100)+"%)" )
-    # ax.axis('equal')
-    # plt.colorbar(plot,ax=ax)
-    # # plt.tight_layout()   
     
     return plot
   
 
+# color map of a field of a run on the given axes
+# results -> "RunResults.RunResults" handle given to "ShearWallParametrizedAsFunction.run"
+# field -> "strains" or "stresses"
+# the values of the selected step are a slice of the field store of the run (no parsing)
+def colorMapRun(ops,results,axes,field,comp,station,scale=100):
+    store = results.getStore()
+    index = getStepIndex(station, store.nSteps)
+    return colorMapStep(ops,results.meshV,results.meshH,axes,store.getStep(field,index),store.getStep("disp",index),comp,station,scale=scale)
+
+# progression of a field of a run in a multi-plot figure
+def colorMapVariousRun(ops,results,comp,field="strains",scale=100,title=""):
+    return colorMapVarious(ops,results.meshV,results.meshH,results.getColumns(field),results.getColumns("disp"),comp,scale=scale,title=title)
 
         
 
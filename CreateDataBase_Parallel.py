@@ -0,0 +1,85 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+CreateDataBase_Parallel.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Parallel version of the script "CreateDataBase_Loop.py".
+# It generates random data points, performs the static pushover analyses using several worker processes (one OpenSeesPy interpreter per process),
+# and stores the results in the same file and with the same format (3 rows per data point).
+
+# The data points are generated as a seeded campaign: the input vector of every sample is computed from the campaign seed and the sample index,
+# and the state of every sample (started, done, diverged, failed), its wall time and the solver used are stored in the manifest file.
+# The script can be stopped at any time (Ctrl+C or killing the process). When it is re-run with the same seed, the finished samples are skipped,
+# and the samples that diverged or failed are retried with a different solver configuration (see "CampaignManifest.py").
+
+# The generated file must be processed by the script "DiscretizeCurvesAndCreateDatabase.py" to create the training database with one row per data point
+
+
+import CampaignManifest as campaign
+
+
+# the guard is required because the worker processes import this file again when they are created
+if __name__ == "__main__":
+
+    # number of samples of the campaign (the samples that diverge are not stored in the database file)
+    samples = 3
+
+    # seed of the campaign (use the same seed to resume a campaign)
+    campaignSeed = 2022
+
+    # space-filling design used to select the input vectors ("sobol", "halton" or "random"), see "DesignOfExperiments.py"
+    samplingMethod = "sobol"
+
+    # number of worker processes (None -> one per core)
+    nWorkers = None
+
+    # File with the FEM analysis database
+    fileName = "database_complete.csv"
+    ResultsDir = 'AnalysisResults'
+    pathToFile = ResultsDir+"/"+fileName
+
+    # File with the state of every sample of the campaign
+    pathToManifest = ResultsDir+"/"+"campaign_manifest.csv"
+
+    # parameters for the static pushover analysis
+    targetDisp = 0.02
+    steps = 200
+    increment = targetDisp/steps
+
+    # discretization size (number of elements in each direction)
+    options = {"meshHorizontal": 8,   # total elements in horizontal direction
+               "meshBE": 2,           # from the total elements this number is used for each boundary element
+               "meshVertical": 10,
+               "targetDisp": targetDisp,
+               "increment": increment,
+               # fixed increment (same grid of points as the existing database), the adaptive step size is opt-in
+               "adaptive": False,
+               # the failed steps are not retried with the fallback algorithms and sub-steps (same analysis as the existing database)
+               "recoverSteps": False,
+               # early abort of the samples that will not reach 10 mm (they are not stored in the database anyway)
+               "abortMinDisp": 10,
+               "maxIterations": 20000,
+               "maxWallTime": 600,
+               # a worker that is still busy after this time (seconds) is killed and its sample is reported as failed (None to disable it)
+               "jobTimeout": 1200,
+               # folder with the telemetry of every analysis (iterations, norm and wall time of every step), None to disable it
+               "telemetryDir": None}
+
+    # the samples already finished in the manifest are not computed again
+    campaign.runCampaign(campaignSeed, samples, pathToFile, pathToManifest, nWorkers, options, samplingMethod=samplingMethod)
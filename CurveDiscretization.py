@@ -0,0 +1,128 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+CurveDiscretization.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Functions to discretize the pushover curves obtained from the FEM analysis into the output values of the surrogate model.
+# The rules are the same as in the original version of the script "DiscretizeCurvesAndCreateDatabase.py":
+    # the value at each station is the first point of the curve that is past the station (or a linear interpolation, optionally)
+    # if the analysis did not converge until a station, the base shear is taken as the one of the previous station multiplied by 1.055
+    # if the base shear at the last station is less than at the previous one (numerical innestabilities), it is also taken as the previous one multiplied by 1.055
+# The function "discretizeCurves" works on a batch of curves with numpy operations (no python loops over the points), so the whole database
+# is discretized in a fraction of a second and it can be re-discretized with a different set of stations at any time.
+
+import numpy as np
+
+# STATIONS WHERE THE PUSHOVER CURVE IS CUT FOR THE DISCRETIZATION (displacement in mm)
+stations = [0,0.5,1.0,2.5,5,10,19.5]
+
+# factor used to complete the base shear at the last station when the analysis did not converge until that displacement
+extrapolationFactor = 1.055
+
+
+# discretize a batch of pushover curves at once
+# the curves are given as flat arrays (like in "CurveStore.py"): the curve i is x[offsets[i]:offsets[i+1]] and y[offsets[i]:offsets[i+1]]
+# stations -> displacements (mm) where the curves are cut
+# minDisp -> the curves that did not converge to this displacement (mm) are marked as not valid
+# interpolate -> False: take the first point of the curve that is past each station (the original rule)
+#                True: interpolate linearly between the points before and after each station
+# returns the x and y values of the discretized curves (arrays of shape (nCurves, nStations)) and a boolean array with the valid curves
+def discretizeCurves(x, y, offsets, stations=stations, minDisp=10, interpolate=False):
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    stations = np.asarray(stations, dtype=float)
+
+    nCurves = len(offsets)-1
+    nStations = len(stations)
+    starts = offsets[0:-1]
+    ends = offsets[1:]
+    lengths = ends-starts
+
+    discPointsX = np.full((nCurves, nStations), np.nan)
+    discPointsY = np.full((nCurves, nStations), np.nan)
+
+    # only the curves that converged to more than minDisp are discretized
+    nonEmpty = lengths > 0
+    maxX = np.full(nCurves, -np.inf)
+    maxX[nonEmpty] = np.maximum.reduceat(x[0:offsets[-1]], starts[nonEmpty])
+    valid = maxX >= minDisp
+    if nCurves == 0 or not np.any(valid):
+        return discPointsX, discPointsY, valid
+
+    # the first point past a station is also the first point where the running maximum of x is past the station.
+    # the running maximum is computed for all the curves at once by shifting every curve above the previous one,
+    # so the key array is sorted and the stations of all the curves are found with a single call to searchsorted
+    curveId = np.repeat(np.arange(nCurves), lengths)
+    xMin = min(np.min(x[0:offsets[-1]]), np.min(stations))
+    span = max(np.max(x[0:offsets[-1]]), np.max(stations)) - xMin + 1.0
+    key = np.maximum.accumulate(x[0:offsets[-1]] - xMin + curveId*span)
+    targets = (stations - xMin)[np.newaxis,:] + (np.arange(nCurves)*span)[:,np.newaxis]
+    index = np.searchsorted(key, targets, side='left')
+
+    found = (index < ends[:,np.newaxis]) & valid[:,np.newaxis]
+    safeIndex = np.where(found, index, 0)
+    discPointsX[found] = x[safeIndex[found]]
+    discPointsY[found] = y[safeIndex[found]]
+
+    # linear interpolation between the point before the station and the first point past the station
+    if interpolate:
+        bracket = found & (safeIndex > starts[:,np.newaxis])
+        x1 = x[safeIndex[bracket]]
+        y1 = y[safeIndex[bracket]]
+        x0 = x[safeIndex[bracket]-1]
+        y0 = y[safeIndex[bracket]-1]
+        station = np.broadcast_to(stations, (nCurves, nStations))[bracket]
+        ratio = (station-x0) / np.where(x1 > x0, x1-x0, 1.0)
+        discPointsX[bracket] = station
+        discPointsY[bracket] = y0 + ratio*(y1-y0)
+
+    # if the analysis did not converge until a station, the missing base shear is taken as the previous one multiplied by a factor of 1.055
+    for j in range(1, nStations):
+        missing = valid & ~found[:,j]
+        discPointsX[missing,j] = stations[j]
+        discPointsY[missing,j] = discPointsY[missing,j-1]*extrapolationFactor
+
+    # avoid softening behaviour due to numerical innestabilities at the last station
+    softening = valid & (discPointsY[:,-1] < discPointsY[:,-2])
+    discPointsY[softening,-1] = discPointsY[softening,-2]*extrapolationFactor
+
+    return discPointsX, discPointsY, valid
+
+
+# discretize all the curves of a curve store (see "CurveStore.py")
+# returns the input vectors, and the x and y values of the discretized curves, only for the valid curves
+def discretizeCurveStore(store, stations=stations, minDisp=10, interpolate=False):
+    params, x, y, offsets = store.getAllCurves()
+    discPointsX, discPointsY, valid = discretizeCurves(x, y, offsets, stations, minDisp, interpolate)
+    return params[valid], discPointsX[valid], discPointsY[valid]
+
+
+# discretize one pushover curve
+# x, y -> displacement (mm) and base shear (kN) of the pushover curve
+# minDisp -> the curves that did not converge to this displacement (mm) are ignored (returns None)
+# returns the x and y values of the discretized curve (one value per station)
+def discretizeCurve(x, y, stations=stations, minDisp=10, interpolate=False):
+
+    discPointsX, discPointsY, valid = discretizeCurves(x, y, [0, len(x)], stations, minDisp, interpolate)
+    if not valid[0]:
+        return None
+
+    return list(discPointsX[0]), list(discPointsY[0])
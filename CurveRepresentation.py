@@ -0,0 +1,143 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+CurveRepresentation.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# The representation of a pushover curve as the outputs of the surrogate model.
+# A representation owns the set of stations (displacements in mm) where the curves are cut. The base shear at the first station (0 mm) is always 0,
+# so the surrogate model predicts one output per station except the first one (6 outputs for the original stations 0, 0.5, 1, 2.5, 5, 10, 19.5).
+# The same object is used to:
+    # create the training targets from the FEM curves (at any resolution, for example 6, 20 or 100 points)
+    # convert the outputs of the surrogate model into the points of the curve (for the plots)
+    # reconstruct a dense curve from the outputs with a monotone interpolation (PCHIP), which does not overshoot between the stations
+# The representation (stations, minDisp and interpolate) is stored in a json file next to the training database and next to the weights
+# of the trained model (see "save" and "getRepresentationForFile"), so it is selected only once in "DiscretizeCurvesAndCreateDatabase.py"
+# and the scripts that train or use the model read it from there.
+
+import os
+import json
+import numpy as np
+import CurveDiscretization as curveDisc
+
+
+class CurveRepresentation():
+
+    # stations -> displacements (mm) where the curves are cut, the first one must be 0
+    # minDisp -> the curves that did not converge to this displacement (mm) are not used
+    # interpolate -> take the first point past each station (False) or interpolate linearly between the bracketing points (True)
+    def __init__(self, stations=curveDisc.stations, minDisp=10, interpolate=False):
+        self.stations = np.asarray(stations, dtype=float)
+        self.minDisp = minDisp
+        self.interpolate = interpolate
+
+        if self.stations[0] != 0 or np.any(np.diff(self.stations) <= 0):
+            raise ValueError("The stations must start at 0 and be increasing: "+str(list(stations)))
+
+        # number of outputs of the surrogate model
+        self.nOutputs = len(self.stations)-1
+
+    # training targets of a batch of curves (flat arrays with offsets, like in "CurveStore.py")
+    # returns an array of shape (nCurves, nOutputs) and a boolean array with the valid curves (the targets of the non valid curves are nan)
+    def getTargets(self, x, y, offsets):
+        discPointsX, discPointsY, valid = curveDisc.discretizeCurves(x, y, offsets, self.stations, self.minDisp, self.interpolate)
+        return discPointsY[:,1:], valid
+
+    # input vectors and training targets of all the valid curves of a curve store
+    def getTrainingData(self, store):
+        params, x, y, offsets = store.getAllCurves()
+        targets, valid = self.getTargets(x, y, offsets)
+        return params[valid], targets[valid]
+
+    # training targets of a single curve (None if the curve is not valid)
+    def getCurveTargets(self, x, y):
+        targets, valid = self.getTargets(x, y, [0, len(x)])
+        if not valid[0]:
+            return None
+        return list(targets[0])
+
+    # points of the curves defined by the outputs of the surrogate model (the point at 0 mm is added)
+    # predOut -> array of shape (n, nOutputs)
+    # returns the x values (nStations) and the y values (n, nStations)
+    def getCurvePoints(self, predOut):
+        predOut = np.atleast_2d(np.asarray(predOut, dtype=float))
+        if predOut.shape[1] != self.nOutputs:
+            raise ValueError("Expected "+str(self.nOutputs)+" outputs, got "+str(predOut.shape[1]))
+        ydata = np.concatenate((np.zeros((len(predOut),1)), predOut), axis=1)
+        return self.stations.copy(), ydata
+
+    # dense curves defined by the outputs of the surrogate model
+    # the curves are interpolated with PCHIP, which is monotone between the stations (no spurious peaks)
+    # xDense -> displacements (mm) where the curves are evaluated, by default nPoints values between 0 and the last station
+    # returns the x values (nPoints) and the y values (n, nPoints)
+    def reconstruct(self, predOut, xDense=None, nPoints=200):
+        from scipy.interpolate import PchipInterpolator
+
+        xdata, ydata = self.getCurvePoints(predOut)
+        if xDense is None:
+            xDense = np.linspace(0, xdata[-1], nPoints)
+        xDense = np.asarray(xDense, dtype=float)
+        interpolator = PchipInterpolator(xdata, ydata, axis=1, extrapolate=False)
+        return xDense, interpolator(np.clip(xDense, xdata[0], xdata[-1]))
+
+    # outputs of this representation from the outputs of another representation (for example, to compare models with different resolutions)
+    def resampleFrom(self, other, predOut):
+        xDense, yDense = other.reconstruct(predOut, self.stations)
+        return yDense[:,1:]
+
+    # store the representation next to a file (training database or trained model), see "getRepresentationPath"
+    def save(self, pathToFile):
+        with open(getRepresentationPath(pathToFile), 'w') as f:
+            json.dump({"stations": [float(s) for s in self.stations], "minDisp": self.minDisp, "interpolate": self.interpolate}, f, indent=2)
+
+
+# representation with nPoints stations (nPoints-1 outputs) between 0 and maxDisp
+# spacing -> "geometric": the stations are closer at the beginning of the curve, where the stiffness changes faster (like the original stations)
+#            "linear": evenly spaced stations
+# firstStation -> first station after 0 for the "geometric" spacing
+def createRepresentation(nPoints, maxDisp=19.5, spacing="geometric", firstStation=0.5, minDisp=10, interpolate=False):
+    if nPoints < 2:
+        raise ValueError("At least 2 stations are required")
+    if spacing == "geometric":
+        stations = np.concatenate(([0], np.geomspace(min(firstStation, maxDisp), maxDisp, nPoints-1)))
+    elif spacing == "linear":
+        stations = np.linspace(0, maxDisp, nPoints)
+    else:
+        raise ValueError("Unknown spacing: "+str(spacing))
+    return CurveRepresentation(stations, minDisp, interpolate)
+
+
+# the original representation of the project (6 outputs at 0.5, 1, 2.5, 5, 10, 19.5 mm)
+def getDefaultRepresentation():
+    return CurveRepresentation(curveDisc.stations)
+
+
+# path of the file with the representation of a training database or a trained model ("model.h5" -> "model_representation.json")
+def getRepresentationPath(pathToFile):
+    return os.path.splitext(pathToFile)[0]+"_representation.json"
+
+
+# representation of a training database or a trained model
+# (the default representation if there is no representation file)
+def getRepresentationForFile(pathToFile):
+    path = getRepresentationPath(pathToFile)
+    if os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+        return CurveRepresentation(data["stations"], data["minDisp"], data["interpolate"])
+    return getDefaultRepresentation()
@@ -0,0 +1,203 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+CurveStore.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Binary columnar storage for the raw pushover curves of the FEM database (an alternative to the csv file with 3 rows per data point).
+# A curve store is a folder (with the extension ".curves") that contains 4 binary files:
+    # params.bin   -> the input vectors, float64 (nCurves x nParams)
+    # x.bin        -> the x values of all the curves one after the other, float64
+    # y.bin        -> the y values of all the curves one after the other, float64
+    # offsets.bin  -> the end position of every curve in x.bin and y.bin, int64 (nCurves)
+# The files are only appended, and the offsets are written last. Thus, the offsets file defines which curves are complete,
+# and any data written after the last complete curve (for example, if the generator was killed) is removed when the store is opened.
+# The files are memory-mapped, so the curve i is read without parsing the rest of the database.
+
+import os
+import numpy as np
+
+# extension of the folder of a curve store
+extension = ".curves"
+
+
+class CurveStore():
+
+    def __init__(self, path, nParams=11):
+        self.path = path
+        self.nParams = nParams
+        self.maps = {}
+
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        self.repair()
+
+    def getFile(self, name):
+        return os.path.join(self.path, name+".bin")
+
+    # remove the data that does not belong to a complete curve
+    def repair(self):
+        for name in ("params", "x", "y", "offsets"):
+            if not os.path.exists(self.getFile(name)):
+                open(self.getFile(name), 'wb').close()
+
+        nCurves = int(os.path.getsize(self.getFile("offsets"))/8)
+        self.truncate("offsets", nCurves*8)
+        end = self.getOffsets()[-1]
+        self.truncate("x", end*8)
+        self.truncate("y", end*8)
+        self.truncate("params", nCurves*self.nParams*8)
+
+    def truncate(self, name, size):
+        if os.path.getsize(self.getFile(name)) > size:
+            with open(self.getFile(name), 'r+b') as f:
+                f.truncate(size)
+            self.maps = {}
+
+    # number of complete curves in the store
+    def __len__(self):
+        return int(os.path.getsize(self.getFile("offsets"))/8)
+
+    # memory-mapped view of one of the files (the view is created again when the file grows)
+    def getArray(self, name, dtype):
+        size = os.path.getsize(self.getFile(name))
+        if size == 0:
+            return np.zeros(0, dtype=dtype)
+        if name not in self.maps or self.maps[name].nbytes != size:
+            self.maps[name] = np.memmap(self.getFile(name), dtype=dtype, mode='r')
+        return self.maps[name]
+
+    # start and end position of every curve (array of size nCurves+1)
+    def getOffsets(self):
+        return np.concatenate((np.zeros(1, dtype=np.int64), self.getArray("offsets", np.int64)))
+
+    # input vectors of all the curves, array of shape (nCurves, nParams)
+    def getParams(self):
+        return self.getArray("params", np.float64)[0:len(self)*self.nParams].reshape(-1, self.nParams)
+
+    # input vector, x values and y values of the curve i
+    def getCurve(self, i):
+        offsets = self.getOffsets()
+        start = offsets[i]
+        end = offsets[i+1]
+        params = self.getParams()[i]
+        return params, self.getArray("x", np.float64)[start:end], self.getArray("y", np.float64)[start:end]
+
+    # all the curves as flat arrays: the curve i is x[offsets[i]:offsets[i+1]]
+    def getAllCurves(self):
+        offsets = self.getOffsets()
+        end = offsets[-1]
+        return self.getParams(), self.getArray("x", np.float64)[0:end], self.getArray("y", np.float64)[0:end], offsets
+
+    def getLastParams(self):
+        if len(self) == 0:
+            return None
+        return list(self.getParams()[-1])
+
+    # append one curve
+    def append(self, params, x, y):
+        self.appendMany([params], [x], [y])
+
+    # append several curves (the offsets are written after the data, so an interrupted append leaves the store consistent)
+    def appendMany(self, paramsList, xList, yList):
+        if len(paramsList) == 0:
+            return
+
+        end = self.getOffsets()[-1]
+        lengths = np.array([len(x) for x in xList], dtype=np.int64)
+        offsets = end + np.cumsum(lengths)
+
+        params = np.asarray(paramsList, dtype=np.float64).reshape(-1, self.nParams)
+        x = np.concatenate([np.asarray(v, dtype=np.float64) for v in xList])
+        y = np.concatenate([np.asarray(v, dtype=np.float64) for v in yList])
+
+        for name, data in (("x", x), ("y", y), ("params", params), ("offsets", offsets)):
+            with open(self.getFile(name), 'ab') as f:
+                f.write(data.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+    def close(self):
+        self.maps = {}
+
+
+# read the csv database (3 rows per data point) and return the rows of every data point (input vector, x values, y values)
+def readCsvDataBase(pathToFile):
+    with open(pathToFile) as f:
+        lines = f.read().splitlines()
+
+    nSamples = int(len(lines)/3)
+    params = []
+    xList = []
+    yList = []
+    for i in range(nSamples):
+        params.append(np.array(lines[i*3].split(','), dtype=float))
+        xList.append(np.array(lines[i*3+1].split(','), dtype=float))
+        yList.append(np.array(lines[i*3+2].split(','), dtype=float))
+    return params, xList, yList
+
+
+# convert the csv database (3 rows per data point) to a curve store
+def convertCsvToStore(pathToCsv, pathToStore):
+    params, xList, yList = readCsvDataBase(pathToCsv)
+    store = CurveStore(pathToStore)
+    store.appendMany(params, xList, yList)
+    return store
+
+
+# folder of the curve store converted from a csv file ("database_complete.csv" -> "database_complete.csv.curves")
+# it is never the folder of a store written directly by a generator ("database_complete.curves")
+def getConvertedStorePath(pathToCsv):
+    return pathToCsv+extension
+
+
+# open the curves of a database file
+# if the file is a csv file, it is converted once to a curve store next to it (see "getConvertedStorePath")
+# and the store is re-created only when the csv file changes (the file "source.txt" of the converted store records the size and date of the csv file)
+# a folder without "source.txt" was not created by the conversion, so it is never modified
+def openCurveDataBase(pathToFile):
+
+    if pathToFile.endswith(extension):
+        return CurveStore(pathToFile)
+
+    pathToStore = getConvertedStorePath(pathToFile)
+    pathToSource = os.path.join(pathToStore, "source.txt")
+    source = str(os.path.getsize(pathToFile))+" "+str(os.path.getmtime(pathToFile))
+
+    if os.path.exists(pathToSource):
+        with open(pathToSource) as f:
+            if f.read() == source:
+                return CurveStore(pathToStore)
+    elif os.path.exists(pathToStore):
+        raise ValueError("The folder "+pathToStore+" is not a store converted from "+pathToFile+", it is not modified (move it or open it directly)")
+
+    # the csv file changed, convert it again (only the files of the previous conversion are removed)
+    if os.path.exists(pathToSource):
+        for name in ("params", "x", "y", "offsets"):
+            if os.path.exists(os.path.join(pathToStore, name+".bin")):
+                os.remove(os.path.join(pathToStore, name+".bin"))
+
+    # the folder is marked as converted before the conversion, so an interrupted conversion is repeated the next time
+    os.makedirs(pathToStore, exist_ok=True)
+    with open(pathToSource, 'w') as f:
+        f.write("")
+    store = convertCsvToStore(pathToFile, pathToStore)
+    with open(pathToSource, 'w') as f:
+        f.write(source)
+    return store
@@ -20,12 +20,9 @@ Department of Civil Engineering and Energy Technology
 
 # Header:
 # A simple class to handle a few data operations. Read the comments on the scripts for more details
+# (scipy, sklearn and matplotlib are imported inside the functions that use them, so reading the data files does not load them)
 
 import numpy as np
-from scipy.stats import pearsonr
-from sklearn.metrics import r2_score
-import matplotlib.pyplot as plt
-from sklearn.metrics import mean_squared_error
 
 
 # read a data on a text file and skip the first rows or columns based on the given numbers
@@ -43,6 +40,8 @@ def splitInputsOutputs(data,nInputs,nOutputs):
 # compute the basic metrics of a ANN: the average values of the Means Squared Error M(SE), the Person Correlation Coefficient (R), and the Coefficient of Determination (R2)
 # the arguments are: the trained NN, the normalizer, the database, the number of inputs and the number of outputs
 def getSimpleMetricsAverages(nnet,normalizer,data,nIn,nOut):  
+    from scipy.stats import pearsonr
+    from sklearn.metrics import r2_score, mean_squared_error
     
     inputData, outputData = splitInputsOutputs(data, nIn, nOut)
     normInput = normalizer.normalizeInputs(inputData)
@@ -73,6 +72,9 @@ def getSimpleMetricsAverages(nnet,normalizer,data,nIn,nOut):
 # this routine will create a nice plot of the correlation values between the prediction and the ground truth for all the output variables on a ANN
 # the arguments are: the trained NN, the normalizer, the database, the number of inputs and the number of outputs 
 def getMetricsForAllVariable(nnet,normalizer,data,nIn,nOut):
+    import matplotlib.pyplot as plt
+    from scipy.stats import pearsonr
+    from sklearn.metrics import r2_score, mean_squared_error
     
     plt.rcParams.update({'font.size': 16})
     plt.rc('font', family='TimesNewRomman')
@@ -84,12 +86,12 @@ def getMetricsForAllVariable(nnet,normalizer,data,nIn,nOut):
     # use the trained model to predict (the obtained output is normalized if the trining data was normalized)
     predOut = nnet.predict(normInput)
     
-    # create a 2-column figure  with multiple plots inside
-    figure, ax = plt.subplots(int(nOut/2), 2)
+    # create a 2-column figure  with multiple plots inside (an odd number of outputs leaves the last plot empty)
+    figure, ax = plt.subplots(int(np.ceil(nOut/2)), 2, squeeze=False)
  
     colA = True 
     rowIndices = []
-    for i in range(int(nOut/2)):
+    for i in range(int(np.ceil(nOut/2))):
         rowIndices.append(i)
         rowIndices.append(i)
     
@@ -147,6 +149,9 @@ def getMetricsForAllVariable(nnet,normalizer,data,nIn,nOut):
  # this routine will create a nice plot of the correlation values between the prediction and the ground truth for a single output variable
  # the arguments are: the trained NN, the normalizer, the database, the number of inputs and the number of outputs    
 def getMetricsForVariable(nnet,normalizer,data,nIn,nOut,index):
+    import matplotlib.pyplot as plt
+    from scipy.stats import pearsonr
+    from sklearn.metrics import r2_score, mean_squared_error
     
     plt.rcParams.update({'font.size': 16})
     plt.rc('font', family='TimesNewRomman')
@@ -0,0 +1,184 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+DesignOfExperiments.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Space-filling designs of experiments to select the input vectors of the FEM analyses.
+# The designs are created in the unit hypercube (11 dimensions) and then mapped to the bounds of "InputVariableBounds.py".
+# The mapping enforces the dependent bounds of the input variables:
+    # wall length               lw     >= 6*t
+    # web long reinf ratio      pl_web <= 0.6*pl_be
+    # web transv reinf ratio    pt_web <= 0.6*pt_be
+# (the dependent upper bounds are also limited to the max values of the variables so that the samples stay inside the bounds of the normalizer)
+
+# Available methods:
+    # "lhs"    -> Latin hypercube
+    # "sobol"  -> scrambled Sobol sequence
+    # "halton" -> scrambled Halton sequence
+    # "random" -> independent uniform values (the original sampling of "CreateDataBase_Loop.py")
+# The Sobol and Halton sequences can be extended: the first n points do not change when more points are requested with the same seed.
+# An existing design (for example, an existing database) can also be extended with the "maximin" method, which selects new points far from the existing ones.
+
+# All the functions work with numpy arrays of shape (n, 11), so millions of candidate points can be generated in a few seconds.
+
+import warnings
+import numpy as np
+from scipy.stats import qmc
+from scipy.spatial import cKDTree
+import InputVariableBounds as inputBounds
+
+# number of input variables
+nInputs = 11
+
+
+# map points of the unit hypercube to input vectors
+# u -> array of shape (n, 11) with values between 0 and 1
+def unitToInputs(u):
+
+    u = np.atleast_2d(np.asarray(u, dtype=float))
+    minValues = np.asarray(inputBounds.minValues)
+    maxValues = np.asarray(inputBounds.maxValues)
+
+    # independent variables
+    data = minValues + u*(maxValues-minValues)
+
+    # total length of wall (min t*6)
+    lwMin = np.maximum(6*data[:,0], minValues[1])
+    data[:,1] = lwMin + u[:,1]*(maxValues[1]-lwMin)
+
+    # ratio of reinforcement for the web, longitudinal (l) and transversal (t) (max 60% of the boundary element ratio)
+    plWebMax = np.minimum(0.6*data[:,3], maxValues[5])
+    data[:,5] = minValues[5] + u[:,5]*(plWebMax-minValues[5])
+
+    ptWebMax = np.minimum(0.6*data[:,4], maxValues[6])
+    data[:,6] = minValues[6] + u[:,6]*(ptWebMax-minValues[6])
+
+    return data
+
+
+# map input vectors back to the unit hypercube (inverse of "unitToInputs")
+def inputsToUnit(data):
+
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    minValues = np.asarray(inputBounds.minValues)
+    maxValues = np.asarray(inputBounds.maxValues)
+
+    u = (data-minValues) / (maxValues-minValues)
+
+    lwMin = np.maximum(6*data[:,0], minValues[1])
+    u[:,1] = (data[:,1]-lwMin) / (maxValues[1]-lwMin)
+
+    plWebMax = np.minimum(0.6*data[:,3], maxValues[5])
+    u[:,5] = (data[:,5]-minValues[5]) / (plWebMax-minValues[5])
+
+    ptWebMax = np.minimum(0.6*data[:,4], maxValues[6])
+    u[:,6] = (data[:,6]-minValues[6]) / (ptWebMax-minValues[6])
+
+    return np.clip(u, 0, 1)
+
+
+# check which input vectors satisfy the bounds and the dependent bounds
+# returns a boolean array of size n
+def checkConstraints(data, tolerance=1e-9):
+
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    minValues = np.asarray(inputBounds.minValues)
+    maxValues = np.asarray(inputBounds.maxValues)
+    scale = maxValues-minValues
+
+    valid = np.all(data >= minValues - tolerance*scale, axis=1)
+    valid &= np.all(data <= maxValues + tolerance*scale, axis=1)
+    valid &= data[:,1] >= 6*data[:,0] - tolerance*scale[1]
+    valid &= data[:,5] <= 0.6*data[:,3] + tolerance*scale[5]
+    valid &= data[:,6] <= 0.6*data[:,4] + tolerance*scale[6]
+    return valid
+
+
+# create n points in the unit hypercube
+# skip -> number of points of the sequence to skip (only for "sobol" and "halton"), used to continue a sequence
+def getUnitDesign(n, method="sobol", seed=None, skip=0):
+
+    if method == "sobol":
+        engine = qmc.Sobol(nInputs, scramble=True, seed=seed)
+    elif method == "halton":
+        engine = qmc.Halton(nInputs, scramble=True, seed=seed)
+    elif method == "lhs":
+        if skip > 0:
+            raise ValueError("A Latin hypercube can not be continued, use extendDesign with the method 'maximin'")
+        engine = qmc.LatinHypercube(nInputs, seed=seed)
+    elif method == "random":
+        rng = np.random.default_rng(seed)
+        if skip > 0:
+            rng.random((skip, nInputs))
+        return rng.random((n, nInputs))
+    else:
+        raise ValueError("Unknown sampling method: "+str(method))
+
+    if skip > 0:
+        engine.fast_forward(skip)
+
+    # the Sobol sequence warns when n is not a power of 2, but any prefix of the sequence is still a valid (extensible) design
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="The balance properties of Sobol")
+        return engine.random(n)
+
+
+# create n input vectors with the given method
+def generateDesign(n, method="sobol", seed=None, skip=0):
+    return unitToInputs(getUnitDesign(n, method, seed, skip))
+
+
+# add nNew input vectors to an existing design (array of shape (n, 11))
+# method -> "sobol" or "halton": continue the sequence (the existing design must be the first points of the same sequence and seed)
+#           "maximin": select the candidates that are farthest from the existing points and from each other (works for any existing design)
+# nCandidates -> size of the pool of candidates for the "maximin" method
+def extendDesign(existing, nNew, method="maximin", seed=None, nCandidates=None):
+
+    existing = np.asarray(existing, dtype=float).reshape(-1, nInputs)
+
+    if method in ("sobol", "halton"):
+        newPoints = generateDesign(nNew, method, seed, skip=len(existing))
+        return np.concatenate((existing, newPoints), axis=0)
+
+    if method != "maximin":
+        raise ValueError("Unknown extension method: "+str(method))
+
+    if nCandidates is None:
+        nCandidates = max(20*nNew, 10000)
+
+    # the distances are measured in the unit hypercube so that all the variables have the same weight
+    candidates = getUnitDesign(nCandidates, "sobol", seed)
+
+    # distance from every candidate to the closest existing point
+    if len(existing) > 0:
+        tree = cKDTree(inputsToUnit(existing))
+        minDistance, _ = tree.query(candidates)
+    else:
+        minDistance = np.full(nCandidates, np.inf)
+
+    # greedy selection: take the farthest candidate and update the distances to the selected point
+    selected = np.zeros(nNew, dtype=int)
+    for i in range(nNew):
+        index = int(np.argmax(minDistance))
+        selected[i] = index
+        distance = np.sqrt(np.sum((candidates-candidates[index])**2, axis=1))
+        minDistance = np.minimum(minDistance, distance)
+
+    newPoints = unitToInputs(candidates[selected])
+    return np.concatenate((existing, newPoints), axis=0)
@@ -20,7 +20,7 @@ Department of Civil Engineering and Energy Technology
 
 # Header:
 # This script takes the stored results that contain the full pushover curves obtained from the analysis, wchih are stored at the file: "database_complete.csv".
-# Then, it will discretizes all the curves into 6 sections and proceed to create a file with the data as input-output vectors (one vector per row)
+# Then, it will discretizes all the curves into 6 sections (or the stations selected in "nStations") and proceed to create a file with the data as input-output vectors (one vector per row)
 # Finally, create two subdatabases one for training and one for validation
 
 
@@ -29,6 +29,8 @@ import csv
 import os
 import numpy as np
 import matplotlib.pyplot as plt
+import CurveStore as curveStore
+import CurveRepresentation as curveRep
 
 
 # Plot the data to visualize the discretizations
@@ -56,16 +58,10 @@ nValidation = 150
         
 ResultsDir = 'AnalysisResults'
 pathToFile = ResultsDir+"/"+fileName
-f = open(pathToFile)
-csvreader = csv.reader(f)
 
-# CONVERT THE DATABASE TO A NUMPY ARRAY
-rows = []
-for row in csvreader:
-    float_lst = list(np.array(row, dtype = 'float'))
-    rows.append(float_lst)
-    
-f.close();       
+# OPEN THE DATABASE AS A BINARY CURVE STORE (THE CSV FILE IS CONVERTED ONLY THE FIRST TIME, OR WHEN IT CHANGES, TO "database_complete.csv.curves")
+# the file name can also be a curve store created directly by the generator (e.g. "database_complete.curves")
+curves = curveStore.openCurveDataBase(pathToFile)
 
 # CREATE A DIRECTORY AND A FILE TO SAVE THE TRAINING DATABASE THAT WILL BE GENERATED
 fileName = "database_processed.csv"            
@@ -78,78 +74,46 @@ if not os.path.exists(ResultsDir):
 f = open(pathToFile, 'w', newline='')
 writer = csv.writer(f)
 
-# STATIONS WHERE THE PUSHOVER CURVE WILL BE CUT FOR THE DISCRETIZATION
-stations = [0,0.5,1.0,2.5,5,10,19.5]
-
-
-
-# SOME VARIABLES FOR THE LOOP
-total = 0
-
-# THE RESULTS FILE HAS 3 ROWS PER DATAPOINT, SO THE LOOP NEEDS TO GO ON ONE THIRD OF THE DATA
-plotIndex = range(int(len(rows)/3))
-
-
+# NUMBER OF STATIONS WHERE THE PUSHOVER CURVE WILL BE CUT FOR THE DISCRETIZATION
+# None -> the original 7 stations (6 outputs): 0, 0.5, 1.0, 2.5, 5, 10, 19.5
+# any other number creates a higher resolution representation, for example 21 or 101 stations (20 or 100 outputs)
+nStations = None
+
+# TAKE THE FIRST POINT PAST EACH STATION (False, ORIGINAL RULE) OR INTERPOLATE LINEARLY BETWEEN THE BRACKETING POINTS (True)
+interpolateStations = False
+
+if nStations is None:
+    representation = curveRep.CurveRepresentation(interpolate=interpolateStations)
+else:
+    representation = curveRep.createRepresentation(nStations, interpolate=interpolateStations)
+stations = representation.stations
+
+# DISCRETIZE ALL THE CURVES AT ONCE
+# only the curves that converged to more than 10 mm of displacement are valid, the rest are ignored
+# if the analysis did not converge until 20 mm, then there is a missing point
+# to complete the points, the baseshear at 20 mm is taken as the base shear at 10mm multiplied by a factor of 1.055
+# the factor of 1.055 is an approximation that has been calculated with hundred of analyses that do converge until 20mm
+# also, to avoid softening behaviour due to numerical innestabilities, if the base shear at 20 mm is less than at 10 mm it is taken as the base shear at 10mm multiplied by 1.055
+# (see "CurveDiscretization.py" for more details)
+params, x, y, offsets = curves.getAllCurves()
+targets, valid = representation.getTargets(x, y, offsets)
+
+# ONE ROW PER VALID CURVE: THE 11 INPUTS AND THE BASE SHEAR AT THE STATIONS (EXCEPT THE FIRST ONE, THAT IS ALWAYS 0)
+dataBase = np.concatenate((params[valid], targets[valid]), axis=1)
+writer.writerows(dataBase.tolist())
+total = len(dataBase)
+print("Discretized curves:", total, "of", len(curves))
+
+# plot the data to visualize the discretizations
 if plotCurves:
     plt.figure(figsize=(4,3), dpi=100)
     plt.xlabel('Displacement (mm)')
     plt.ylabel('Base Shear (kN)')
 
-for i in plotIndex: 
-    
-    print("index:", i)
-    # READ THE x and y DATA OF THE PUSHOVER CURVE
-    maxV = []
-    index = i*3
-    params = rows[index]
-    x = rows[index+1]
-    y = rows[index+2]
-    maxX = max(x)
-    maxY = max(y)
-    maxV.append(maxY)
-    #print(maxX,maxY)
-    
-    # only if it converged to more than 10 mm of displacement, otherwise ignore data point and continue
-    if maxX < 10: 
-        continue
-    
-    # discretize the curve into 6 sections, at: 0, 1, 2.5, 5, 10, 19.5
-    discPointsX = []
-    discPointsY = []
-    for station in stations:
-        count = 0
-        skip = False
-        for xval in x:
-            if xval >= station:
-                skip=True
-                discPointsX.append(x[count])
-                discPointsY.append(y[count])
-            count=count+1   
-            if skip:
-                break;
-    
-    # if the analysis did not converge until 20 mm, then there is a missing point
-    # to complete the 6 points, the baseshear at 20 mm is taken as the base shear at 10mm multiplied by a factor of 1.055
-    # the factor of 1.055 is an approximation that has been calculated with hundred of analyses that do converge until 20mm
-    if len(discPointsY) < len(stations):               
-            discPointsX.append(20)
-            discPointsY.append(discPointsY[-1]*1.055)    
-
-    # avoid softening behaviour due to numerical innestabilities
-    # sometimes it appears that the displacement at 20 mm is less than the displacement 10 mm, but that is only because the algorithm has
-    # taken a value at a "valley" of a numerical innestable section
-    if discPointsY[6] < discPointsY[5]:
-        discPointsY[6] = discPointsY[5]*1.055
-
-
-    total = total + 1 
-    dataBaseRow = [*params,*discPointsY[1:7]]       
-    writer.writerow(dataBaseRow)
-
-    # plot the data to visualize the discretizations
-    if plotCurves:
-        plt.plot(discPointsX,discPointsY, linewidth=1, linestyle="-.", label='Pushover',color='black')
-        plt.plot(x,y, linewidth=1, linestyle="-", label='Pushover',color='red')
+    xdata, ydata = representation.getCurvePoints(targets[valid])
+    for k, i in enumerate(np.nonzero(valid)[0]):
+        plt.plot(xdata,ydata[k], linewidth=1, linestyle="-.", label='Pushover',color='black')
+        plt.plot(x[offsets[i]:offsets[i+1]],y[offsets[i]:offsets[i+1]], linewidth=1, linestyle="-", label='Pushover',color='red')
         
 
  
@@ -197,6 +161,10 @@ for i in range(nTraining):
     
 f.close(); 
 
+# STORE THE REPRESENTATION (STATIONS, MINIMUM DISPLACEMENT AND INTERPOLATION) NEXT TO THE TRAINING DATABASE
+# (IT IS READ BY "MainNN.py" AND STORED NEXT TO THE TRAINED MODEL)
+representation.save(pathToFile)
+
 
 # CREATE A DIRECTORY AND A FILE TO SAVE THE TRAINING DATABASE THAT WILL BE GENERATED
 fileName = fileNameValidationDataBase           
@@ -216,5 +184,7 @@ for i in range(nTraining,nTraining+nValidation):
     
 f.close(); 
 
+representation.save(pathToFile)
+
 
 
@@ -0,0 +1,132 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+FieldAnimation.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Animation of the whole history of a stress/strain field of a run (see "RunResults.py") for the results window of the GUI.
+# All the frames are computed once when the field or the component is selected:
+    # nodal values of all the steps -> a single sparse product (see "ColorMapFEM.getNodalAverageAll")
+    # deformed coordinates of all the steps -> undeformed coordinates + displacements * scale
+# The map is a single "tripcolor" (gouraud shading) on a Triangulation that belongs to the animation, with fixed color limits for all the steps.
+# Showing a frame only copies the coordinates of the step into the Triangulation and the nodal values into the collection,
+# so scrubbing or playing the history does not parse, average or create any artist.
+# The map and the label of the step are animated artists drawn over a copy of the rest of the figure (blitting, see "show"),
+# the whole figure is only drawn again when the scale (limits of the axes) or the size of the window changes.
+
+import numpy as np
+import matplotlib.tri as mtri
+from matplotlib import cm
+import ColorMapFEM as colorMap
+
+
+class FieldAnimation():
+
+    # axes -> matplotlib axes of the results window
+    # ops -> OpenSees model of the run (only the undeformed coordinates of the nodes are read, not needed if the results have the coordinates)
+    # results -> "RunResults.RunResults" handle of the run
+    # field -> "strains" or "stresses", comp -> component (0 to 7)
+    # scale -> scale of the displacements
+    def __init__(self, axes, ops, results, field, comp, scale=20):
+        self.axes = axes
+        self.nv = results.meshV
+        self.nh = results.meshH
+        self.field = field
+        self.comp = comp
+
+        store = results.getStore()
+        self.nFrames = store.nSteps
+
+        # nodal values of all the steps (nFrames, nNodes) and fixed color limits
+        self.values = colorMap.getNodalAverageAll(self.nv, self.nh, store.getField(field), comp)
+        self.vmin, self.vmax = colorMap.getColorLimits(self.values)
+
+        # displacements of all the steps (nFrames, nNodes, 2) and undeformed coordinates (nNodes, 2)
+        self.disp = np.asarray(store.getField("disp"))
+        self.coords = results.coords if results.coords is not None else colorMap.getNodeCoordinates(ops, self.nv, self.nh)
+        self.maxDx = np.maximum(self.disp[:,:,0].max(axis=1), 0)
+
+        # the triangulation is updated in place on every frame
+        x, y = self.getFrameCoordinates(0, scale)
+        self.triangulation = mtri.Triangulation(x.copy(), y.copy(), colorMap.getTriangles(self.nv, self.nh))
+        self.mesh = axes.tripcolor(self.triangulation, self.values[0], shading='gouraud', cmap=cm.jet, vmin=self.vmin, vmax=self.vmax, animated=True)
+        self.label = axes.text(0.02, 0.98, "", transform=axes.transAxes, va='top', fontsize=8, animated=True)
+        axes.set_aspect('equal')
+
+        # background of the figure without the animated artists (copied after every full draw)
+        self.canvas = axes.figure.canvas
+        self.background = None
+        self.drawEvent = self.canvas.mpl_connect('draw_event', self.onDraw)
+
+        self.frame = 0
+        self.setScale(scale)
+
+    # deformed coordinates of the nodes at a step
+    def getFrameCoordinates(self, frame, scale):
+        x = self.coords[:,0] + self.disp[frame,:,0]*scale
+        y = self.coords[:,1] + self.disp[frame,:,1]*scale
+        return x, y
+
+    # change the scale of the displacements, the limits of the axes enclose the deformed shape of all the steps
+    def setScale(self, scale):
+        self.scale = scale
+        x = self.coords[:,0] + self.disp[:,:,0]*scale
+        y = self.coords[:,1] + self.disp[:,:,1]*scale
+        marginX = 0.05*(x.max()-x.min())
+        marginY = 0.05*(y.max()-y.min())
+        self.axes.set_xlim(x.min()-marginX, x.max()+marginX)
+        self.axes.set_ylim(y.min()-marginY, y.max()+marginY)
+        self.background = None
+        self.setFrame(self.frame)
+
+    # show a step (only the coordinates and the values of the collection change)
+    def setFrame(self, frame):
+        frame = int(min(max(frame, 0), self.nFrames-1))
+        self.frame = frame
+        x, y = self.getFrameCoordinates(frame, self.scale)
+        self.triangulation.x[:] = x
+        self.triangulation.y[:] = y
+        self.mesh.set_array(self.values[frame])
+        self.label.set_text("step "+str(frame)+"/"+str(self.nFrames-1)+"   dx = "+str(round(self.maxDx[frame]*1000,3))+" mm")
+
+    # next step (back to the first step after the last one), returns the new step
+    def nextFrame(self):
+        self.setFrame((self.frame+1) % self.nFrames)
+        return self.frame
+
+    # copy the background after a full draw of the figure and draw the current frame over it
+    def onDraw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self.axes.draw_artist(self.mesh)
+        self.axes.draw_artist(self.label)
+
+    # draw the current frame on the canvas (only the axes are redrawn if the background is available)
+    def show(self):
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.axes.draw_artist(self.mesh)
+        self.axes.draw_artist(self.label)
+        self.canvas.blit(self.axes.bbox)
+
+    # remove the artists from the axes
+    def remove(self):
+        self.canvas.mpl_disconnect(self.drawEvent)
+        self.mesh.remove()
+        self.label.remove()
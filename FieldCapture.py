@@ -0,0 +1,141 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+FieldCapture.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# In-memory capture of the FEM fields of the pushover analysis (alternative to the text recorders of "RunTimeNodalResults").
+# The fields are read from the model with "ops.nodeDisp" and "ops.eleResponse" after every step, and stored in preallocated arrays:
+    # disp     -> (steps, nodes, 2) horizontal and vertical displacement of every node
+    # strains  -> (steps, shell elements, 32) strains of the shell elements (8 components at each of the 4 integration points)
+    # stresses -> (steps, shell elements, 32) stresses of the shell elements
+    # controlDisp -> (steps) displacement of the control node (mm)
+# The first step is the state after the gravity loads. If a list of stations (displacements of the control node in mm) is given,
+# only the first step that reaches every station is stored.
+# The arrays are written once as a compressed ".npz" file with "save", and read with "loadFieldCapture".
+# "getColumns" returns a field with one column per step (the layout of "np.loadtxt" on a recorder file), so it can be used by "ColorMapFEM.py".
+
+import numpy as np
+
+# fields that can be captured and the number of values per node or element
+fieldSizes = {"disp": 2, "strains": 32, "stresses": 32}
+
+
+class FieldCapture():
+
+    # fields -> names of the fields that are captured (see "fieldSizes")
+    # stations -> displacements of the control node (mm) at which the fields are captured (None: every step)
+    def __init__(self, fields=("disp", "strains", "stresses"), stations=None):
+        self.fields = tuple(fields)
+        self.stations = None if stations is None else np.sort(np.asarray(stations, dtype=float))
+        self.nNodes = 0
+        self.nElements = 0
+        self.nSteps = 0
+        self.nextStation = 0
+        self.arrays = {}
+        self.controlDisp = np.zeros(0)
+
+    # allocate the arrays for the given model (called by "ShearWallParametrizedAsFunction.run" before the pushover)
+    # capacity -> expected number of steps (the arrays grow if more steps are captured)
+    def setup(self, nNodes, nElements, capacity):
+        self.nNodes = nNodes
+        self.nElements = nElements
+        self.nSteps = 0
+        self.nextStation = 0
+        if self.stations is not None:
+            capacity = len(self.stations)+1
+        capacity = max(capacity, 1)
+        self.controlDisp = np.zeros(capacity)
+        self.arrays = {}
+        for field in self.fields:
+            size = self.nNodes if field == "disp" else self.nElements
+            self.arrays[field] = np.zeros((capacity, size, fieldSizes[field]))
+
+    def grow(self):
+        capacity = 2*len(self.controlDisp)
+        self.controlDisp = np.resize(self.controlDisp, capacity)
+        for field in self.fields:
+            array = self.arrays[field]
+            grown = np.zeros((capacity,)+array.shape[1:])
+            grown[0:self.nSteps] = array[0:self.nSteps]
+            self.arrays[field] = grown
+
+    # capture the current state of the model if it is needed
+    # ops -> OpenSees module, controlDisp -> current displacement of the control node (mm)
+    # returns True if the step was stored
+    def capture(self, ops, controlDisp):
+        if self.stations is not None and self.nSteps > 0:
+            if self.nextStation >= len(self.stations) or controlDisp < self.stations[self.nextStation]:
+                return False
+            while self.nextStation < len(self.stations) and controlDisp >= self.stations[self.nextStation]:
+                self.nextStation = self.nextStation+1
+
+        if self.nSteps >= len(self.controlDisp):
+            self.grow()
+
+        step = self.nSteps
+        self.controlDisp[step] = controlDisp
+        if "disp" in self.arrays:
+            disp = self.arrays["disp"][step]
+            for n in range(self.nNodes):
+                values = ops.nodeDisp(n+1)
+                disp[n,0] = values[0]
+                disp[n,1] = values[1]
+        for field in ("strains", "stresses"):
+            if field in self.arrays:
+                values = self.arrays[field][step]
+                for e in range(self.nElements):
+                    values[e,:] = ops.eleResponse(e+1, field)
+        self.nSteps = self.nSteps+1
+        return True
+
+    # captured values of a field, array of shape (steps, nodes or elements, values)
+    def getField(self, field):
+        return self.arrays[field][0:self.nSteps]
+
+    # captured values of a field with one column per step, array of shape (nodes or elements * values, steps)
+    # (same layout as np.loadtxt(file, unpack=True) on the file of an OpenSees recorder)
+    def getColumns(self, field):
+        return self.getField(field).reshape(self.nSteps, -1).T
+
+    def getControlDisp(self):
+        return self.controlDisp[0:self.nSteps]
+
+    # write the captured fields to a compressed ".npz" file
+    def save(self, pathToFile):
+        data = {"controlDisp": self.getControlDisp()}
+        for field in self.fields:
+            data[field] = self.getField(field)
+        np.savez_compressed(pathToFile, **data)
+        return pathToFile
+
+
+# read the fields saved with "FieldCapture.save"
+def loadFieldCapture(pathToFile):
+    with np.load(pathToFile) as data:
+        fields = [f for f in fieldSizes if f in data.files]
+        capture = FieldCapture(fields)
+        capture.controlDisp = np.array(data["controlDisp"])
+        capture.nSteps = len(capture.controlDisp)
+        capture.arrays = {f: np.array(data[f]) for f in fields}
+    if "disp" in capture.arrays:
+        capture.nNodes = capture.arrays["disp"].shape[1]
+    for f in ("strains", "stresses"):
+        if f in capture.arrays:
+            capture.nElements = capture.arrays[f].shape[1]
+    return capture
@@ -0,0 +1,113 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+FieldStore.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Store of the field results of a run for the readers of "ColorMapFEM.py" (see "RunResults.getStore").
+# The text files of the OpenSees recorders are converted only once to binary ".npy" files next to them:
+    # disp     -> (steps, nodes, 2)
+    # strains  -> (steps, elements, 32)
+    # stresses -> (steps, elements, 32)
+# and the ".npy" files are memory-mapped, so opening the store is immediate and only the selected steps are read from the disk.
+# If the fields were captured in memory (see "FieldCapture.py"), the store uses the arrays of the capture directly.
+# Selecting a step or a component is a slice of the array (no parsing, no copies).
+
+import os
+import numpy as np
+import FieldCapture as fieldCapture
+
+# number of components of the strains and stresses at every integration point of the shell elements
+nComponents = 8
+
+
+# convert the text file of an OpenSees recorder (one row per step) to a ".npy" file with shape (steps, items, valuesPerItem)
+# the rows are parsed one by one and written to a memory-mapped file, so the whole text is never loaded in memory
+def convertRecorderFile(pathToText, pathToNpy, valuesPerItem):
+
+    nRows = 0
+    nValues = 0
+    with open(pathToText, 'r') as f:
+        for line in f:
+            if line.strip() == "":
+                continue
+            if nRows == 0:
+                nValues = len(line.split())
+            nRows = nRows+1
+
+    temporaryPath = pathToNpy+".tmp.npy"
+    out = np.lib.format.open_memmap(temporaryPath, mode='w+', dtype=np.float64, shape=(nRows, nValues//valuesPerItem, valuesPerItem))
+    with open(pathToText, 'r') as f:
+        row = 0
+        for line in f:
+            if line.strip() == "":
+                continue
+            out[row] = np.array(line.split(), dtype=float)[0:nValues].reshape(-1, valuesPerItem)
+            row = row+1
+    out.flush()
+    del out
+    os.replace(temporaryPath, pathToNpy)
+    return pathToNpy
+
+
+# memory-mapped array of a recorder file, the file is converted only if the ".npy" file does not exist or is older than the text file
+def openRecorderFile(pathToText, valuesPerItem):
+    pathToNpy = os.path.splitext(pathToText)[0]+".npy"
+    if not os.path.exists(pathToNpy) or os.path.getmtime(pathToNpy) < os.path.getmtime(pathToText):
+        convertRecorderFile(pathToText, pathToNpy, valuesPerItem)
+    return np.load(pathToNpy, mmap_mode='r')
+
+
+class FieldStore():
+
+    # arrays -> dictionary with the fields ("disp", "strains", "stresses"), arrays of shape (steps, nodes or elements, values)
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.nSteps = min(len(a) for a in arrays.values()) if len(arrays) > 0 else 0
+
+    def getField(self, field):
+        return self.arrays[field][0:self.nSteps]
+
+    # values of a field at one step, array of shape (nodes or elements, values)
+    def getStep(self, field, step):
+        return self.arrays[field][step]
+
+    # one component of the strains or stresses at the 4 integration points, array of shape (elements, 4) or (steps, elements, 4) if step is None
+    def getComponent(self, field, comp, step=None):
+        if step is None:
+            return self.getField(field)[:, :, comp::nComponents]
+        return self.arrays[field][step][:, comp::nComponents]
+
+    # field with one column per step (the layout of "np.loadtxt" on a recorder file)
+    def getColumns(self, field):
+        return self.getField(field).reshape(self.nSteps, -1).T
+
+
+# store of the fields captured in memory
+def fromCapture(capture):
+    return FieldStore({field: capture.getField(field) for field in capture.fields})
+
+
+# store of the recorder files of a run
+# paths -> dictionary with the path of the recorder file of every field ("disp", "strains", "stresses")
+def fromRecorderFiles(paths):
+    arrays = {}
+    for field, path in paths.items():
+        if os.path.exists(path):
+            arrays[field] = openRecorderFile(path, fieldCapture.fieldSizes[field])
+    return FieldStore(arrays)
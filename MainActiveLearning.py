@@ -0,0 +1,101 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+MainActiveLearning.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# This script trains the DNN surrogate model with active learning (see "ActiveLearning.py").
+# Instead of running all the FEM analyses blindly before the training, the training and the FEM analyses are alternated,
+# and the new FEM samples are placed where the ensemble of DNNs is least certain.
+# The loop stops when the target R2 on the validation database is reached, or when the budget of FEM analyses is spent.
+# The members of the final ensemble are serialized to the path specified at the variable "path" at the end of the script
+
+
+# the guard is required because the FEM worker processes import this file again when they are created
+# (the heavy modules are imported inside the guard so that the workers do not load TensorFlow)
+if __name__ == "__main__":
+
+    import os
+    import ActiveLearning as activeLearning
+    import Normalization as normalization
+    import CurveRepresentation as curveRep
+
+    # initial training database and validation database (created by "DiscretizeCurvesAndCreateDatabase.py")
+    file1 = "TrainingDataBases/database_training.csv"
+    file2 = "TrainingDataBases/database_validation.csv"
+
+    # training database that grows with the active learning samples
+    file3 = "TrainingDataBases/database_training_active.csv"
+
+    # complete pushover curves of the active learning samples (same format as "database_complete.csv")
+    ResultsDir = 'AnalysisResults'
+    file4 = ResultsDir+"/"+"database_active.csv"
+
+    if not os.path.exists(ResultsDir):
+        os.makedirs(ResultsDir)
+
+    # stop criteria and budget of FEM analyses
+    targetR2 = 0.99
+    maxIterations = 10
+    samplesPerIteration = 32
+
+    # number of candidates scored on every iteration and number of DNNs in the committee
+    nCandidates = 2**17
+    nModels = 5
+
+    # number of FEM worker processes (None -> one per core)
+    nWorkers = None
+
+    # parameters of the static pushover analysis
+    options = {"meshHorizontal": 8,
+               "meshBE": 2,
+               "meshVertical": 10,
+               "targetDisp": 0.02,
+               "increment": 0.02/200}
+
+    # hyperparameters of the DNNs (same as in "MainNN.py")
+    trainingOptions = {"layerSizes": [200,200,200],
+                       "nEpochs": 200,
+                       "nBatchSize": 10,
+                       "validationSplit": 0.10,
+                       "earlyStop": True,
+                       "earlyStopPatience": 5}
+
+    # stations of the outputs (stored next to the training database by "DiscretizeCurvesAndCreateDatabase.py")
+    representation = curveRep.getRepresentationForFile(file1)
+    normalizer = normalization.getNormalizerForSurrogateModel(representation.nOutputs)
+
+    ensemble, history = activeLearning.runActiveLearning(normalizer, file1, file2, file3, file4,
+                                                         targetR2=targetR2,
+                                                         maxIterations=maxIterations,
+                                                         samplesPerIteration=samplesPerIteration,
+                                                         nCandidates=nCandidates,
+                                                         nModels=nModels,
+                                                         nWorkers=nWorkers,
+                                                         options=options,
+                                                         trainingOptions=trainingOptions,
+                                                         representation=representation)
+
+    for rows, r2 in history:
+        print("training rows =", rows, "  R2 =", r2)
+
+    # save the members of the ensemble
+    path = 'NeuralNetworkWeights/dnn_surrogate_model_active_{}.h5'
+    ensemble.save(path)
+    for k in range(nModels):
+        representation.save(path.format(k))
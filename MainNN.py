@@ -28,16 +28,14 @@ Department of Civil Engineering and Energy Technology
 import DataUtils as dataUtils
 import NeuralNetwork as NeuralNet
 import Normalization as normalization
+import CurveRepresentation as curveRep
+import NumpySurrogate as numpySurrogate
 import tensorflow as tf
 import time
 
 # set the seed to obtain the same results every time
 tf.random.set_seed(50)
 
-# data number of inputs and outputs
-nInputs = 11
-nOutputs = 6
-
 # skip rows or columns in the data (useful when the data comes with headers or numbering)
 startRow = 0
 startCol = 0
@@ -46,6 +44,13 @@ startCol = 0
 file1 = "TrainingDataBases/database_training.csv"
 data = dataUtils.readDataFile(file1, startRow, startCol)
 
+# stations of the pushover curve used to create the training database (6 outputs for the original stations)
+representation = curveRep.getRepresentationForFile(file1)
+
+# data number of inputs and outputs
+nInputs = 11
+nOutputs = representation.nOutputs
+
 # read the validation data file
 file2 = 'TrainingDataBases/database_validation.csv'
 dataValidation = dataUtils.readDataFile(file2, startRow, startCol)
@@ -56,7 +61,7 @@ inputData,outputData = dataUtils.splitInputsOutputs(data, nInputs, nOutputs)
 
 # read the normalization object that is created in the Normalization file, it continas the information regarding the max and min values of the input data
 # (the object will store the max and min values of every column so that we can normalize and denormalize the data at anytime)
-normalizer = normalization.getNormalizerForSurrogateModel()
+normalizer = normalization.getNormalizerForSurrogateModel(nOutputs)
 
 # normalize the inputs
 normInput = normalizer.normalizeInputs(inputData)
@@ -103,9 +108,13 @@ print('NN training time in seconds: ' + str(executionTime))
 dataUtils.getMetricsForAllVariable(nnet,normalizer,dataValidation,nInputs,nOutputs)
 
 
-# save the NN to a file
+# save the NN to a file (and the representation of the outputs next to it)
 path='NeuralNetworkWeights/dnn_surrogate_model.h5'
 nnet.save(path)
+representation.save(path)
+
+# export the weights for the numpy inference engine (used by the GUI, see "NumpySurrogate.py")
+numpySurrogate.exportWeights(path, numpySurrogate.getWeightsPath(path), representation)
 
 
 
@@ -20,12 +20,7 @@ Department of Civil Engineering and Energy Technology
 
 # Header:
 # This file creates a BPNN. Read the comments on the scripts for more details
-
-
-import tensorflow as tf
-import matplotlib.pyplot as plt
-from keras.models import Sequential
-from keras.layers import Dense
+# (TensorFlow and matplotlib are imported inside the functions, so importing this file is fast)
 
 
 # routine to create a keras sequential model (backpropagation neural network)
@@ -39,6 +34,9 @@ from keras.layers import Dense
     # include early stopping?
     # patience, or number of iterations with no improvement before stopping the algorithm
 def createSequentialModel(inputs,outputs,layerSizes,nEpochs,nBatchSize,validationSplit,earlyStop=True, earlyStopPatience = 10):
+    import tensorflow as tf
+    from keras.models import Sequential
+    from keras.layers import Dense
     
     model = Sequential()
     
@@ -115,6 +113,7 @@ def createSequentialModel(inputs,outputs,layerSizes,nEpochs,nBatchSize,validatio
 
 
 def plotHistory(history,functions,legend):
+    import matplotlib.pyplot as plt
     plt.figure()
     for f in functions:    
         plt.plot(history.history[f])
@@ -124,6 +123,7 @@ def plotHistory(history,functions,legend):
 
     
 def plotHistoryFrom(history,functions,legend,firstEpoch,xlabel,ylabel,metrics=None):
+    import matplotlib.pyplot as plt
     
     plt.rcParams.update({'font.size': 14})
     plt.rc('font', family='TimesNewRomman')
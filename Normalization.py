@@ -88,15 +88,13 @@ class SimpleNormalizer():
         return normalized    
 
 # This function contains the information regarding the input data for the RC shear wall surrogate model project
+# nOutputs -> number of outputs of the DNN surrogate model (6 for the original stations, see "CurveRepresentation.py")
 
-def getNormalizerForSurrogateModel():
+def getNormalizerForSurrogateModel(nOutputs=6):
     
     # number of inputs of the DNN surrogate model
     nInputs = 11
     
-    # number of outputs of the DNN surrogate model
-    nOutputs = 6
-    
     # normalizer object
     normalizer = SimpleNormalizer(nInputs, nOutputs);
     
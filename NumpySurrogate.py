@@ -0,0 +1,246 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+NumpySurrogate.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Inference of the DNN surrogate model with numpy only (TensorFlow is not required to use a trained model).
+# The surrogate model is a stack of Dense layers (3 hidden layers of 200 neurons with ReLU and a linear output), so a prediction is just
+# a few matrix products. The weights are exported once from the keras model to a flat ".npz" file with:
+    # exportWeights("NeuralNetworkWeights/dnn_surrogate_model.h5")  -> creates "NeuralNetworkWeights/dnn_surrogate_model.npz"
+# The ".h5" file is read with h5py, so the export also works without TensorFlow. The export is an explicit step ("MainNN.py" after the training,
+# or "python NumpySurrogate.py <model.h5>"), loading a model never writes files.
+# The ".npz" file stores the hash of the ".h5" file that it was exported from, so weights that are out of date are detected when they are loaded.
+# The class "NumpySurrogate" has the same interface as "SurrogateModel.SurrogateModel" (predict arrays of shape (N, 11)),
+# and the function "loadSurrogate" returns the numpy model if the ".npz" file exists, and the TensorFlow model otherwise.
+
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+import Normalization as normalization
+import CurveRepresentation as curveRep
+
+# activation functions supported by the numpy engine
+activations = ("relu", "linear")
+
+
+# path of the numpy weights of a trained model ("model.h5" -> "model.npz")
+def getWeightsPath(pathToModel):
+    return os.path.splitext(pathToModel)[0]+".npz"
+
+
+# hash of the ".h5" file of a trained model (the file content, the date of the file changes with a git checkout)
+def getModelHash(pathToModel):
+    with open(pathToModel, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# read the kernels, biases and activations of the Dense layers of a keras model stored in a ".h5" file
+def readKerasH5(pathToModel):
+    import h5py
+
+    kernels = []
+    biases = []
+    layerActivations = []
+    with h5py.File(pathToModel, 'r') as f:
+        config = f.attrs['model_config']
+        if isinstance(config, bytes):
+            config = config.decode('utf-8')
+        config = json.loads(config)
+
+        group = f['model_weights'] if 'model_weights' in f else f
+        for layer in config['config']['layers']:
+            if layer['class_name'] == 'InputLayer':
+                continue
+            if layer['class_name'] != 'Dense':
+                raise ValueError("Only Dense layers are supported, found: "+layer['class_name'])
+            name = layer['config']['name']
+            weightNames = [n.decode('utf-8') if isinstance(n, bytes) else n for n in group[name].attrs['weight_names']]
+            weights = {n.split('/')[-1].split(':')[0]: np.array(group[name][n]) for n in weightNames}
+            kernels.append(weights['kernel'])
+            biases.append(weights.get('bias', np.zeros(weights['kernel'].shape[1], dtype=weights['kernel'].dtype)))
+            layerActivations.append(layer['config']['activation'])
+
+    return kernels, biases, layerActivations
+
+
+# read the kernels, biases and activations of the Dense layers of a keras model that is already loaded (or trained)
+def readKerasModel(model):
+    kernels = []
+    biases = []
+    layerActivations = []
+    for layer in model.layers:
+        weights = layer.get_weights()
+        if len(weights) == 0:
+            continue
+        kernels.append(weights[0])
+        biases.append(weights[1] if len(weights) > 1 else np.zeros(weights[0].shape[1], dtype=weights[0].dtype))
+        layerActivations.append(layer.get_config()['activation'])
+    return kernels, biases, layerActivations
+
+
+# export the weights of a keras model to a ".npz" file
+# model -> path of the ".h5" file or a keras model
+# pathToNpz -> output file, by default next to the ".h5" file with the extension ".npz"
+# representation -> stations of the outputs, by default the representation stored next to the model (it is stored in the ".npz" file too)
+def exportWeights(model, pathToNpz=None, representation=None):
+
+    if isinstance(model, str):
+        if pathToNpz is None:
+            pathToNpz = getWeightsPath(model)
+        if representation is None:
+            representation = curveRep.getRepresentationForFile(model)
+        kernels, biases, layerActivations = readKerasH5(model)
+        modelHash = getModelHash(model)
+    else:
+        if pathToNpz is None:
+            raise ValueError("The path of the .npz file is required when exporting a keras model object")
+        if representation is None:
+            representation = curveRep.getDefaultRepresentation()
+        kernels, biases, layerActivations = readKerasModel(model)
+        modelHash = ""
+
+    for activation in layerActivations:
+        if activation not in activations:
+            raise ValueError("Activation not supported by the numpy engine: "+str(activation))
+
+    data = {"activations": np.array(layerActivations),
+            "stations": representation.stations,
+            "minDisp": representation.minDisp,
+            "interpolate": representation.interpolate,
+            "modelHash": modelHash}
+    for i in range(len(kernels)):
+        data["kernel_"+str(i)] = kernels[i]
+        data["bias_"+str(i)] = biases[i]
+    np.savez(pathToNpz, **data)
+    return pathToNpz
+
+
+class NumpySurrogate():
+
+    # pathToWeights -> ".npz" file created with "exportWeights"
+    # dtype -> np.float32 (same precision as keras, faster) or np.float64
+    # batchSize -> maximum number of rows that are evaluated at once (the buffers of the layers are allocated once for this size)
+    def __init__(self, pathToWeights, dtype=np.float32, batchSize=65536):
+
+        self.path = pathToWeights
+        self.dtype = dtype
+        self.batchSize = batchSize
+
+        with np.load(pathToWeights) as data:
+            self.activations = [str(a) for a in data["activations"]]
+            nLayers = len(self.activations)
+            self.kernels = [np.ascontiguousarray(data["kernel_"+str(i)], dtype=dtype) for i in range(nLayers)]
+            self.biases = [np.asarray(data["bias_"+str(i)], dtype=dtype) for i in range(nLayers)]
+            self.representation = curveRep.CurveRepresentation(data["stations"], float(data["minDisp"]), bool(data["interpolate"]))
+
+        self.nInputs = self.kernels[0].shape[0]
+        self.nOutputs = self.kernels[-1].shape[1]
+        self.normalizer = normalization.getNormalizerForSurrogateModel(self.nOutputs)
+
+        # min and max values of the inputs as arrays (the normalization is a single broadcast operation)
+        self.minValues = np.asarray(self.normalizer.minValuesIn, dtype=float)
+        self.rangeValues = np.asarray(self.normalizer.maxValuesIn, dtype=float) - self.minValues
+
+        # output buffer of every layer, allocated for the largest batch that has been evaluated (up to batchSize)
+        self.buffers = None
+
+    def getBuffers(self, nRows):
+        if self.buffers is None or len(self.buffers[0]) < nRows:
+            size = min(max(nRows, 1), self.batchSize)
+            self.buffers = [np.empty((size, kernel.shape[1]), dtype=self.dtype) for kernel in self.kernels]
+        return [buffer[0:nRows] for buffer in self.buffers]
+
+    # forward pass of a block of normalized rows (at most batchSize rows), the result is written in the buffer of the last layer
+    def forward(self, normInputs):
+        buffers = self.getBuffers(len(normInputs))
+        values = normInputs
+        for i in range(len(self.kernels)):
+            np.matmul(values, self.kernels[i], out=buffers[i])
+            buffers[i] += self.biases[i]
+            if self.activations[i] == "relu":
+                np.maximum(buffers[i], 0, out=buffers[i])
+            values = buffers[i]
+        return values
+
+    # normalize the input vectors (same result as "normalizer.normalizeInputs")
+    def normalizeInputs(self, inputs):
+        inputs = np.asarray(inputs, dtype=float).reshape(-1, self.nInputs)
+        return ((inputs - self.minValues) / self.rangeValues).astype(self.dtype)
+
+    # predict the base shear at the stations for an array of input vectors
+    # inputs -> array of shape (N, 11) with the real (not normalized) values, in the order of "InputVariableBounds.py"
+    # returns an array of shape (N, nOutputs)
+    def predict(self, inputs):
+        return self.predictNormalized(self.normalizeInputs(inputs))
+
+    # predict from input vectors that are already normalized (like the "predict" function of the keras model)
+    def predictNormalized(self, normInputs):
+        normInputs = np.asarray(normInputs, dtype=self.dtype).reshape(-1, self.nInputs)
+        nRows = len(normInputs)
+        predOut = np.empty((nRows, self.nOutputs), dtype=self.dtype)
+        for start in range(0, nRows, self.batchSize):
+            end = min(start+self.batchSize, nRows)
+            predOut[start:end] = self.forward(normInputs[start:end])
+        return predOut
+
+    # predict the base shear at the stations for a single wall given as 11 values (returns an array of size nOutputs)
+    def predictOne(self, *values):
+        return self.predict(np.asarray(values))[0]
+
+    # points of the predicted pushover curves: x values (nStations) and y values (N, nStations)
+    def predictCurvePoints(self, inputs):
+        return self.representation.getCurvePoints(self.predict(inputs))
+
+    # dense predicted pushover curves with a monotone interpolation between the stations
+    def predictDenseCurves(self, inputs, xDense=None, nPoints=200):
+        return self.representation.reconstruct(self.predict(inputs), xDense, nPoints)
+
+
+# raise an error if the ".npz" file was not exported from the current ".h5" file (the model was trained again after the export)
+def checkWeights(pathToModel, pathToNpz):
+    if not os.path.exists(pathToModel):
+        return
+    with np.load(pathToNpz) as data:
+        modelHash = str(data["modelHash"]) if "modelHash" in data.files else ""
+    if modelHash == "":
+        print("The numpy weights "+pathToNpz+" were exported from a keras model object, they can not be checked against "+pathToModel)
+    elif modelHash != getModelHash(pathToModel):
+        raise ValueError("The numpy weights "+pathToNpz+" are out of date, export them again with: python NumpySurrogate.py "+pathToModel)
+
+
+# load a trained surrogate model (no file is written, see "exportWeights")
+# the numpy engine is used if the ".npz" file exists (TensorFlow is not imported), otherwise the TensorFlow model is loaded (see "SurrogateModel.py")
+def loadSurrogate(pathToModel, dtype=np.float32):
+
+    pathToNpz = getWeightsPath(pathToModel)
+    if not os.path.exists(pathToNpz):
+        print("The numpy weights "+pathToNpz+" do not exist, the TensorFlow model is used instead (export them with: python NumpySurrogate.py "+pathToModel+")")
+        import SurrogateModel as surrogateModel
+        return surrogateModel.SurrogateModel(pathToModel)
+
+    checkWeights(pathToModel, pathToNpz)
+    return NumpySurrogate(pathToNpz, dtype)
+
+
+# export the weights of a trained model: python NumpySurrogate.py [path of the ".h5" file]
+if __name__ == "__main__":
+    pathToModel = sys.argv[1] if len(sys.argv) > 1 else 'NeuralNetworkWeights/dnn_surrogate_model.h5'
+    print("Numpy weights exported to", exportWeights(pathToModel))
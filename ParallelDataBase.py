@@ -0,0 +1,384 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+ParallelDataBase.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Functions to generate the FEM database in parallel using a pool of worker processes.
+# Every worker is a separate python process, so every worker has its own OpenSeesPy interpreter (the global "ops" module is never shared).
+# The input vectors are placed in the task queue of the pool, the workers pull them one by one and send back the pushover curves,
+# and a single writer (the main process) appends the results to the database file.
+
+# The database file has the same format as the one created by "CreateDataBase_Loop.py" (3 rows per data point: input vector, x values and y values).
+# Each data point is written with a single write call followed by a flush, so killing the run leaves at most one incomplete data point at the end of the file.
+# That incomplete data point is removed by "repairDataBaseFile" before appending new results, so the generation can always be resumed.
+# If the path of the database ends with ".curves", the results are appended to a binary curve store instead (see "CurveStore.py").
+# A task never blocks the generation: an exception in the worker is reported as a failed sample (error_callback of the pool),
+# and the main process checks periodically that the worker of every running task is still alive, so a task that is lost
+# (the worker crashed or was killed) or that runs longer than the option "jobTimeout" (seconds, its worker is killed) is reported as failed.
+
+import os
+import csv
+import io
+import time
+import queue
+import signal
+import random as rnd
+import multiprocessing as mp
+import InputVariableBounds as inputBounds
+import CurveStore as curveStore
+
+
+# generate a random input vector (11 values) using the same rules as the script "CreateDataBase_Loop.py"
+# rng -> an instance of random.Random (use a seeded instance to obtain reproducible vectors)
+def getRandomInputVector(rng=rnd):
+
+    minValues = inputBounds.minValues
+    maxValues = inputBounds.maxValues
+
+    # thickness
+    t = rng.uniform(minValues[0],maxValues[0])
+
+    # total length of wall
+    lw = rng.uniform(t*6,maxValues[1])
+
+    # boudary element length as percentage of the total lenght
+    lbe = rng.uniform(minValues[2],maxValues[2])
+
+    # ratio of reinforcement for the boundary elements, longitudinal (l) and transversal (t)
+    pl_be = rng.uniform(minValues[3],maxValues[3])
+    pt_be = rng.uniform(minValues[4],maxValues[4])
+
+    # ratio of reinforcement for the web, longitudinal (l) and transversal (t)
+    pl_web = rng.uniform(minValues[5], 0.6*pl_be)
+    pt_web = rng.uniform(minValues[6], 0.6*pt_be)
+
+    #axial force as percentage of the maximum allowable load for that wall Po = Ag*0.85*f'c
+    paxial = rng.uniform(minValues[7],maxValues[7])
+
+    # heihg of the wall
+    height = rng.uniform(minValues[8],maxValues[8])
+
+    # compressive strength in MPa
+    fc = rng.uniform(minValues[9],maxValues[9])
+
+    # yield strength in MPa
+    fy = rng.uniform(minValues[10],maxValues[10])
+
+    return [t,lw,lbe,pl_be,pt_be,pl_web,pt_web,paxial,height,fc,fy]
+
+
+# queue where the workers report the tasks that they start (key, process id, start time), see "runJobs"
+startedTasks = None
+
+
+# the workers ignore the keyboard interrupt, only the main process handles it (and terminates the pool)
+def initWorker(startQueue=None):
+    global startedTasks
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    startedTasks = startQueue
+
+
+# run a job inside a worker and tell the main process which worker runs it
+# returns the key of the task and the result of "runSample"
+def runTrackedSample(key, job):
+    if startedTasks is not None:
+        startedTasks.put((key, os.getpid(), time.time()))
+    return key, runSample(job)
+
+
+# early-abort rules of the pushover analysis from the analysis options (the rules are functions, so they are created inside the worker)
+    # "abortMinDisp" -> stop a sample that can not reach this displacement (mm) with the budget of "maxIterations" iterations or "maxWallTime" seconds
+def getAbortRules(options):
+    import PushoverDriver as pushoverDriver
+
+    rules = []
+    if options.get("abortMinDisp") is not None:
+        rules.append(pushoverDriver.unreachableDisplacement(options["abortMinDisp"], options.get("maxIterations"), options.get("maxWallTime")))
+    elif options.get("maxWallTime") is not None:
+        rules.append(pushoverDriver.wallTimeLimit(options["maxWallTime"]))
+    return rules
+
+
+# run the static pushover analysis for one input vector (this function is executed inside a worker process)
+# job -> tuple with (index, input vector, dictionary with the analysis options)
+# if the option "telemetryDir" is given, the telemetry of every step is written to "telemetryDir/sample_<index>_<attempt>.csv"
+# returns the job, the x and y values of the pushover curve, the wall time in seconds and the error message (None if there was no error)
+def runSample(job):
+
+    index, params, options = job
+    startTime = time.time()
+    error = None
+
+    logFile = None
+    if options.get("telemetryDir") is not None:
+        logFile = os.path.join(options["telemetryDir"], "sample_"+str(index)+"_"+str(options.get("attempt",0))+".csv")
+
+    # an error inside OpenSees (or when OpenSeesPy is loaded) must not stop the other workers, the sample is reported as an empty curve
+    try:
+        # the FEM module is imported here so that only the worker processes load OpenSeesPy
+        import ShearWallParametrizedAsFunction as shearWallAsFunc
+
+        [x,y],ops = shearWallAsFunc.run(*params,
+                                        meshH=options.get("meshHorizontal",8),
+                                        meshBE=options.get("meshBE",2),
+                                        meshV=options.get("meshVertical",10),
+                                        targetDisp=options.get("targetDisp",0.02),
+                                        increment=options.get("increment",0.0001),
+                                        performPushOver=True,
+                                        plotValidation=False,
+                                        plotDeformedGravity=False,
+                                        plotPushOverResults=False,
+                                        printProgression=False,
+                                        algorithm=options.get("algorithm",'NewtonLineSearch'),
+                                        maxUnconvergedSteps=options.get("maxUnconvergedSteps",10),
+                                        adaptive=options.get("adaptive",False),
+                                        recoverSteps=options.get("recoverSteps",False),
+                                        logFile=logFile,
+                                        abortRules=getAbortRules(options))
+    except Exception as e:
+        print("SAMPLE", index, "failed:", e)
+        error = str(e)
+        x = []
+        y = []
+
+    wallTime = time.time() - startTime
+    return job, [float(v) for v in x], [float(v) for v in y], wallTime, error
+
+
+# remove an incomplete data point at the end of the database file (for example, if the previous run was killed while writing)
+# returns the number of complete data points stored in the file
+def repairDataBaseFile(pathToFile):
+
+    if not os.path.exists(pathToFile):
+        return 0
+
+    with open(pathToFile, 'rb') as f:
+        content = f.read()
+
+    # only the lines that end with a line break are complete
+    lines = content.split(b'\n')[:-1]
+
+    # there are 3 rows per data point
+    nSamples = int(len(lines)/3)
+    validLength = sum(len(line)+1 for line in lines[0:nSamples*3])
+
+    if validLength < len(content):
+        print("Removing an incomplete data point at the end of the file:", pathToFile)
+        with open(pathToFile, 'r+b') as f:
+            f.truncate(validLength)
+
+    return nSamples
+
+
+# write the 3 rows of one data point with a single write call and force the data to the disk
+def appendSample(f, params, x, y):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(params)
+    writer.writerow(x)
+    writer.writerow(y)
+    f.write(buffer.getvalue())
+    f.flush()
+    os.fsync(f.fileno())
+
+
+# database file with 3 rows per data point, opened for appending
+# it has the same interface as the binary curve store (append, len, getLastParams, close)
+class CsvDataBase():
+
+    def __init__(self, pathToFile):
+        self.pathToFile = pathToFile
+        self.nSamples = repairDataBaseFile(pathToFile)
+        self.lastParams = None
+        self.f = open(pathToFile, 'a', newline='')
+
+    def __len__(self):
+        return self.nSamples
+
+    def append(self, params, x, y):
+        appendSample(self.f, params, x, y)
+        self.nSamples = self.nSamples + 1
+        self.lastParams = list(params)
+
+    # input vector of the last data point in the file
+    def getLastParams(self):
+        if self.lastParams is None and self.nSamples > 0:
+            with open(self.pathToFile, newline='') as f:
+                rows = list(csv.reader(f))
+            self.lastParams = [float(v) for v in rows[-3]]
+        return self.lastParams
+
+    def close(self):
+        self.f.close()
+
+
+# open a database for appending the results, the format is selected by the extension of the path:
+# "*.curves" -> binary curve store, otherwise -> csv file with 3 rows per data point
+def openDataBase(pathToFile):
+
+    resultsDir = os.path.dirname(pathToFile)
+    if resultsDir != "" and not os.path.exists(resultsDir):
+        os.makedirs(resultsDir)
+
+    if pathToFile.endswith(curveStore.extension):
+        return curveStore.CurveStore(pathToFile)
+    return CsvDataBase(pathToFile)
+
+
+# run the given jobs in a pool of worker processes
+# every job is a tuple with (index, input vector, dictionary with the analysis options)
+# onResult -> function called by the main process after each analysis as onResult(job, x, y, wallTime, error)
+#             it can return a list of new jobs that are added to the queue (for example, to re-run a sample with a different solver)
+#             the jobs that fail in the worker, are lost or exceed the option "jobTimeout" are reported with an empty curve and the error message
+# nWorkers -> number of worker processes (by default, one per core)
+# pollInterval -> seconds between the checks of the running tasks
+def runJobs(jobs, onResult, nWorkers=None, pollInterval=5):
+
+    if len(jobs) == 0:
+        return
+
+    if nWorkers is None:
+        nWorkers = os.cpu_count()
+
+    # one thread per worker, otherwise the linear algebra libraries of the workers compete for the same cores
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+    # the results are sent back to the main process through this queue as (key, (job, x, y, wallTime, error))
+    results = queue.Queue()
+
+    # the "spawn" context creates clean processes, every one of them with its own OpenSeesPy interpreter
+    context = mp.get_context("spawn")
+    # the start messages are written directly to the pipe (SimpleQueue), so they are not lost if the worker dies just after
+    startQueue = context.SimpleQueue()
+    pool = context.Pool(processes=nWorkers, initializer=initWorker, initargs=(startQueue,))
+
+    # pending -> key: job of the tasks without result, running -> key: (process id, start time) of the started tasks
+    pending = {}
+    running = {}
+    counter = {"next": 0}
+
+    def submit(job):
+        key = counter["next"]
+        counter["next"] = key + 1
+        pending[key] = job
+        pool.apply_async(runTrackedSample, (key, job), callback=results.put,
+                         error_callback=lambda e, key=key, job=job: results.put((key, (job, [], [], 0.0, "worker error: "+str(e)))))
+
+    # report the lost and the hung tasks as failed
+    def checkRunningTasks():
+        while not startQueue.empty():
+            key, pid, startTime = startQueue.get()
+            if key in pending:
+                running[key] = (pid, startTime)
+
+        alive = set(p.pid for p in mp.active_children())
+        for key, (pid, startTime) in list(running.items()):
+            if key not in pending:
+                del running[key]
+                continue
+            job = pending[key]
+            timeout = job[2].get("jobTimeout")
+            if pid not in alive:
+                error = "the worker process died"
+            elif timeout is not None and time.time()-startTime > timeout:
+                error = "the analysis exceeded the job timeout ("+str(timeout)+" s)"
+                os.kill(pid, signal.SIGTERM)
+            else:
+                continue
+            print("SAMPLE", job[0], "failed:", error)
+            results.put((key, (job, [], [], time.time()-startTime, error)))
+            del running[key]
+
+    for job in jobs:
+        submit(job)
+
+    try:
+        while len(pending) > 0:
+            try:
+                key, (job, x, y, wallTime, error) = results.get(timeout=pollInterval)
+            except queue.Empty:
+                checkRunningTasks()
+                continue
+
+            # the result of a task that was already reported as failed is ignored
+            if key not in pending:
+                continue
+            del pending[key]
+            running.pop(key, None)
+
+            newJobs = onResult(job, x, y, wallTime, error)
+            if newJobs is not None:
+                for newJob in newJobs:
+                    submit(newJob)
+
+        # all the results were received, the workers are idle (close would wait forever for the tasks of a lost worker)
+        pool.terminate()
+
+    except KeyboardInterrupt:
+        print("Generation interrupted, the database file is consistent and the run can be resumed")
+        pool.terminate()
+
+    finally:
+        pool.join()
+
+
+# run the analysis of all the given input vectors in parallel and append the results to the database file
+# inputVectors -> list of input vectors (each one with the 11 input values)
+# nWorkers -> number of worker processes (by default, one per core)
+# minDisp -> only the curves that converge to more than this displacement (in mm) are stored
+# returns the number of stored data points
+def generateDataBase(inputVectors, pathToFile, nWorkers=None, options=None, minDisp=10):
+
+    if options is None:
+        options = {}
+
+    dataBase = openDataBase(pathToFile)
+
+    jobs = [(i, list(params), options) for i, params in enumerate(inputVectors)]
+    counter = {"stored": 0, "finished": 0}
+    startTime = time.time()
+
+    # the writer, executed in the main process every time a worker finishes an analysis
+    def writeResult(job, x, y, wallTime, error):
+        index, params, options = job
+        counter["finished"] = counter["finished"] + 1
+
+        # only keep the data points that converge to more than 1cm of displacement
+        maxX = max(x) if len(x) > 0 else 0
+        if maxX > minDisp:
+            dataBase.append(params, x, y)
+            counter["stored"] = counter["stored"] + 1
+
+        printProgress(index, counter["finished"], len(jobs), maxX, wallTime, startTime)
+
+    try:
+        runJobs(jobs, writeResult, nWorkers)
+    finally:
+        dataBase.close()
+
+    return counter["stored"]
+
+
+# print a line with the progression of the generation
+def printProgress(index, finished, total, maxX, wallTime, startTime):
+    elapsed = time.time() - startTime
+    print("SAMPLE", index, "finished (", finished, "/", total, ")",
+          "  maxDisp =", round(maxX,2),
+          "  time =", round(wallTime,1), "s",
+          "  throughput =", round(finished/elapsed*3600,1), "samples/hour")
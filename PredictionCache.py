@@ -0,0 +1,120 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+PredictionCache.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Cache of the predictions of the surrogate model for the GUI (see "AppGUI.py").
+# The sliders of the GUI have 101 integer positions, so the input vectors are discrete: an input vector is identified by the positions
+# of the 11 sliders (in the order of the inputs of the model). The predictions are stored in a LRU cache with this key:
+    # a configuration that was already predicted (redraws, going back and forth with a slider, the same random configuration) is not predicted again
+    # when a configuration is not in the cache, the neighbouring positions (+-1) of the slider that is being moved are predicted in the same batch,
+    # so the next step of the slider is usually already in the cache
+# The cache counts the hits and misses, and the oldest entries are removed when the size limit is reached.
+
+from collections import OrderedDict
+import numpy as np
+
+
+class PredictionCache():
+
+    # predict -> function that predicts an array of input vectors of shape (N, nInputs), for example "surrogate.predict"
+    # minValues, maxValues -> values of the inputs at the first and last positions of the sliders
+    # nPositions -> number of positions of the sliders (0 to nPositions-1)
+    # maxSize -> maximum number of predictions stored
+    # prefetchRange -> number of neighbouring positions predicted on each side of the moving slider (0 to disable the prefetch)
+    def __init__(self, predict, minValues, maxValues, nPositions=101, maxSize=20000, prefetchRange=1):
+        self.predictFunction = predict
+        self.minValues = np.asarray(minValues, dtype=float)
+        self.maxValues = np.asarray(maxValues, dtype=float)
+        self.nPositions = nPositions
+        self.maxSize = maxSize
+        self.prefetchRange = prefetchRange
+
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+    # input vectors of the given slider positions (array of shape (N, nInputs)), same mapping as "myVariable.getRealValue"
+    def positionsToInputs(self, positions):
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        return self.minValues + (positions/(self.nPositions-1)) * (self.maxValues-self.minValues)
+
+    def store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    # neighbouring keys of the moving slider that are not in the cache
+    def getPrefetchKeys(self, key, activeIndex):
+        keys = []
+        if activeIndex is None or self.prefetchRange <= 0:
+            return keys
+        for step in range(1, self.prefetchRange+1):
+            for sign in (-1, 1):
+                position = key[activeIndex] + sign*step
+                if position < 0 or position >= self.nPositions:
+                    continue
+                neighbour = key[0:activeIndex] + (position,) + key[activeIndex+1:]
+                if neighbour not in self.entries:
+                    keys.append(neighbour)
+        return keys
+
+    # prediction of the configuration given by the slider positions (tuple of nInputs integers)
+    # activeIndex -> index of the input of the slider that is being moved (its neighbours are prefetched on a miss)
+    # returns an array of size nOutputs
+    def predict(self, positions, activeIndex=None):
+        key = tuple(int(p) for p in positions)
+
+        if key in self.entries:
+            self.hits = self.hits + 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses = self.misses + 1
+        keys = [key] + self.getPrefetchKeys(key, activeIndex)
+        predOut = np.asarray(self.predictFunction(self.positionsToInputs(keys)))
+        self.prefetched = self.prefetched + len(keys)-1
+
+        # the prefetched neighbours are stored first, so the requested configuration is the most recent entry
+        for i in range(len(keys)-1, -1, -1):
+            value = predOut[i].copy()
+            value.setflags(write=False)
+            self.store(keys[i], value)
+        return self.entries[key]
+
+    # store predictions that were computed elsewhere (for example, the sweeps of "SensitivitySweep.py")
+    # keys -> list of tuples with the slider positions, predOut -> array of shape (len(keys), nOutputs)
+    def storeMany(self, keys, predOut):
+        for i in range(len(keys)):
+            if keys[i] in self.entries:
+                continue
+            value = np.array(predOut[i])
+            value.setflags(write=False)
+            self.store(tuple(keys[i]), value)
+
+    def clear(self):
+        self.entries.clear()
+
+    # hit ratio and counters (for the console of the GUI)
+    def getStats(self):
+        total = self.hits + self.misses
+        ratio = self.hits/total if total > 0 else 0.0
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses, "prefetched": self.prefetched, "hitRatio": ratio}
@@ -0,0 +1,148 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+PushoverCurvePlot.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Incremental rendering of the predicted pushover curve in the GUI (see "AppGUI.py").
+# The predicted curve is a single persistent line that is updated with "set_data", and the previous predictions are kept as "ghost" curves
+# in a ring buffer of fixed size (a single LineCollection), so the cost of a redraw does not grow with the number of updates.
+# Both artists are animated and rendered with blitting:
+    # a full draw of the figure (resize, new FEM curve, new axis limits) stores the static background (axes, grid, labels, FEM curves)
+    # an update only restores the background, draws the ghost curves and the current curve, and blits the axes
+# The y axis only changes (full draw) when a curve does not fit in the current limits, or when the curves become much smaller than the limits.
+
+from collections import deque
+import numpy as np
+from matplotlib.collections import LineCollection
+
+
+class PushoverCurvePlot():
+
+    # axes -> matplotlib axes of the pushover curve (inside a tk canvas)
+    # nGhosts -> number of previous predictions that are shown as ghost curves
+    def __init__(self, axes, nGhosts=20, label="NN prediction"):
+        self.axes = axes
+        self.figure = axes.figure
+        self.canvas = self.figure.canvas
+        self.background = None
+
+        # current prediction (persistent line)
+        self.line, = axes.plot([], [], color="red", linewidth=2, label=label, animated=True)
+
+        # previous predictions (ring buffer)
+        self.ghosts = deque(maxlen=nGhosts)
+        self.ghostCollection = LineCollection([], colors="lightgrey", linewidths=1, animated=True)
+        axes.add_collection(self.ghostCollection)
+
+        # lines that are part of the background (FEM results and frozen predictions)
+        self.staticLines = []
+
+        self.current = None
+        self.yMax = None
+
+        self.updateLegend()
+        self.canvas.mpl_connect('draw_event', self.onDraw)
+
+    # a full draw of the figure: store the background (without the animated artists) and draw the animated artists on top
+    def onDraw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.drawAnimated()
+
+    def drawAnimated(self):
+        self.axes.draw_artist(self.ghostCollection)
+        self.axes.draw_artist(self.line)
+
+    # maximum base shear of all the visible curves
+    def getDataMax(self):
+        values = [0]
+        if self.current is not None:
+            values.append(np.max(self.current[1]))
+        for ghost in self.ghosts:
+            values.append(np.max(ghost[:,1]))
+        for line in self.staticLines:
+            if len(line.get_ydata()) > 0:
+                values.append(np.max(line.get_ydata()))
+        return max(values)
+
+    # update the limits of the y axis if needed, returns True if they changed (a full draw is needed)
+    def updateLimits(self):
+        dataMax = self.getDataMax()
+        if dataMax <= 0:
+            return False
+        if self.yMax is None or dataMax > self.yMax or dataMax < 0.4*self.yMax:
+            self.yMax = dataMax*1.1
+            self.axes.set_ylim(-0.02*self.yMax, self.yMax)
+            return True
+        return False
+
+    # show a new prediction: the previous one becomes a ghost curve
+    def update(self, xdata, ydata):
+        if self.current is not None:
+            self.ghosts.append(np.column_stack(self.current))
+            self.ghostCollection.set_segments(list(self.ghosts))
+
+        self.current = (np.asarray(xdata, dtype=float), np.asarray(ydata, dtype=float))
+        self.line.set_data(self.current[0], self.current[1])
+
+        if self.updateLimits() or self.background is None:
+            self.redraw()
+        else:
+            self.blit()
+
+    # restore the background and draw only the animated artists
+    def blit(self):
+        self.canvas.restore_region(self.background)
+        self.drawAnimated()
+        self.canvas.blit(self.axes.bbox)
+        self.canvas.flush_events()
+
+    # full draw of the figure (the background is stored again in "onDraw")
+    def redraw(self):
+        self.canvas.draw()
+        self.canvas.flush_events()
+
+    # add a static curve (for example, the FEM pushover curve), it becomes part of the background
+    def addStaticCurve(self, x, y, **style):
+        line, = self.axes.plot(x, y, **style)
+        self.staticLines.append(line)
+        self.updateLimits()
+        self.updateLegend()
+        self.redraw()
+        return line
+
+    # copy the current prediction as a static curve (for example, the prediction that is compared with a FEM analysis)
+    def freezeCurrent(self, **style):
+        if self.current is None:
+            return None
+        return self.addStaticCurve(self.current[0], self.current[1], **style)
+
+    def updateLegend(self):
+        self.axes.legend(loc='lower right')
+
+    # remove the ghost curves and the static curves (the current prediction is kept)
+    def clear(self):
+        for line in self.staticLines:
+            line.remove()
+        self.staticLines = []
+        self.ghosts.clear()
+        self.ghostCollection.set_segments([])
+        self.yMax = None
+        self.updateLimits()
+        self.updateLegend()
+        self.redraw()
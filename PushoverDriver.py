@@ -0,0 +1,348 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+PushoverDriver.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Adaptive displacement control for the static pushover analysis (see "ShearWallParametrizedAsFunction.py").
+# Instead of a fixed increment, the size of the step changes with the difficulty of the analysis:
+    # when a step converges in a few iterations, the next increment is larger (up to maxIncrement)
+    # when a step does not converge, the same increment is tried with a chain of fallback algorithms (ModifiedNewton, KrylovNewton, BFGS)
+    # the fallback algorithm that converged is tried first in the next steps, until a step converges easily again (then the main algorithm is used)
+    # if all the algorithms fail, the increment is cut and the step is tried again (down to minIncrement)
+# Only the converged steps are stored in the pushover curve (a failed step is reverted by OpenSees).
+# The analysis stops when the target displacement is reached, when the increment can not be cut anymore,
+# or when the number of failed steps is larger than maxFailures.
+# A step never passes the next of the given stations (the displacements where the curves are discretized, see "CurveDiscretization.py"),
+# so there is always a converged point exactly at every station and the training targets do not depend on the size of the steps.
+# "recoverStep" is used by the fixed-increment analysis of "ShearWallParametrizedAsFunction.run" (only with recoverSteps=True): a fixed step that fails is tried again with the
+# fallback algorithms and split into smaller sub-steps, so the converged points stay on the grid of the fixed increment.
+# The model, the reference load pattern and the analysis objects (system, numberer, test) must be defined before calling "run".
+# The analysis also stops before the next attempt of a step if its "AnalysisControl.CancelToken" is cancelled (abortReason = "cancelled").
+
+# Every attempt of a step (converged or not) is recorded in a "StepTelemetry" object: algorithm, increment, number of iterations, last norm of the
+# convergence test, wall time, converged flag, displacement and base shear. The rows can also be streamed to a csv file while the analysis runs.
+# Early-abort rules are functions that receive the telemetry after every attempt and return the reason to stop the analysis (None to continue):
+    # unreachableDisplacement -> stop when the minimum displacement of a useful sample (10 mm) can not be reached with the remaining budget
+    # of iterations or wall time, at the rate of the last steps
+    # wallTimeLimit -> stop after a maximum wall time
+
+import os
+import time
+import numpy as np
+import openseespy.opensees as ops
+
+# the algorithms that are tried (in this order) when a step does not converge with the main algorithm
+fallbackAlgorithms = ('ModifiedNewton', 'KrylovNewton', 'BFGS')
+
+# columns of the telemetry (one row per attempt of a step)
+telemetryColumns = ("attempt", "step", "algorithm", "increment", "iterations", "norm", "wallTime", "converged", "disp", "baseShear")
+
+
+# last norm of the convergence test (nan if it is not available)
+def getLastNorm():
+    try:
+        norms = ops.testNorm()
+    except Exception:
+        return float('nan')
+    if isinstance(norms, (list, tuple)):
+        return float(norms[-1]) if len(norms) > 0 else float('nan')
+    return float(norms)
+
+
+class StepTelemetry():
+
+    # logFile -> path of a csv file (or an open file) where the rows are written while the analysis runs (optional)
+    def __init__(self, logFile=None):
+        self.rows = []
+        self.nIterations = 0
+        self.nConverged = 0
+        self.disp = 0.0
+        self.startTime = time.perf_counter()
+        self.abortReason = None
+        self.stats = {}
+
+        self.log = None
+        self.ownLog = False
+        if logFile is not None:
+            if hasattr(logFile, 'write'):
+                self.log = logFile
+            else:
+                folder = os.path.dirname(logFile)
+                if folder != "":
+                    os.makedirs(folder, exist_ok=True)
+                self.log = open(logFile, 'w')
+                self.ownLog = True
+            self.log.write(",".join(telemetryColumns)+"\n")
+
+    # record one attempt of a step
+    # increment and disp in mm, base shear in kN, wall time in seconds
+    def record(self, step, algorithm, increment, iterations, norm, wallTime, converged, disp, baseShear):
+        row = (len(self.rows), step, algorithm, increment, iterations, norm, wallTime, converged, disp, baseShear)
+        self.rows.append(row)
+        self.nIterations = self.nIterations + iterations
+        if converged:
+            self.nConverged = self.nConverged + 1
+            self.disp = disp
+        if self.log is not None:
+            self.log.write(",".join(str(v) for v in row)+"\n")
+            self.log.flush()
+
+    # time since the start of the analysis (s)
+    def getElapsedTime(self):
+        return time.perf_counter() - self.startTime
+
+    # check the early-abort rules, returns the reason to stop (None to continue)
+    def checkAbortRules(self, abortRules):
+        if abortRules is None:
+            return None
+        for rule in abortRules:
+            reason = rule(self)
+            if reason is not None:
+                self.abortReason = reason
+                return reason
+        return None
+
+    # the telemetry as a dictionary of arrays (one array per column)
+    def toArrays(self):
+        arrays = {}
+        for i in range(len(telemetryColumns)):
+            values = [row[i] for row in self.rows]
+            arrays[telemetryColumns[i]] = np.array(values, dtype=object if telemetryColumns[i] == "algorithm" else float)
+        arrays["converged"] = arrays["converged"].astype(bool)
+        return arrays
+
+    def close(self):
+        if self.log is not None and self.ownLog:
+            self.log.close()
+        self.log = None
+
+
+# early-abort rule: the displacement minDisp (mm) can not be reached with the remaining budget of iterations or wall time (s)
+# the rate (mm per iteration and mm per second) is measured over the last "window" attempts
+def unreachableDisplacement(minDisp=10, maxIterations=None, maxWallTime=None, window=20):
+    def rule(telemetry):
+        if telemetry.disp >= minDisp:
+            return None
+        if maxIterations is not None and telemetry.nIterations >= maxIterations:
+            return "iteration budget exhausted at "+str(round(telemetry.disp,2))+" mm"
+        if maxWallTime is not None and telemetry.getElapsedTime() >= maxWallTime:
+            return "time budget exhausted at "+str(round(telemetry.disp,2))+" mm"
+        if len(telemetry.rows) < window:
+            return None
+
+        recent = telemetry.rows[-window:]
+        advance = recent[-1][8] - recent[0][8]
+        remaining = minDisp - telemetry.disp
+        if advance <= 0:
+            return "no progress in the last "+str(window)+" attempts at "+str(round(telemetry.disp,2))+" mm"
+        if maxIterations is not None:
+            iterations = sum(row[4] for row in recent)
+            if remaining/advance*iterations > maxIterations - telemetry.nIterations:
+                return str(minDisp)+" mm can not be reached with the remaining iterations"
+        if maxWallTime is not None:
+            wallTime = sum(row[6] for row in recent)
+            if remaining/advance*wallTime > maxWallTime - telemetry.getElapsedTime():
+                return str(minDisp)+" mm can not be reached in the remaining time"
+        return None
+    return rule
+
+
+# early-abort rule: maximum wall time of the pushover analysis (s)
+def wallTimeLimit(maxWallTime):
+    def rule(telemetry):
+        if telemetry.getElapsedTime() > maxWallTime:
+            return "wall time limit of "+str(maxWallTime)+" s"
+        return None
+    return rule
+
+
+class PushoverDriver():
+
+    # controlNode, dof -> node and degree of freedom of the displacement control
+    # targetDisp -> target displacement of the control node (m)
+    # increment -> initial increment (m), it is also the reference for the progress bar
+    # algorithm -> main solution algorithm, the fallback algorithms are only used when it fails
+    # minIncrement, maxIncrement -> limits of the increment (by default increment/64 and 4*increment)
+    # growFactor -> the increment is multiplied by this factor after a step that converges in "easyIterations" iterations or less
+    # cutFactor -> the increment is multiplied by this factor after a step that fails with all the algorithms
+    # maxFailures -> maximum number of failed steps before giving up
+    # patternTag -> tag of the load pattern of the pushover (used to read the base shear)
+    # telemetry -> StepTelemetry where the attempts are recorded (a new one by default)
+    # abortRules -> list of early-abort rules (see "unreachableDisplacement")
+    # fieldCapture -> "FieldCapture.FieldCapture" where the fields of the converged steps are stored (optional)
+    # cancelToken -> "AnalysisControl.CancelToken" checked before every attempt of a step (optional)
+    # stations -> displacements (mm) that the steps can not pass (None: the steps are not snapped)
+    def __init__(self, controlNode, dof=1, targetDisp=0.02, increment=0.0001, algorithm='NewtonLineSearch',
+                 fallback=fallbackAlgorithms, minIncrement=None, maxIncrement=None, growFactor=1.5, cutFactor=0.5,
+                 easyIterations=4, maxFailures=10, patternTag=2, telemetry=None, abortRules=None, fieldCapture=None, cancelToken=None,
+                 stations=None):
+
+        self.controlNode = controlNode
+        self.dof = dof
+        self.targetDisp = targetDisp
+        self.baseIncrement = increment
+        self.increment = increment
+        self.algorithm = algorithm
+        self.algorithms = [algorithm] + [a for a in fallback if a != algorithm]
+        self.currentAlgorithm = algorithm
+        self.minIncrement = minIncrement if minIncrement is not None else increment/64
+        self.maxIncrement = maxIncrement if maxIncrement is not None else increment*4
+        self.growFactor = growFactor
+        self.cutFactor = cutFactor
+        self.easyIterations = easyIterations
+        self.maxFailures = maxFailures
+        self.patternTag = patternTag
+        self.telemetry = telemetry if telemetry is not None else StepTelemetry()
+        self.abortRules = abortRules
+        self.fieldCapture = fieldCapture
+        self.cancelToken = cancelToken
+        self.stations = np.sort(np.asarray(stations, dtype=float))/1000 if stations is not None else np.zeros(0)
+
+        # statistics of the analysis
+        self.nSteps = 0
+        self.nFailures = 0
+        self.nIterations = 0
+        self.algorithmCounts = {a: 0 for a in self.algorithms}
+
+    # set the solution algorithm and the increment of the displacement control
+    def setStep(self, algorithm, increment):
+        ops.algorithm(algorithm)
+        ops.integrator("DisplacementControl", self.controlNode, self.dof, increment)
+
+    # largest increment from the displacement disp (m) that does not pass the next station
+    def getSnappedIncrement(self, disp, increment):
+        tolerance = 1e-9*self.targetDisp
+        nextStations = self.stations[self.stations > disp + tolerance]
+        if len(nextStations) > 0:
+            increment = min(increment, nextStations[0] - disp)
+        return min(increment, self.targetDisp - disp)
+
+    # try one step with the current algorithm and then with the other algorithms of the chain (every attempt is recorded in the telemetry)
+    # exclude -> algorithms that are not tried (for example, the algorithm of a fixed step that already failed)
+    # returns the algorithm that converged and its number of iterations (None if all of them failed)
+    def analyzeStep(self, increment, exclude=()):
+        order = [self.currentAlgorithm] + [a for a in self.algorithms if a != self.currentAlgorithm]
+        for algorithm in order:
+            if algorithm in exclude:
+                continue
+            if self.cancelToken is not None and self.cancelToken.isCancelled():
+                self.telemetry.abortReason = "cancelled"
+                break
+            startTime = time.perf_counter()
+            self.setStep(algorithm, increment)
+            result = ops.analyze(1)
+            wallTime = time.perf_counter() - startTime
+            iterations = ops.testIter()
+            self.nIterations = self.nIterations + iterations
+
+            converged = result == 0
+            disp = ops.nodeDisp(self.controlNode, self.dof)*1000
+            baseShear = -ops.getLoadFactor(self.patternTag)*0.001
+            self.telemetry.record(self.nSteps+1, algorithm, increment*1000, iterations, getLastNorm(), wallTime, converged, disp, baseShear)
+            if converged:
+                return algorithm, iterations
+            if self.telemetry.checkAbortRules(self.abortRules) is not None:
+                break
+        return None, 0
+
+    # run the pushover analysis
+    # progressBar -> tk progress bar (optional), it advances by one unit every "increment" of displacement
+    # returns an array with the displacement (mm) and base shear (kN) of the converged steps (the first row is the origin)
+    def run(self, progressBar=None, printProgression=False):
+
+        # the integrator and the algorithm are defined before the analysis object (otherwise OpenSees uses its default components)
+        self.setStep(self.algorithm, self.getSnappedIncrement(0.0, self.increment))
+        ops.analysis("Static")
+        dataPush = [[0.0, 0.0]]
+        disp = 0.0
+
+        while self.targetDisp - disp > 1e-9*self.targetDisp:
+            increment = self.getSnappedIncrement(disp, self.increment)
+            algorithm, iterations = self.analyzeStep(increment)
+
+            # failed step, cut the increment and try again
+            if algorithm is None:
+                if self.telemetry.abortReason is not None:
+                    break
+                self.nFailures = self.nFailures + 1
+                self.increment = self.increment*self.cutFactor
+                if printProgression:
+                    print("step failed with all the algorithms, increment =", self.increment*1000, "mm")
+                if self.nFailures > self.maxFailures or self.increment < self.minIncrement:
+                    break
+                continue
+
+            self.nSteps = self.nSteps + 1
+            self.algorithmCounts[algorithm] = self.algorithmCounts[algorithm] + 1
+
+            disp = ops.nodeDisp(self.controlNode, self.dof)
+            dataPush.append([disp*1000, self.telemetry.rows[-1][9]])
+
+            if self.fieldCapture is not None:
+                self.fieldCapture.capture(ops, disp*1000)
+
+            # easy step, grow the increment and go back to the main algorithm
+            # (the fallback algorithm that converged is kept for the next step otherwise)
+            if iterations <= self.easyIterations:
+                self.increment = min(self.increment*self.growFactor, self.maxIncrement)
+                self.currentAlgorithm = self.algorithm
+            else:
+                self.currentAlgorithm = algorithm
+
+            if progressBar is not None:
+                progressBar.step(increment/self.baseIncrement)
+
+            if printProgression:
+                print("step", self.nSteps, "  disp =", str(round(disp*1000,2)), "  increment =", str(round(increment*1000,4)), "  iterations =", iterations, "  "+algorithm)
+
+            if self.telemetry.checkAbortRules(self.abortRules) is not None:
+                break
+
+        if printProgression and self.telemetry.abortReason is not None:
+            print("Pushover analysis aborted:", self.telemetry.abortReason)
+
+        self.telemetry.stats = self.getStats()
+        return np.array(dataPush)
+
+    # advance the control node by a fixed increment after the main algorithm failed on it
+    # the increment is tried with the fallback algorithms and then split into sub-steps (down to minIncrement),
+    # the sub-steps are not stored in the pushover curve, only the end of the whole increment
+    # returns True if the whole increment converged
+    def recoverStep(self, increment):
+        remaining = increment
+        subIncrement = increment
+        exclude = (self.algorithm,)
+        while remaining > 1e-9*increment:
+            subIncrement = min(subIncrement, remaining)
+            algorithm, iterations = self.analyzeStep(subIncrement, exclude)
+            exclude = ()
+            if algorithm is None:
+                self.nFailures = self.nFailures + 1
+                subIncrement = subIncrement*self.cutFactor
+                if self.telemetry.abortReason is not None or subIncrement < self.minIncrement:
+                    return False
+                continue
+            self.algorithmCounts[algorithm] = self.algorithmCounts[algorithm] + 1
+            remaining = remaining - subIncrement
+        return True
+
+    # statistics of the analysis (number of converged and failed steps, total iterations, steps per algorithm, wall time, abort reason)
+    def getStats(self):
+        return {"steps": self.nSteps, "failures": self.nFailures, "iterations": self.nIterations, "algorithms": dict(self.algorithmCounts),
+                "wallTime": self.telemetry.getElapsedTime(), "abortReason": self.telemetry.abortReason}
@@ -0,0 +1,157 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+RunResults.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Handle to the field results (displacements, strains and stresses) of one FEM analysis.
+# Every analysis has its own results, so several analyses can record fields at the same time (two GUIs, parallel workers, scripts):
+    # in memory (default) -> the fields are captured with "FieldCapture.py", no files are written
+    # files -> the OpenSees recorders write to a unique workspace folder of the run ("RunTimeNodalResults/runs/run_<date>_<time>_<random>")
+# The handle is given to "ShearWallParametrizedAsFunction.run" (results=...) and then to the readers of "ColorMapFEM.py" (colorMapRun, colorMapVariousRun),
+# which read the fields with "getColumns" instead of fixed file names.
+# The fields are read through a "FieldStore.FieldStore" (getStore): the recorder files are converted once to memory-mapped binary arrays.
+# The ".npz" file written by "save" also contains the discretization and the undeformed coordinates of the nodes, so the results of an analysis
+# that ran in another process can be opened with "loadRunResults" and shown without the OpenSees model (see "AnalysisService.py").
+
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import FieldCapture as fieldCapture
+import FieldStore as fieldStore
+
+# folder where the workspaces of the runs are created
+defaultBaseDir = os.path.join("RunTimeNodalResults", "runs")
+
+# files of the OpenSees recorders inside the workspace of a run
+recorderFiles = {"controlDisp": "Disp.txt",
+                 "strainsGravity": "strain_gravity.txt",
+                 "disp": "disp_pushover.txt",
+                 "strains": "strain_pushover.txt",
+                 "stresses": "stress_pushover.txt"}
+
+
+class RunResults():
+
+    # inMemory -> True: the fields are captured in memory, False: the fields are written by the OpenSees recorders in the workspace
+    # baseDir -> folder where the workspace of the run is created
+    # stations -> displacements of the control node (mm) at which the fields are captured (only in memory, None: every step)
+    def __init__(self, inMemory=True, baseDir=defaultBaseDir, stations=None):
+        self.inMemory = inMemory
+        self.baseDir = baseDir
+        self.workspace = None
+        self.capture = fieldCapture.FieldCapture(stations=stations) if inMemory else None
+        self.store = None
+
+        # discretization of the model (set by "run")
+        self.meshH = None
+        self.meshV = None
+        self.meshBE = None
+        self.nNodes = 0
+        self.nShellElements = 0
+        self.controlNode = None
+        self.coords = None
+
+    # unique folder of the run (created the first time it is needed)
+    def getWorkspace(self):
+        if self.workspace is None:
+            os.makedirs(self.baseDir, exist_ok=True)
+            prefix = "run_"+time.strftime("%Y%m%d_%H%M%S")+"_"
+            self.workspace = tempfile.mkdtemp(prefix=prefix, dir=self.baseDir)
+        return self.workspace
+
+    # path of a file inside the workspace of the run
+    def getPath(self, name):
+        return os.path.join(self.getWorkspace(), name)
+
+    # path of the file of a recorder ("disp", "strains", "stresses", "controlDisp", "strainsGravity")
+    def getRecorderPath(self, field):
+        return self.getPath(recorderFiles[field])
+
+    def setModel(self, meshH, meshV, meshBE, nNodes, nShellElements, controlNode):
+        self.meshH = meshH
+        self.meshV = meshV
+        self.meshBE = meshBE
+        self.nNodes = nNodes
+        self.nShellElements = nShellElements
+        self.controlNode = controlNode
+        self.store = None
+
+    # undeformed coordinates of the nodes (nNodes, 2) from the grid of the mesh (the tags go along x first, then along y)
+    def setCoordinates(self, xCoords, yCoords):
+        x, y = np.meshgrid(xCoords, yCoords)
+        self.coords = np.column_stack((x.ravel(), y.ravel()))
+
+    # store of the fields of the run (the recorder files are only converted once, see "FieldStore.py")
+    def getStore(self):
+        if self.inMemory:
+            if self.store is None or self.store.nSteps != self.capture.nSteps:
+                self.store = fieldStore.fromCapture(self.capture)
+        elif self.store is None:
+            self.store = fieldStore.fromRecorderFiles({field: self.getRecorderPath(field) for field in ("disp", "strains", "stresses")})
+        return self.store
+
+    # a field with one column per step ("disp", "strains" or "stresses")
+    def getColumns(self, field):
+        return self.getStore().getColumns(field)
+
+    # write the fields to a compressed ".npz" file (by default "fields.npz" in the workspace of the run)
+    # the file has the same format in both modes and can be read with "FieldCapture.loadFieldCapture" or "loadRunResults"
+    def save(self, pathToFile=None):
+        if pathToFile is None:
+            pathToFile = self.getPath("fields.npz")
+        data = {}
+        if self.inMemory:
+            data["controlDisp"] = self.capture.getControlDisp()
+            for field in self.capture.fields:
+                data[field] = self.capture.getField(field)
+        else:
+            store = self.getStore()
+            for field in ("disp", "strains", "stresses"):
+                data[field] = store.getField(field)
+            data["controlDisp"] = data["disp"][:, self.controlNode-1, 0]*1000
+        if self.meshH is not None:
+            data["mesh"] = np.array([self.meshH, self.meshV, self.meshBE, self.nNodes, self.nShellElements, self.controlNode])
+        if self.coords is not None:
+            data["coords"] = self.coords
+        np.savez_compressed(pathToFile, **data)
+        return pathToFile
+
+    # remove the workspace of the run
+    def cleanup(self):
+        self.store = None
+        if self.workspace is not None and os.path.isdir(self.workspace):
+            shutil.rmtree(self.workspace)
+        self.workspace = None
+
+
+# open the results saved with "RunResults.save" (for example, by a worker process), the fields are kept in memory
+# the folder of the file is the workspace of the results ("cleanup" removes it)
+def loadRunResults(pathToFile):
+    results = RunResults(inMemory=True)
+    results.capture = fieldCapture.loadFieldCapture(pathToFile)
+    results.workspace = os.path.dirname(os.path.abspath(pathToFile))
+    with np.load(pathToFile) as data:
+        if "mesh" in data.files:
+            meshH, meshV, meshBE, nNodes, nShellElements, controlNode = [int(v) for v in data["mesh"]]
+            results.setModel(meshH, meshV, meshBE, nNodes, nShellElements, controlNode)
+        if "coords" in data.files:
+            results.coords = np.array(data["coords"])
+    return results
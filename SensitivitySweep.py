@@ -0,0 +1,108 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+SensitivitySweep.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# One-dimensional sensitivity sweeps of the surrogate model around a configuration of the sliders of the GUI.
+# For every one of the 11 input variables, the variable takes all the positions of its slider (101 positions) while the others are held fixed.
+# The 11 x 101 input vectors are predicted in a single batch call, and the result is a tensor of shape (11, 101, nOutputs):
+    # tensor[i, p, :] -> base shear at the stations when the variable i is at the position p
+# From the tensor:
+    # "getFan" returns the curves of one variable at a few positions (sensitivity fan)
+    # "getTornado" returns the change of one output when every variable goes to the min and max of its slider (tornado chart)
+# The positions are mapped to the input values as in the sliders of the GUI (min + position/100*(max-min)), and the last sweeps are cached.
+
+from collections import OrderedDict
+import numpy as np
+
+
+class SensitivitySweep():
+
+    # predict -> function that predicts an array of input vectors of shape (N, nInputs), for example "surrogate.predict"
+    # minValues, maxValues -> values of the inputs at the first and last positions of the sliders
+    # nPositions -> number of positions of the sliders (0 to nPositions-1)
+    # maxSize -> number of sweeps kept in the cache
+    def __init__(self, predict, minValues, maxValues, nPositions=101, maxSize=32):
+        self.predictFunction = predict
+        self.minValues = np.asarray(minValues, dtype=float)
+        self.maxValues = np.asarray(maxValues, dtype=float)
+        self.nInputs = len(self.minValues)
+        self.nPositions = nPositions
+        self.maxSize = maxSize
+        self.sweeps = OrderedDict()
+
+    # slider positions of all the sweeps around the given positions, array of shape (nInputs*nPositions, nInputs)
+    # (the rows i*nPositions to (i+1)*nPositions-1 are the sweep of the variable i)
+    def getSweepPositions(self, positions):
+        positions = np.asarray(positions, dtype=int)
+        sweepPositions = np.tile(positions, (self.nInputs*self.nPositions, 1))
+        sweepRange = np.arange(self.nPositions)
+        for i in range(self.nInputs):
+            sweepPositions[i*self.nPositions:(i+1)*self.nPositions, i] = sweepRange
+        return sweepPositions
+
+    # input vectors of the given slider positions, same mapping as "myVariable.getRealValue"
+    def positionsToInputs(self, positions):
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        return self.minValues + (positions/(self.nPositions-1)) * (self.maxValues-self.minValues)
+
+    # sweeps of all the variables around the given slider positions (tuple of nInputs integers)
+    # returns the tensor of shape (nInputs, nPositions, nOutputs)
+    def sweep(self, positions):
+        key = tuple(int(p) for p in positions)
+        if key in self.sweeps:
+            self.sweeps.move_to_end(key)
+            return self.sweeps[key]
+
+        sweepPositions = self.getSweepPositions(key)
+        predOut = np.asarray(self.predictFunction(self.positionsToInputs(sweepPositions)))
+        tensor = predOut.reshape(self.nInputs, self.nPositions, -1)
+        tensor.setflags(write=False)
+
+        self.sweeps[key] = tensor
+        while len(self.sweeps) > self.maxSize:
+            self.sweeps.popitem(last=False)
+        return tensor
+
+    # slider positions and predictions of all the sweeps (to fill the prediction cache of the GUI, see "PredictionCache.py")
+    def getSweepEntries(self, positions):
+        tensor = self.sweep(positions)
+        sweepPositions = self.getSweepPositions(positions)
+        return [tuple(p) for p in sweepPositions.tolist()], tensor.reshape(len(sweepPositions), -1)
+
+
+# curves of the variable "index" at every "step" positions of its slider (sensitivity fan)
+# returns the positions and the predictions at those positions, array of shape (nCurves, nOutputs)
+def getFan(tensor, index, step=10):
+    positions = np.arange(0, tensor.shape[1], step)
+    if positions[-1] != tensor.shape[1]-1:
+        positions = np.append(positions, tensor.shape[1]-1)
+    return positions, tensor[index, positions, :]
+
+
+# change of the output "output" when every variable goes to the first and the last position of its slider (tornado chart)
+# positions -> current positions of the sliders (the base value is the prediction at these positions)
+# returns the base value, the changes at the first and last positions (arrays of size nInputs),
+# and the order of the variables from the largest to the smallest range
+def getTornado(tensor, positions, output=-1):
+    base = tensor[0, positions[0], output]
+    low = tensor[:, 0, output] - base
+    high = tensor[:, -1, output] - base
+    order = np.argsort(np.abs(high-low))[::-1]
+    return base, low, high, order
@@ -18,12 +18,18 @@ Department of Civil Engineering and Energy Technology
 # A file that contains a function called "run" that will take the geometry and parameters of a RC shear wall as input values and
 # will create the corresponding FEM model and run the static pushover analysis   
 
+import functools
+import time
 import openseespy.opensees as ops
 import numpy as np
 import MyPlottingFEM as plotFEM
 import matplotlib.pyplot as plt
 import ColorMapFEM as colorMap
+import PushoverDriver as pushoverDriver
+import CurveDiscretization as curveDisc
+import RunResults as runResults
 
+# these functions return the last tag of the model, they are not used to build the model (the tags are computed in "getMeshTopology")
 def getCurrentNode():
     if len(ops.getNodeTags()) == 0:
         return 0     
@@ -90,6 +96,64 @@ def defineWallSecion_ratios_LongAndTransv(ops,secID,matConc,mreinfV,mreinfH,leng
                 reinfMaterialV,layerThickV2,         # vertical Reinf layer bot 2
                 matConc,r)                      # conc cover bottom
     
+# topology of the mesh (tags and connectivity), it only depends on the discretization so it is computed once
+# and shared by all the samples that use the same mesh
+# the nodes are numbered row by row from the bottom left corner: tag = 1 + row*hLines + column
+# the shell elements are numbered column by column from the bottom left corner (this numbering facilitates the creation of the border elements)
+# the beam elements at the top of the wall are numbered after the shell elements
+class MeshTopology():
+
+    def __init__(self, hSpaces, vSpaces, discBE, sectionID_BE, sectionID_web):
+        hLines = hSpaces+1
+        vLines = vSpaces+1
+        self.hLines = hLines
+        self.vLines = vLines
+        self.nNodes = hLines*vLines
+        self.nShellElements = hSpaces*vSpaces
+
+        # nodes of the base (fixed)
+        self.baseNodes = tuple(range(1, hLines+1))
+
+        # index of the top middle node
+        self.controlNode = vSpaces*hLines + 1 + hSpaces//2
+
+        # shell elements: (tag, n1, n2, n3, n4, section)
+        shells = []
+        for k in range(hSpaces):
+            section = sectionID_BE if (k < discBE or k >= hSpaces-discBE) else sectionID_web
+            for i in range(vSpaces):
+                n1 = 1 + hLines*i + k
+                shells.append((len(shells)+1, n1, n1+1, n1+hLines+1, n1+hLines, section))
+        self.shells = tuple(shells)
+
+        # beam elements at the top: (tag, nodei, nodej)
+        firstTop = hLines*vSpaces + 1
+        self.beams = tuple((self.nShellElements+1+j, firstTop+j, firstTop+j+1) for j in range(hSpaces))
+
+@functools.lru_cache(maxsize=32)
+def getMeshTopology(hSpaces, vSpaces, discBE, sectionID_BE=1, sectionID_web=2):
+    return MeshTopology(hSpaces, vSpaces, discBE, sectionID_BE, sectionID_web)
+
+# coordinates of the vertical and horizontal grid lines of the mesh
+def getGridCoordinates(wallHeight, EB_length, wallLength, hSpaces, vSpaces, discBE):
+    yCoords = np.arange(vSpaces+1) * (wallHeight/vSpaces)
+    hSpacing = np.empty(hSpaces)
+    hSpacing[0:discBE] = EB_length/discBE
+    hSpacing[discBE:hSpaces-discBE] = wallLength/(hSpaces-2*discBE)
+    hSpacing[hSpaces-discBE:hSpaces] = EB_length/discBE
+    xCoords = np.concatenate((np.zeros(1), np.cumsum(hSpacing)))
+    return xCoords.tolist(), yCoords.tolist()
+
+# create the nodes and the supports in one pass (tags computed arithmetically)
+def createNodes(topology, xCoords, yCoords):
+    tag = 1
+    for y in yCoords:
+        for x in xCoords:
+            ops.node(tag, x, y, 0)
+            tag = tag+1
+    for node in topology.baseNodes:
+        ops.fix(node, 1, 1, 1, 1, 1, 1)
+
 # #####################################################################################################
 # GENERATION OF THE PARAMETRIC MODEL
 # THE ROUTINE IS SEMI-AUTOMATED FROM THIS POINT FORWARD, SHOULD NOT BE MODIFIED UNLESS NECCESARY
@@ -98,6 +162,22 @@ def defineWallSecion_ratios_LongAndTransv(ops,secID,matConc,mreinfV,mreinfH,leng
     
 # the first 11 parameters are the input values specified in the paper
 # the remainder parameters are used to discretize the model, specify the number of iterations, and to indicate wheter or not to print some graphics    
+# the solution algorithm of the pushover analysis and the number of unconverged steps before giving up can also be changed (useful to re-run the samples that did not converge)
+# with adaptive=False (default) the pushover uses the fixed increment of the original analysis, exactly like the analyses of the existing database
+# with recoverSteps=True (opt-in) a fixed step that does not converge is tried again with the fallback algorithms and smaller sub-steps
+# of "PushoverDriver.recoverStep" (the points of the curve stay on the grid of the fixed increment)
+# with adaptive=True it uses the adaptive step size of "PushoverDriver.py" (increment is the initial step), the steps never pass the stations
+# (displacements in mm where the curves are discretized, see "CurveDiscretization.py"), so the discretized curves do not depend on the step size
+# every attempt of a step is recorded in a "PushoverDriver.StepTelemetry" (iterations, test norm, wall time, converged flag):
+    # telemetry=True returns it as a third value: [x,y], ops, telemetry
+    # logFile -> csv file where the telemetry is written while the analysis runs
+    # abortRules -> early-abort rules that stop the analysis of a sample that will be dropped anyway (see "PushoverDriver.unreachableDisplacement")
+# fieldCapture -> a "FieldCapture.FieldCapture" where the displacements, strains and stresses of the pushover are stored in memory
+# (alternative to recordResults, no text files are written)
+# results -> a "RunResults.RunResults" handle where the fields of this run are stored (in memory or in a unique workspace folder),
+# with recordResults=True (or with the plots of the results) and no handle, the fields are captured in memory for the plots of this run
+# (no files are written, give a handle with inMemory=False to keep the recorder files in a unique workspace)
+# cancelToken -> an "AnalysisControl.CancelToken", the analysis stops at the next step after it is cancelled and "AnalysisControl.AnalysisCancelled" is raised
 def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength, 
             meshH=8,
             meshBE=2,
@@ -110,7 +190,18 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
             plotPushOverResults=False,
             progressBar=None,
             printProgression=True,
-            recordResults=False):
+            recordResults=False,
+            algorithm='NewtonLineSearch',
+            maxUnconvergedSteps=10,
+            adaptive=False,
+            recoverSteps=False,
+            stations=curveDisc.stations,
+            telemetry=False,
+            logFile=None,
+            abortRules=None,
+            fieldCapture=None,
+            results=None,
+            cancelToken=None):
 
 
     if plotPushOverResults:
@@ -118,6 +209,16 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
         
     if plotDeformedGravity:
         recordResults=True
+    
+    # every run records its fields in its own results (in memory or in a unique workspace)
+    # without a handle of the caller the fields are only used inside this run, so they are kept in memory (no workspace is left behind)
+    if recordResults and results is None:
+        results = runResults.RunResults()
+        if fieldCapture is not None:
+            results.capture = fieldCapture
+    if results is not None and results.inMemory and fieldCapture is None:
+        fieldCapture = results.capture
+    recorders = results is not None and not results.inMemory
         
     # Initialize OpenSees model
     ops.wipe()
@@ -145,9 +246,6 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
     # number of elements in the horizontal direction
     hSpaces=meshH #must be even number so that there is a node in the middle
     
-    nNodes = (hSpaces+1) * (vSpaces+1)
-    
-    
     # concrete cover used
     cover = 0.0125;
     
@@ -159,53 +257,28 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
     sectionID_web = 2
     
     # AUTOMATICALLY COMPUTED VARIABLES
-    # number of shells horizontally to discretize the wall segment
-    discWall = hSpaces-discBE*2
-    
-    # shell element horizontal dimensions
-    vSpacing = wallHeight/vSpaces;
-    hSpacingEB = EB_length/discBE;
-    hSpacingWall = wallLength/discWall;
+    # tags and connectivity of the mesh (cached for all the samples with the same discretization)
+    topology = getMeshTopology(hSpaces, vSpaces, discBE, sectionID_BE, sectionID_web)
+    nNodes = topology.nNodes
+    nShellElements = topology.nShellElements
     
-    nShellElements = hSpaces*vSpaces;
-    hLines = hSpaces+1;
-    vLines = vSpaces+1
-    
-    # array with all the required vertical coordinates
-    vSpacing = np.ones(vSpaces+1)*vSpacing;
-    vSpacing = np.concatenate((np.zeros(1),vSpacing),axis=0) 
+    # index of the top middle node
+    ControlNode = topology.controlNode
     
-    # array with all the required vertical coordinates
-    hSpacing = np.zeros(hLines)
-    hSpacing[0:discBE] = np.ones(discBE)*hSpacingEB;
-    hSpacing[discBE:hSpaces-discBE] = np.ones(hSpaces-2*discBE)*hSpacingWall
-    hSpacing[hSpaces-discBE:hSpaces] = np.ones(discBE)*hSpacingEB;
-    hSpacing = np.concatenate((np.zeros(1),hSpacing),axis=0) 
+    if results is not None:
+        results.setModel(hSpaces, vSpaces, discBE, nNodes, nShellElements, ControlNode)
     
-    # index of the top middle node
-    ControlNode= int((vLines-1) * hLines + 1 + hSpaces/2)
-    
-    elevation = 0
-    for i in range(vLines):
-        posX=0
-        elevation = elevation+vSpacing[i]
-        for j in range(hLines):
-            nodeIndex = getCurrentNode()+1
-            posX = posX+hSpacing[j]
-            #print(str(nodeIndex)+":",posX,elevation)
-            ops.node(nodeIndex,posX,elevation,0)
-            # fix ground nodes
-            if i==0:    
-                # Fix supports at base of columns
-                #   tag, DX, DY, RZ
-                ops.fix(nodeIndex, 1, 1, 1, 1, 1, 1)
+    # create the nodes and fix the ground nodes
+    xCoords, yCoords = getGridCoordinates(wallHeight, EB_length, wallLength, hSpaces, vSpaces, discBE)
+    createNodes(topology, xCoords, yCoords)
+    if results is not None:
+        results.setCoordinates(xCoords, yCoords)
     
     ops.timeSeries("Linear", 1)					# create TimeSeries for gravity analysis
     ops.pattern('Plain',1,1)
     
     # GRAVITY LOAD AT THE TOP MIDDLE NODE !
-    midNode = (hSpaces+1)*(vSpaces+1) - hSpaces/2 
-    ops.load(midNode,  0, -Pforce,0.0,0.0,0.0,0.0)	# apply vertical load
+    ops.load(ControlNode,  0, -Pforce,0.0,0.0,0.0,0.0)	# apply vertical load
 
 
     # NON LINEAR CONCRETE MATERIAL MODEL            
@@ -269,26 +342,11 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
                                           pl,             #long reinf ratio  
                                           pt)             #transv reinf ratio 
     
-    shellSections = np.zeros(hSpaces)
-    shellSections[0:discBE] = np.ones(discBE)*sectionID_BE
-    shellSections[discBE:hSpaces-discBE] = np.ones(hSpaces-2*discBE)*sectionID_web
-    shellSections[hSpaces-discBE:hSpaces] = np.ones(discBE)*sectionID_BE
-    
-    
-    
-    
     # create the elements
     # the numbering starts from the bottom left corner and goes up 
     # this numbering facilitates creationg of the border elements
-    for k in range(hSpaces):
-        section = shellSections[k]
-        for i in range(vSpaces):
-            eIndex = getCurrentElement()+1
-            n1 = 1 + hLines*(i)+k
-            n2 = 1 + hLines*(i)+k+1
-            n3 = 1 + hLines*(i+1)+k+1
-            n4 = 1 + hLines*(i+1)+k
-            ops.element(ShellType,eIndex,n1,n2,n3,n4,int(section))
+    for eIndex,n1,n2,n3,n4,section in topology.shells:
+        ops.element(ShellType,eIndex,n1,n2,n3,n4,section)
     
     # BEAM IN THE TOP TO STABILIZE DEFORMATION IN TOP NODES
     a = t*10
@@ -300,22 +358,21 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
     G=E/(2*(1+0.2))
     A = a*b
     ops.geomTransf('Linear', 1, 0,1,0)
-    nodei = midNode = (hSpaces+1)*(vSpaces)+1
-    for j in range (hSpaces):            
-        ops.element('elasticBeamColumn', getCurrentElement()+1, nodei+j, nodei+j+1, A, E, G,Jxx,Iy,Iz, 1)
+    for eIndex,nodei,nodej in topology.beams:
+        ops.element('elasticBeamColumn', eIndex, nodei, nodej, A, E, G,Jxx,Iy,Iz, 1)
     
 
     # STORE DISPLACEMENTS FOR CONTROL NODE
-    if recordResults:
+    if recorders:
         ops.recorder('Node', 
-                     '-file', 'RunTimeNodalResults/Disp.txt', 
+                     '-file', results.getRecorderPath("controlDisp"), 
                      '-closeOnWrite', 
                      '-node', ControlNode, 
                      '-dof',2, 
                      'disp')
         
         ops.recorder('Element',
-                     '-file','RunTimeNodalResults/strain_gravity.txt',
+                     '-file',results.getRecorderPath("strainsGravity"),
                      '-closeOnWrite',
                      '-eleRange', 1,nShellElements,
                      'strains')
@@ -333,6 +390,9 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
     ops.analysis('Static')
     ops.analyze(steps)
     
+    if cancelToken is not None:
+        cancelToken.check()
+    
     if plotDeformedGravity:
         
         # PLOT MODEL MESH
@@ -355,22 +415,22 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
     # PUSHOVER ANALYSIS
     if(performPushOver):
         
-        if recordResults:
+        if recorders:
             ops.recorder('Node', 
-                         '-file', 'RunTimeNodalResults/disp_pushover.txt', 
+                         '-file', results.getRecorderPath("disp"), 
                          '-closeOnWrite', 
                          '-nodeRange', 1,nNodes, 
                          '-dof',1,2,
                          'disp')
             
             ops.recorder('Element',
-                     '-file','RunTimeNodalResults/strain_pushover.txt',
+                     '-file',results.getRecorderPath("strains"),
                      '-closeOnWrite',
                      '-eleRange', 1,nShellElements,
                      'strains')
             
             ops.recorder('Element',
-                     '-file','RunTimeNodalResults/stress_pushover.txt',
+                     '-file',results.getRecorderPath("stresses"),
                      '-closeOnWrite',
                      '-eleRange', 1,nShellElements,
                      'stresses')
@@ -383,6 +443,11 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
         DispIncr = increment
         NstepsPush=int(MaxDisp/DispIncr)
         
+        # initial state of the fields (after the gravity loads)
+        if fieldCapture is not None:
+            fieldCapture.setup(nNodes, nShellElements, NstepsPush+1)
+            fieldCapture.capture(ops, ops.nodeDisp(ControlNode,1)*1000)
+        
         if printProgression:
             print("Starting pushover analysis...")
             print("   total steps: ",NstepsPush)
@@ -392,38 +457,89 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
         ops.system("BandGeneral")
         ops.numberer("RCM")
         referenceDOF = 1
-        ops.integrator("DisplacementControl", ControlNode, referenceDOF, DispIncr)
-        ops.algorithm('NewtonLineSearch')
-        ops.test('NormDispIncr',1e-05, 100, 0)
-        ops.analysis("Static")
-        	     
-        maxUnconvergedSteps = 10
-        unconvergeSteps = 0
-        finishedSteps = 0 
-        dataPush = np.zeros((NstepsPush+1,2))
+        stepTelemetry = pushoverDriver.StepTelemetry(logFile)
+        
+        # Perform pushover analysis with adaptive increments
+        if adaptive:
+            ops.test('NormDispIncr',1e-05, 100, 0)
+            driver = pushoverDriver.PushoverDriver(ControlNode, referenceDOF, MaxDisp, DispIncr, algorithm, maxFailures=maxUnconvergedSteps,
+                                                   telemetry=stepTelemetry, abortRules=abortRules, fieldCapture=fieldCapture,
+                                                   cancelToken=cancelToken, stations=stations)
+            dataPush = driver.run(progressBar, printProgression)
+            finishedSteps = len(dataPush)
+            if printProgression:
+                print("Pushover analysis finished:", driver.getStats())
         
-        # Perform pushover analysis
-        for j in range(NstepsPush):
-            if unconvergeSteps>maxUnconvergedSteps:
-                break;
+        else:
+            ops.integrator("DisplacementControl", ControlNode, referenceDOF, DispIncr)
+            ops.algorithm(algorithm)
+            ops.test('NormDispIncr',1e-05, 100, 0)
+            ops.analysis("Static")
+            
+            # the fallback algorithms and the sub-steps for the steps that do not converge (only with recoverSteps=True)
+            recovery = None
+            if recoverSteps:
+                recovery = pushoverDriver.PushoverDriver(ControlNode, referenceDOF, MaxDisp, DispIncr, algorithm, telemetry=stepTelemetry,
+                                                         abortRules=abortRules, cancelToken=cancelToken)
+            	     
+            unconvergeSteps = 0
+            finishedSteps = 0 
+            dataPush = np.zeros((NstepsPush+1,2))
+            
+            # Perform pushover analysis with a fixed increment
+            for j in range(NstepsPush):
+                if unconvergeSteps>maxUnconvergedSteps:
+                    break;
+                if cancelToken is not None and cancelToken.isCancelled():
+                    break
                 
-            result = ops.analyze(1)
+                stepStart = time.perf_counter()
+                result = ops.analyze(1)
+                stepTime = time.perf_counter() - stepStart
             
-            if result<0:
-                unconvergeSteps=unconvergeSteps+1
+                if result<0 and recovery is None:
+                    unconvergeSteps=unconvergeSteps+1
+                
+                # the step is tried again with the fallback algorithms and sub-steps (the attempts are recorded by the driver)
+                elif result<0:
+                    stepTelemetry.record(j+1, algorithm, DispIncr*1000, ops.testIter(), pushoverDriver.getLastNorm(), stepTime, False,
+                                         ops.nodeDisp(ControlNode,1)*1000, -ops.getLoadFactor(2)*0.001)
+                    recovery.nSteps = j
+                    if not recovery.recoverStep(DispIncr):
+                        unconvergeSteps=unconvergeSteps+1
+                    recovery.setStep(algorithm, DispIncr)
+                    if stepTelemetry.abortReason is not None:
+                        break
+                
+                finishedSteps = j   
+                disp = ops.nodeDisp(ControlNode,1)*1000		# Convert to mm
+                baseShear = -ops.getLoadFactor(2)*0.001
+                dataPush[j+1,0] = disp
+                dataPush[j+1,1] = baseShear
+                
+                if fieldCapture is not None:
+                    fieldCapture.capture(ops, disp)
                 
-            finishedSteps = j   
-            disp = ops.nodeDisp(ControlNode,1)*1000		# Convert to mm
-            baseShear = -ops.getLoadFactor(2)*0.001
-            dataPush[j+1,0] = disp
-            dataPush[j+1,1] = baseShear
+                if result == 0 or recovery is None:
+                    stepTelemetry.record(j+1, algorithm, DispIncr*1000, ops.testIter(), pushoverDriver.getLastNorm(), stepTime, result==0, disp, baseShear)
+                if stepTelemetry.checkAbortRules(abortRules) is not None:
+                    if printProgression:
+                        print("Pushover analysis aborted:", stepTelemetry.abortReason)
+                    break
             
-            if progressBar is not None:
-                progressBar.step()
+                if progressBar is not None:
+                    progressBar.step()
             
-            if printProgression:
-                print("step",j+1,"/", NstepsPush,"   ","disp","=",str(round(disp,2)))
-    
+                if printProgression:
+                    print("step",j+1,"/", NstepsPush,"   ","disp","=",str(round(disp,2)))
+            
+            stepTelemetry.stats = {"steps": stepTelemetry.nConverged, "failures": unconvergeSteps, "iterations": stepTelemetry.nIterations,
+                                   "failedSubSteps": recovery.nFailures if recovery is not None else 0,
+                                   "wallTime": stepTelemetry.getElapsedTime(), "abortReason": stepTelemetry.abortReason}
+        
+        stepTelemetry.close()
+        if cancelToken is not None:
+            cancelToken.check()
             
         if plotPushOverResults:
             plt.rcParams.update({'font.size': 14})
@@ -457,9 +573,11 @@ def run(t,lw,plbe,pl,pt,webpl,webpt,paxial,wallHeight,compStrength,yieldStrength
             # colorMap.colorMap(ops, vSpaces, hSpaces, "RunTimeNodalResults/strain_pushover.txt", "RunTimeNodalResults/disp_pushover.txt", 1,scale=20,title="Strain (Y) ")
 
             
-            colorMap.colorMapVarious(ops, vSpaces, hSpaces, "RunTimeNodalResults/strain_pushover.txt", "RunTimeNodalResults/disp_pushover.txt", 1,scale=20, title="Strain (Y) progression")
+            colorMap.colorMapVariousRun(ops, results, 1,scale=20, title="Strain (Y) progression")
             
             
+        if telemetry:
+            return [dataPush[0:finishedSteps,0], -dataPush[0:finishedSteps,1]], ops, stepTelemetry
         return [dataPush[0:finishedSteps,0], -dataPush[0:finishedSteps,1]], ops    
 
     return [0,0],[0,0],ops
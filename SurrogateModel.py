@@ -0,0 +1,104 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+SurrogateModel.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# The trained DNN surrogate model as a single object: the keras model, the normalizer and the stations of the outputs (see "CurveRepresentation.py").
+# The model is loaded once and the predictions are computed for arrays of input vectors of shape (N, 11), so a design sweep of millions of walls is a few calls.
+# The keras function "predict" creates a dataset and a progress bar on every call (several milliseconds), which is too slow for a single input vector.
+# Here the forward pass is compiled once as a tf.function with a variable batch size, so it is not traced again for different N, and it is used for any N:
+    # N = 1 (the GUI): a single call of the compiled function, without the overhead of "predict"
+    # large N: the inputs are split into chunks of "batchSize" rows to limit the memory
+
+
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.models import load_model
+import Normalization as normalization
+import CurveRepresentation as curveRep
+
+# default path of the trained model (see "MainNN.py")
+defaultPath = 'NeuralNetworkWeights/dnn_surrogate_model.h5'
+
+
+class SurrogateModel():
+
+    # pathToModel -> file of the trained keras model
+    # representation -> stations of the outputs, by default the ones stored next to the model (the original 6 outputs if there is no stations file)
+    # batchSize -> maximum number of rows that are evaluated at once
+    def __init__(self, pathToModel=defaultPath, representation=None, batchSize=65536):
+
+        self.path = pathToModel
+        self.model = load_model(pathToModel, compile=False)
+        self.batchSize = batchSize
+
+        if representation is None:
+            representation = curveRep.getRepresentationForFile(pathToModel)
+        self.representation = representation
+
+        self.normalizer = normalization.getNormalizerForSurrogateModel(representation.nOutputs)
+        self.nInputs = self.normalizer.nIn
+        self.nOutputs = representation.nOutputs
+
+        # min and max values of the inputs as arrays (the normalization is a single broadcast operation)
+        self.minValues = np.asarray(self.normalizer.minValuesIn, dtype=float)
+        self.rangeValues = np.asarray(self.normalizer.maxValuesIn, dtype=float) - self.minValues
+
+        # forward pass compiled once for any number of rows
+        model = self.model
+        self.forward = tf.function(lambda x: model(x, training=False),
+                                   input_signature=[tf.TensorSpec(shape=[None, self.nInputs], dtype=tf.float32)])
+
+    # normalize the input vectors (same result as "normalizer.normalizeInputs", the normalized values are float32 like the weights of the model)
+    def normalizeInputs(self, inputs):
+        inputs = np.asarray(inputs, dtype=float).reshape(-1, self.nInputs)
+        return ((inputs - self.minValues) / self.rangeValues).astype(np.float32)
+
+    # predict the base shear at the stations for an array of input vectors
+    # inputs -> array of shape (N, 11) with the real (not normalized) values, in the order of "InputVariableBounds.py"
+    # returns an array of shape (N, nOutputs)
+    def predict(self, inputs):
+        return self.predictNormalized(self.normalizeInputs(inputs))
+
+    # predict from input vectors that are already normalized (like the "predict" function of the keras model)
+    def predictNormalized(self, normInputs):
+
+        normInputs = np.asarray(normInputs, dtype=np.float32).reshape(-1, self.nInputs)
+        nRows = len(normInputs)
+
+        if nRows <= self.batchSize:
+            return self.forward(normInputs).numpy()
+
+        predOut = np.empty((nRows, self.nOutputs), dtype=np.float32)
+        for start in range(0, nRows, self.batchSize):
+            end = min(start+self.batchSize, nRows)
+            predOut[start:end] = self.forward(normInputs[start:end]).numpy()
+        return predOut
+
+    # predict the base shear at the stations for a single wall given as 11 values (returns an array of size nOutputs)
+    def predictOne(self, *values):
+        return self.predict(np.asarray(values))[0]
+
+    # points of the predicted pushover curves: x values (nStations) and y values (N, nStations)
+    def predictCurvePoints(self, inputs):
+        return self.representation.getCurvePoints(self.predict(inputs))
+
+    # dense predicted pushover curves with a monotone interpolation between the stations
+    def predictDenseCurves(self, inputs, xDense=None, nPoints=200):
+        return self.representation.reconstruct(self.predict(inputs), xDense, nPoints)
@@ -23,9 +23,9 @@ Department of Civil Engineering and Energy Technology
 
 
 import numpy as np
-import matplotlib.pyplot as plt
 import random as rnd
-import ShearWallParametrizedAsFunction as shearWallAsFunc
+import CurveRepresentation as curveRep
+import ParallelDataBase as parallelDB
 
 
 # Predict the corresponding output for a set of input values
@@ -38,8 +38,15 @@ def predict(nnet, normalizer, v1,v2,v3,v4,v5,v6,v7,v8,v9,v10,v11):
     
 
 # Create a random vector, perform the static pushover analysis and compare the result to the prediction of the NN, plot the results
+# (to verify a trained model with many samples and an error report, see "VerifySurrogate.py")
 # The required arguments are the normalizer and the trained NN.
-def testNN(normalizer, nnet):
+# representation -> stations of the outputs of the NN (see "CurveRepresentation.py"), the original 6 outputs by default
+def testNN(normalizer, nnet, representation=None):
+    import matplotlib.pyplot as plt
+    import ShearWallParametrizedAsFunction as shearWallAsFunc
+    
+    if representation is None:
+        representation = curveRep.getDefaultRepresentation()
     
     performPushOver = True
     plotValidation = False
@@ -47,35 +54,8 @@ def testNN(normalizer, nnet):
     plotPushOverResults = False
     
     #-------- GENERATE A RANDOM VECTOR ----------------------------------------------------
-    # compressive strength in MPa
-    fc = rnd.uniform(25e6,40e6) 
-    
-    # yield strength in MPa
-    fy = rnd.uniform(350e6,450e6) 
-    
-    # heihg of the wall
-    height = rnd.uniform(3,3.5) 
-    
-    # thickness
-    t = rnd.uniform(0.125,0.40)
-    
-    # total length of wall
-    lw = rnd.uniform(t*6,4)
-    
-    # boudary element length as percentage of the total lenght
-    lbe = rnd.uniform(0.15,0.25)
-    
-    # ratio of reinforcement for the web, longitudinal (l) and transversal (t)
-    pl_be = rnd.uniform(0.01,0.035)
-    pt_be = rnd.uniform(0.0075,0.015)
-    
-    # ratio of reinforcement for the web, longitudinal (l) and transversal (t)
-    pl_web = rnd.uniform(0.0025, 0.5*pl_be)
-    pt_web = rnd.uniform(0.0025, 0.5*pt_be)
-    
-    #axial force as percentage of the maximum allowable load for that wall Po = Ag*0.85*f'c
-    paxial = rnd.uniform(0.010,0.10)     
-       
+    # same bounds and rules as the training database (see "InputVariableBounds.py" and "ParallelDataBase.getRandomInputVector")
+    t,lw,lbe,pl_be,pt_be,pl_web,pt_web,paxial,height,fc,fy = parallelDB.getRandomInputVector(rnd)
     #----------------------------------------------------------------------------------
     
     targetDisp = 0.02
@@ -84,7 +64,7 @@ def testNN(normalizer, nnet):
     
     
     #---------  CREATE THE MODEL AND RUN THE ANALYSIS WITH THE RANDOM VECTOR ---------
-    [x,y] = shearWallAsFunc.run(t,
+    [x,y],ops = shearWallAsFunc.run(t,
                                 lw,
                                 lbe,
                                 pl_be,
@@ -124,28 +104,24 @@ def testNN(normalizer, nnet):
     #predOut = normalizer.denormalizeOutputs(predOutNorm) #prediction input normalized
 
     # create the x-y points of the prediction
-    x2 = [0,0.5,1.0,2.5,5,10,19.5]
-    y2 = []
-    y2.append(0)
-    for val in predOut[0]:
-        y2.append(val)
+    x2, y2 = representation.getCurvePoints(predOut)
+    y2 = y2[0]
         
-    # plot the predicted curve    
-    plt.plot(x2,y2, 
+    # plot the predicted curve (the points at the stations and the monotone interpolation between them)
+    xDense, yDense = representation.reconstruct(predOut)
+    plt.plot(xDense,yDense[0], 
              linewidth=1, 
              linestyle="-", 
+             color='black')
+    plt.plot(x2,y2, 
+             linestyle="none", 
              color='black',
              marker = 'x',
              markersize = 5)
     
-    # plot grid (vertical lines)
-    plt.axvline(x = 0, **style)
-    plt.axvline(x = 0.5, **style)
-    plt.axvline(x = 1.0, **style)
-    plt.axvline(x = 2.5, **style)
-    plt.axvline(x = 5.0, **style)
-    plt.axvline(x = 10.0, **style)
-    plt.axvline(x = 20.0, **style)
+    # plot grid (vertical lines at the stations)
+    for station in x2:
+        plt.axvline(x = station, **style)
     
     # plot grid (horizontal lines)
     stepGridH = 200
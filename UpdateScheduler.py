@@ -0,0 +1,106 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+UpdateScheduler.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Scheduler for the redraws of the GUI (see "AppGUI.py").
+# A slider that is dragged (or a window that is resized) produces dozens of events per second. Instead of redrawing everything on every event,
+# the events only mark the affected layers as dirty, and the layers are redrawn once per frame with "root.after":
+    # a burst of events between two frames produces a single redraw
+    # every layer is independent (for example: the slider labels, the cross section, the elevation, the pushover curve)
+    # every layer has a key function (for example, the input values and the size of the canvas), and the layer is not redrawn if the key did not change
+# The frames are at least "interval" milliseconds apart, so the redraws never fill the event queue of tk.
+
+import time
+
+
+class UpdateScheduler():
+
+    # root -> tk root (used for "after")
+    # interval -> minimum time between two frames, in milliseconds (16 ms -> up to 60 frames per second)
+    def __init__(self, root, interval=16):
+        self.root = root
+        self.interval = interval
+        self.layers = []
+        self.draw = {}
+        self.getKey = {}
+        self.lastKey = {}
+        self.dirty = set()
+        self.pending = None
+        self.lastFrame = 0
+
+        # statistics: number of requests, frames and layer redraws
+        self.nRequests = 0
+        self.nFrames = 0
+        self.nRedraws = 0
+
+    # add a layer, the layers are redrawn in the order they are added
+    # draw -> function that redraws the layer
+    # getKey -> function that returns the values the layer depends on (None: always redraw the layer when it is requested)
+    def addLayer(self, name, draw, getKey=None):
+        self.layers.append(name)
+        self.draw[name] = draw
+        self.getKey[name] = getKey
+        self.lastKey[name] = None
+
+    # mark the layers as dirty and schedule a frame (if there is not one already scheduled)
+    # without names, all the layers are marked
+    def request(self, *names):
+        self.nRequests = self.nRequests + 1
+        if len(names) == 0:
+            names = self.layers
+        self.dirty.update(names)
+
+        if self.pending is None:
+            elapsed = (time.perf_counter() - self.lastFrame)*1000
+            delay = int(max(0, self.interval - elapsed))
+            self.pending = self.root.after(delay, self.flush)
+
+    # forget the key of the layers so that they are redrawn on the next request even if their values did not change
+    def invalidate(self, *names):
+        if len(names) == 0:
+            names = self.layers
+        for name in names:
+            self.lastKey[name] = None
+
+    # redraw the dirty layers whose key changed
+    def flush(self):
+        self.pending = None
+        self.lastFrame = time.perf_counter()
+        self.nFrames = self.nFrames + 1
+
+        dirty = self.dirty
+        self.dirty = set()
+        for name in self.layers:
+            if name not in dirty:
+                continue
+            if self.getKey[name] is not None:
+                key = self.getKey[name]()
+                if key is not None and key == self.lastKey[name]:
+                    continue
+                self.lastKey[name] = key
+            self.draw[name]()
+            self.nRedraws = self.nRedraws + 1
+
+    # cancel the scheduled frame (for example, when the window is closed)
+    def cancel(self):
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+        self.dirty = set()
@@ -0,0 +1,249 @@
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+Project:
+An Open-Source Framework for Modeling RC Shear Walls using Deep Neural Networks
+
+File:
+VerifySurrogate.py
+
+Date:
+17.10.2026
+
+Developmed by:
+-Ph.D. Candidate German Solorzano
+Supervised by:
+-Dr. Vagelis Plevris
+
+Sponsored by:
+Oslo Metropolitan University, Oslo, Norway.
+Department of Civil Engineering and Energy Technology
+"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
+
+# Header:
+# Verification of a trained surrogate model against the FEM analysis (run it before deploying a retrained "dnn_surrogate_model.h5").
+# K input vectors are drawn from the bounds of "InputVariableBounds.py" with the seeded generators of "CampaignManifest.py"
+# (use a seed that is different from the seed of the training campaign), the FEM analyses run in parallel worker processes (see "ParallelDataBase.runJobs"),
+# and the predictions of the surrogate model are compared with the FEM curves at the stations of the model (see "CurveRepresentation.py").
+# The results are written to the output folder:
+    # verification_report.json -> per-station error statistics: bias, rmse, percentiles of the absolute and relative errors and the worst samples
+    # verification_samples.csv -> one row per sample: status, maximum displacement, input vector, FEM and predicted base shear at every station
+# The relative error of a sample is the error divided by the peak FEM base shear of that sample (the base shear is close to 0 at the first stations).
+# The FEM curves are cut with the representation saved with the model (stations, minDisp and interpolate, see "CurveRepresentation.getRepresentationForFile"),
+# so only the samples that converge to more than minDisp are compared, like in the training database.
+# "checkReport" returns the stations whose 95th percentile of the relative error is larger than the tolerance (an empty list -> the model can be deployed).
+
+import os
+import sys
+import csv
+import json
+import time
+import numpy as np
+import CampaignManifest as campaign
+import ParallelDataBase as parallelDB
+import CurveRepresentation as curveRep
+import NumpySurrogate as numpySurrogate
+
+# percentiles of the errors in the report
+reportPercentiles = (50, 90, 95, 99)
+
+
+# the FEM pushover curves of the input vectors, computed in parallel
+# returns a list with (x, y, wallTime, error) for every input vector
+def runFEM(inputVectors, nWorkers=None, options=None):
+
+    if options is None:
+        options = {}
+
+    curves = [None]*len(inputVectors)
+    jobs = [(i, list(params), options) for i, params in enumerate(inputVectors)]
+    startTime = time.time()
+
+    def storeResult(job, x, y, wallTime, error):
+        index = job[0]
+        curves[index] = (x, y, wallTime, error)
+        finished = sum(c is not None for c in curves)
+        maxX = max(x) if len(x) > 0 else 0
+        print("VERIFY", index, "maxDisp =", round(maxX,2), "mm   ", finished, "/", len(curves), "   elapsed", round(time.time()-startTime,1), "s")
+
+    parallelDB.runJobs(jobs, storeResult, nWorkers)
+    return curves
+
+
+# base shear of the FEM curves at the stations of the representation
+# returns an array of shape (nSamples, nOutputs) (nan for the curves that did not reach minDisp), the valid curves and the maximum displacements
+def getFEMTargets(curves, representation):
+    x = []
+    y = []
+    offsets = [0]
+    maxDisp = np.zeros(len(curves))
+    for i, curve in enumerate(curves):
+        if curve is not None:
+            x.extend(curve[0])
+            y.extend(curve[1])
+            maxDisp[i] = max(curve[0]) if len(curve[0]) > 0 else 0
+        offsets.append(len(x))
+    targets, valid = representation.getTargets(x, y, offsets)
+    return targets, valid, maxDisp
+
+
+def getPercentiles(values):
+    if len(values) == 0:
+        return {"p"+str(p): None for p in reportPercentiles}
+    return {"p"+str(p): float(np.percentile(values, p)) for p in reportPercentiles}
+
+
+# error statistics of the predictions at every station
+# targets, predictions -> arrays of shape (nSamples, nOutputs), valid -> samples that are compared
+# nWorst -> number of worst samples that are listed for every station and for the whole curve
+def getErrorReport(inputVectors, targets, predictions, valid, maxDisp, stations, nWorst=5):
+
+    indices = np.flatnonzero(valid)
+    errors = predictions[indices] - targets[indices]
+    peaks = np.max(np.abs(targets[indices]), axis=1)
+    relErrors = errors / np.where(peaks > 0, peaks, 1.0)[:,np.newaxis]
+
+    report = {"nSamples": len(inputVectors),
+              "nValid": int(len(indices)),
+              "percentiles": list(reportPercentiles),
+              "stations": [],
+              "overall": {},
+              "worstSamples": []}
+
+    # the stations after the first one (the base shear at 0 mm is always 0)
+    for j, station in enumerate(stations[1:]):
+        e = errors[:,j]
+        r = np.abs(relErrors[:,j])
+        order = np.argsort(-np.abs(e))[0:nWorst]
+        report["stations"].append({"station": float(station),
+                                   "count": int(len(e)),
+                                   "extrapolated": int(np.sum(maxDisp[indices] < station)),
+                                   "bias": float(np.mean(e)) if len(e) > 0 else None,
+                                   "rmse": float(np.sqrt(np.mean(e**2))) if len(e) > 0 else None,
+                                   "absError": getPercentiles(np.abs(e)),
+                                   "maxAbsError": float(np.max(np.abs(e))) if len(e) > 0 else None,
+                                   "relError": getPercentiles(r),
+                                   "maxRelError": float(np.max(r)) if len(r) > 0 else None,
+                                   "worst": [{"index": int(indices[k]),
+                                              "error": float(e[k]),
+                                              "relError": float(relErrors[k,j]),
+                                              "fem": float(targets[indices[k],j]),
+                                              "predicted": float(predictions[indices[k],j])} for k in order]})
+
+    report["overall"] = {"rmse": float(np.sqrt(np.mean(errors**2))) if errors.size > 0 else None,
+                         "absError": getPercentiles(np.abs(errors).ravel()),
+                         "relError": getPercentiles(np.abs(relErrors).ravel())}
+
+    # the samples with the largest relative error at any station
+    if len(indices) > 0:
+        worstStation = np.argmax(np.abs(relErrors), axis=1)
+        worstRelError = np.abs(relErrors[np.arange(len(indices)), worstStation])
+        for k in np.argsort(-worstRelError)[0:nWorst]:
+            report["worstSamples"].append({"index": int(indices[k]),
+                                           "maxRelError": float(worstRelError[k]),
+                                           "station": float(stations[1+worstStation[k]]),
+                                           "maxDisp": float(maxDisp[indices[k]]),
+                                           "params": [float(v) for v in inputVectors[indices[k]]]})
+    return report
+
+
+# one row per sample: index, status, maximum displacement, input vector, FEM and predicted base shear at every station
+def writeSampleTable(pathToFile, inputVectors, curves, targets, predictions, valid, maxDisp, stations):
+    header = ["index", "status", "maxDisp", "wallTime"] + ["x"+str(i+1) for i in range(len(inputVectors[0]))]
+    header = header + ["fem_"+str(s) for s in stations[1:]] + ["pred_"+str(s) for s in stations[1:]]
+    with open(pathToFile, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i, params in enumerate(inputVectors):
+            x, y, wallTime, error = curves[i]
+            status = "failed" if error is not None else ("valid" if valid[i] else "diverged")
+            writer.writerow([i, status, round(maxDisp[i],3), round(wallTime,1)] + list(params) + list(targets[i]) + list(predictions[i]))
+
+
+# stations where the 95th percentile of the relative error is larger than the tolerance (empty list -> the model passes)
+def checkReport(report, maxRelError=0.15):
+    failures = []
+    for station in report["stations"]:
+        p95 = station["relError"]["p95"]
+        if p95 is None or p95 > maxRelError:
+            failures.append(station["station"])
+    return failures
+
+
+# verify a trained surrogate model with nSamples FEM analyses
+# pathToModel -> trained model (".h5", the numpy weights are used if they exist, see "NumpySurrogate.loadSurrogate")
+# seed, samplingMethod -> input vectors of the verification (see "CampaignManifest.getCampaignInputVectors")
+# options -> analysis options of the FEM analyses (see "ParallelDataBase.runSample")
+# returns the report (it is also written to the output folder)
+def verifySurrogate(pathToModel, nSamples, seed, outputDir, nWorkers=None, options=None, samplingMethod="random", nWorst=5):
+
+    startTime = time.time()
+    os.makedirs(outputDir, exist_ok=True)
+
+    # the FEM targets are computed with the same rules as the training targets of the model
+    surrogate = numpySurrogate.loadSurrogate(pathToModel)
+    savedRepresentation = curveRep.getRepresentationForFile(pathToModel)
+    stations = surrogate.representation.stations
+    representation = curveRep.CurveRepresentation(stations, savedRepresentation.minDisp, savedRepresentation.interpolate)
+
+    inputVectors = campaign.getCampaignInputVectors(seed, nSamples, samplingMethod)
+    predictions = np.asarray(surrogate.predict(np.array(inputVectors)), dtype=float)
+
+    curves = runFEM(inputVectors, nWorkers, options)
+    targets, valid, maxDisp = getFEMTargets(curves, representation)
+
+    report = getErrorReport(inputVectors, targets, predictions, valid, maxDisp, stations, nWorst)
+    report["model"] = pathToModel
+    report["seed"] = seed
+    report["samplingMethod"] = samplingMethod
+    report["minDisp"] = representation.minDisp
+    report["interpolate"] = representation.interpolate
+    report["nFailed"] = int(sum(c[3] is not None for c in curves))
+    report["nDiverged"] = report["nSamples"] - report["nValid"] - report["nFailed"]
+    report["wallTime"] = time.time() - startTime
+
+    with open(os.path.join(outputDir, "verification_report.json"), 'w') as f:
+        json.dump(report, f, indent=2)
+    writeSampleTable(os.path.join(outputDir, "verification_samples.csv"), inputVectors, curves, targets, predictions, valid, maxDisp, stations)
+    return report
+
+
+# the guard is required because the worker processes import this file again when they are created
+if __name__ == "__main__":
+
+    # trained model to verify
+    pathToModel = 'NeuralNetworkWeights/dnn_surrogate_model.h5'
+
+    # number of verification samples and seed (different from the seed of the training campaign)
+    samples = 50
+    seed = 7
+
+    # number of worker processes (None -> one per core)
+    nWorkers = None
+
+    # 95th percentile of the relative error that is accepted at every station
+    tolerance = 0.15
+
+    targetDisp = 0.02
+    steps = 200
+    options = {"meshHorizontal": 8,
+               "meshBE": 2,
+               "meshVertical": 10,
+               "targetDisp": targetDisp,
+               "increment": targetDisp/steps,
+               # fixed increment, the same grid of points as the training database
+               "adaptive": False,
+               "abortMinDisp": 10,
+               "maxIterations": 20000,
+               "maxWallTime": 600}
+
+    report = verifySurrogate(pathToModel, samples, seed, 'AnalysisResults/verification', nWorkers, options)
+
+    print("valid samples:", report["nValid"], "/", report["nSamples"], "  diverged:", report["nDiverged"], "  failed:", report["nFailed"])
+    for station in report["stations"]:
+        print("station", station["station"], "mm   bias =", round(station["bias"],1) if station["bias"] is not None else None, "kN",
+              "  p95 relative error =", round(station["relError"]["p95"],3) if station["relError"]["p95"] is not None else None)
+
+    failures = checkReport(report, tolerance)
+    if len(failures) > 0:
+        print("The surrogate model does not pass the verification at the stations (mm):", failures)
+        sys.exit(1)
+    print("The surrogate model passes the verification")
@@ -28,21 +28,15 @@ import os
 import numpy as np
 import matplotlib.pyplot as plt
 import random as r
-from tensorflow.keras.models import load_model
+import CurveStore as curveStore
+import CurveDiscretization as curveDisc
 
 fileName = "database_complete.csv"            
 ResultsDir = 'AnalysisResults'
 pathToFile = ResultsDir+"/"+fileName
 
-f = open(pathToFile)
-csvreader = csv.reader(f)
-
-rows = []
-for row in csvreader:
-    float_lst = list(np.array(row, dtype = 'float'))
-    rows.append(float_lst)
-    
-f.close();       
+# open the database as a binary curve store (random access to the curves without parsing the whole file)
+curves = curveStore.openCurveDataBase(pathToFile)
 
 # Create a folder to put the output
 fileName = "test.csv"            
@@ -55,23 +49,23 @@ if not os.path.exists(ResultsDir):
 f = open(pathToFile, 'w', newline='')
 writer = csv.writer(f)
 
-stations = [0,0.5,1.0,2.5,5,10,19.5]
+stations = curveDisc.stations
 
 plt.figure(figsize=(4,3), dpi=100)
 plt.xlabel('Displacement (mm)')
 plt.ylabel('Base Shear (kN)')
 
-plotIndex = range(int(len(rows)/3))
+plotIndex = range(len(curves))
 #plotIndex = range(10)
 
 loopCount = 0
 terminate = 5
 
 
-index1 = r.randint(0, 2500)
-index2 = r.randint(0, 2500)
-index3 = r.randint(0, 2500)
-index4 = r.randint(0, 2500)
+index1 = r.randint(0, len(curves)-1)
+index2 = r.randint(0, len(curves)-1)
+index3 = r.randint(0, len(curves)-1)
+index4 = r.randint(0, len(curves)-1)
 
 
 indexes = [index1,index2,index3,index4]
@@ -112,48 +106,22 @@ plt.tight_layout()
 for i in indexes: 
     
     print("index:", i)
-    maxV = []
-    index = i*3
-    params = rows[index]
-    x = rows[index+1]
-    y = rows[index+2]
-    maxX = max(x)
-    maxY = max(y)
-    maxV.append(maxY)
-    #print(maxX,maxY)
-    
-    # only if it converged to more than 5 mm of displacement, otherwise ignore data point
-    if maxX < 10: 
-        continue
+    params, x, y = curves.getCurve(i)
     
     # discretize the curve into 6 sections, at: 0, 1, 2.5, 5, 10, 19.5
-    discPointsX = []
-    discPointsY = []
-    for station in stations:
-        count = 0
-        skip = False
-        for xval in x:
-            if xval >= station:
-                skip=True
-                if xval > 18 and xval <=20:
-                    discPointsX.append(20)
-                else:
-                    discPointsX.append(x[count])    
-                discPointsY.append(y[count])
-            count=count+1   
-            if skip:
-                break;
-            
-    if len(discPointsY) < len(stations):               
-            discPointsX.append(20)
-            discPointsY.append(discPointsY[-1]*1.055)
+    # only if it converged to more than 10 mm of displacement, otherwise ignore data point
+    discretized = curveDisc.discretizeCurve(x, y, stations)
+    if discretized is None: 
+        continue
+    discPointsX, discPointsY = discretized
     
-    if discPointsY[6] < discPointsY[5]:
-        discPointsY[6] = discPointsY[5]*1.055
+    # the last point is plotted at 20 mm
+    if discPointsX[-1] > 18 and discPointsX[-1] <= 20:
+        discPointsX[-1] = 20
 
     
     
-    print("input",rows[i*3])      
+    print("input",list(params))      
     print(discPointsX)
     print(discPointsY)
     